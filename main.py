@@ -3,7 +3,8 @@
 import argparse
 import os
 import sys
-from typing import List, Optional
+import threading
+from typing import Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -11,6 +12,9 @@ import router
 from shared.logging_config import get_logger, setup_logging
 from shared.utils import parse_created_after_date
 
+# Pages between progress log lines while the total page count is still unknown
+PROGRESS_LOG_INTERVAL = 25
+
 
 def build_parser(targets) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -29,9 +33,8 @@ def build_parser(targets) -> argparse.ArgumentParser:
     parser.add_argument(
         "--workers",
         type=int,
-        default=3,
         metavar="N",
-        help="Number of parallel workers (default: 3, max recommended: 4)",
+        help="Number of parallel workers (default: target-specific; max recommended: 4 for games/books)",
     )
     parser.add_argument(
         "--last-page",
@@ -104,6 +107,52 @@ def _resolve_target_name(
     return available[0]
 
 
+def _build_progress_logger(logger) -> Callable[[Dict], None]:
+    """Return a progress callback that logs completed/total at 10% steps.
+
+    Pages are streamed, so the total is only known once pagination finishes;
+    until then progress is logged every PROGRESS_LOG_INTERVAL pages against
+    the pages discovered so far.
+    """
+    lock = threading.Lock()
+    state = {"next_decile": 1, "next_count": PROGRESS_LOG_INTERVAL}
+
+    def log_progress(progress: Dict) -> None:
+        completed = progress["completed"]
+        total = progress.get("total")
+        counts = (
+            progress.get("successful_updates", 0),
+            progress.get("failed_updates", 0),
+            progress.get("skipped_updates", 0),
+        )
+        if not total:
+            with lock:
+                if completed < state["next_count"]:
+                    return
+                state["next_count"] = completed + PROGRESS_LOG_INTERVAL
+            logger.info(
+                "Progress: %s pages done (%s found so far) | updated=%s failed=%s skipped=%s",
+                completed,
+                progress.get("discovered", completed),
+                *counts,
+            )
+            return
+        decile = completed * 10 // total
+        with lock:
+            if decile < state["next_decile"]:
+                return
+            state["next_decile"] = decile + 1
+        logger.info(
+            "Progress: %s/%s pages done (%s%%) | updated=%s failed=%s skipped=%s",
+            completed,
+            total,
+            decile * 10,
+            *counts,
+        )
+
+    return log_progress
+
+
 def main(default_target: Optional[str] = None):
     load_dotenv()
     setup_logging(os.getenv("LOG_FILE", "notion_sync.log"))
@@ -141,10 +190,12 @@ def main(default_target: Optional[str] = None):
         run_options = {
             "force_icons": args.force_icons,
             "force_update": args.force_update,
-            "workers": args.workers,
             "last_page": args.last_page,
             "page_id": args.page_id,
+            "progress_callback": _build_progress_logger(logger),
         }
+        if args.workers is not None:
+            run_options["workers"] = args.workers
         if args.database:
             run_options["database"] = args.database
         if normalized_created_after:
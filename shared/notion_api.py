@@ -1,20 +1,29 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 import logging
 
 from notion_client import Client
 
+from shared.rate_limit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
 class NotionAPI:
     """Notion API client for database operations."""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, rate_limiter: Optional[TokenBucket] = None):
         self.client = Client(auth=token)
+        self.rate_limiter = rate_limiter
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter (if any) before issuing a request."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
 
     def get_database(self, database_id: str) -> Optional[Dict]:
         """Get database information."""
         try:
+            self._throttle()
             return self.client.databases.retrieve(database_id)
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("Error retrieving database %s: %s", database_id, exc)
@@ -25,30 +34,43 @@ class NotionAPI:
     ) -> List[Dict]:
         """Query database for pages."""
         try:
-            pages: List[Dict] = []
-            has_more = True
-            start_cursor = None
-
-            while has_more:
-                params: Dict[str, Union[str, Dict]] = {}
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
-                if filter_params:
-                    params["filter"] = filter_params
-
-                response = self.client.databases.query(database_id, **params)
-                pages.extend(response["results"])
-                has_more = response["has_more"]
-                start_cursor = response.get("next_cursor")
-
-            return pages
+            return list(self._query_pages(database_id, filter_params))
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("Error querying database %s: %s", database_id, exc)
             return []
 
+    def iter_database_pages(
+        self, database_id: str, filter_params: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """Yield database pages as each result batch arrives, without materializing them all."""
+        try:
+            yield from self._query_pages(database_id, filter_params)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Error querying database %s: %s", database_id, exc)
+
+    def _query_pages(
+        self, database_id: str, filter_params: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        has_more = True
+        start_cursor = None
+
+        while has_more:
+            params: Dict[str, Union[str, Dict]] = {}
+            if start_cursor:
+                params["start_cursor"] = start_cursor
+            if filter_params:
+                params["filter"] = filter_params
+
+            self._throttle()
+            response = self.client.databases.query(database_id, **params)
+            yield from response["results"]
+            has_more = response["has_more"]
+            start_cursor = response.get("next_cursor")
+
     def get_page(self, page_id: str) -> Optional[Dict]:
         """Get a single page by ID."""
         try:
+            self._throttle()
             return self.client.pages.retrieve(page_id)
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("Error retrieving page %s: %s", page_id, exc)
@@ -80,6 +102,7 @@ class NotionAPI:
                 elif isinstance(icon, dict):
                     page_data["icon"] = icon
 
+            self._throttle()
             page = self.client.pages.create(**page_data)
             return page["id"]
         except Exception as exc:  # pylint: disable=broad-except
@@ -109,6 +132,7 @@ class NotionAPI:
                 elif isinstance(icon, dict):
                     update_data["icon"] = icon
 
+            self._throttle()
             self.client.pages.update(page_id, **update_data)
             return True
         except Exception as exc:  # pylint: disable=broad-except
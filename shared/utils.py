@@ -167,10 +167,10 @@ def find_page_by_property(
         }
         existing_pages = notion_api.query_database(database_id, filter_params)
         if existing_pages:
-            logger.debug(f"Found existing page by {property_type} property: {existing_pages[0]['id']}")
+            logger.debug("Found existing page by %s property: %s", property_type, existing_pages[0]['id'])
             return existing_pages[0]['id']
     except Exception as e:
-        logger.debug(f"Error searching for page by {property_type}: {e}")
+        logger.debug("Error searching for page by %s: %s", property_type, e)
     
     return None
 
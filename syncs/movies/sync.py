@@ -8,16 +8,22 @@ import os
 import argparse
 import logging
 import sys
+import queue
+import re
+import threading
 import time
 import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import requests
 from notion_client import Client
+from requests.adapters import HTTPAdapter
 
 from shared.logging_config import get_logger, setup_logging
 from shared.notion_api import NotionAPI
+from shared.rate_limit import TokenBucket
 from shared.utils import build_multi_select_options, build_created_after_filter, get_database_id, get_notion_token, normalize_id
 from shared.change_detection import has_property_changes
 
@@ -46,19 +52,149 @@ except ImportError:
     logger.error("Copy property_config.example.py to property_config.py and update with your property IDs.")
     sys.exit(1)
 
+# API request budgets (Notion averages 3 requests/second; TMDb allows ~40)
+NOTION_REQUESTS_PER_SECOND = 3
+TMDB_REQUESTS_PER_SECOND = 20
+
+# Default worker count: the sync is I/O bound (Notion/TMDb round trips), so scale
+# like ThreadPoolExecutor's own default rather than with CPU count; the shared
+# token buckets keep the request rate within budget regardless of worker count
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 5)
+
+# Sub-resources fetched alongside movie/TV details in a single TMDb request
+DETAILS_APPEND_TO_RESPONSE = 'credits,images,videos,watch/providers'
+
+# Optional per-page features, resolved once per NotionTMDbSync instance
+FEATURE_ADULT_CONTENT = 1 << 0
+FEATURE_COLLECTION = 1 << 1
+FEATURE_WATCH_PROVIDERS = 1 << 2
+
+# Maximum number of parsed pages kept by NotionTMDbSync.extract_current_data
+CURRENT_DATA_CACHE_SIZE = 4096
+
+# Lowercased substrings identifying a user-defined "last edited" property
+LAST_EDITED_FIELD_NAMES = ('last edit', 'last_edited_time', 'last edited time', 'last_edited', 'last edited', 'edited_time', 'edited time')
+_LAST_EDITED_FIELD_PATTERN = re.compile('|'.join(re.escape(name) for name in LAST_EDITED_FIELD_NAMES))
+
+
+@lru_cache(maxsize=256)
+def _normalize_provider_name(provider_name: str) -> str:
+    """Normalize provider names to condense similar services using smart pattern matching."""
+    if not provider_name:
+        return provider_name
+    
+    # Start with the original name
+    normalized = provider_name.strip()
+    
+    # Pattern 1: Handle "Plus" vs "+" variations
+    # Convert "Plus" to "+" for consistency
+    normalized = normalized.replace(' Plus', '+')
+    normalized = normalized.replace('Plus ', '+')
+    
+    # Pattern 2: Remove channel suffixes (order matters - most specific first)
+    channel_patterns = [
+        ' Premium Amazon Channel',
+        ' Premium Plus',
+        ' Free with Ads',
+        ' Standard with Ads',
+        ' with Ads',
+        ' Amazon Channel',
+        ' Roku Premium Channel', 
+        ' Apple TV Channel',
+        ' Premium Channel',
+        ' Channel',
+        ' Premium',
+        ' Standard',
+        ' Free',
+    ]
+    
+    for pattern in channel_patterns:
+        if normalized.endswith(pattern):
+            normalized = normalized[:-len(pattern)]
+            break
+    
+    # Pattern 3: Handle specific service name variations
+    service_mappings = {
+        'Apple TV': 'Apple TV+',
+        'Disney Plus': 'Disney+',
+        'MGM Plus': 'MGM+',
+        'AMC Plus': 'AMC+',
+        'FXNow': 'FX',
+        'Spectrum On Demand': 'Spectrum',
+        'Shout! Factory Amazon Channel': 'Shout! Factory',
+        'Shout! Factory TV': 'Shout! Factory',
+        'MUBI Amazon Channel': 'MUBI',
+        'Cinemax Amazon Channel': 'Cinemax',
+        'Cinemax Apple TV Channel': 'Cinemax',
+        'Showtime Amazon Channel': 'Showtime',
+        'Showtime Roku Premium Channel': 'Showtime',
+        'Starz Amazon Channel': 'Starz',
+        'Starz Roku Premium Channel': 'Starz',
+        # ALLBLK consolidation
+        'ALLBLK Apple TV Channel': 'ALLBLK',
+        'ALLBLK Amazon Channel': 'ALLBLK',
+        # Paramount consolidation
+        'Paramount+ Essential': 'Paramount+',
+        # Case-insensitive Adult Swim
+        'Adultswim': 'Adult Swim',
+    }
+    
+    # Apply specific service mappings
+    normalized = service_mappings.get(normalized, normalized)
+    
+    # Pattern 4: Additional case-insensitive mappings for common variations
+    # Check lowercase version for case-insensitive matches
+    lower_normalized = normalized.lower()
+    case_insensitive_mappings = {
+        'adultswim': 'Adult Swim',
+        'hbo max': 'HBO Max',  # Ensures consistent spacing
+    }
+    if lower_normalized in case_insensitive_mappings:
+        normalized = case_insensitive_mappings[lower_normalized]
+    
+    # Pattern 5: Handle "with Showtime" and similar combinations
+    if ' with Showtime' in normalized:
+        normalized = normalized.replace(' with Showtime', '')
+    
+    # Final cleanup: trim any remaining whitespace
+    normalized = normalized.strip()
+    
+    return normalized
+
+
 class TMDbAPI:
     """TMDb API client for fetching movie and TV show data."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, rate_limiter: Optional[TokenBucket] = None):
         self.api_key = api_key
         self.base_url = "https://api.themoviedb.org/3"
         self.session = requests.Session()
         self.session.params = {'api_key': api_key}
+        self.rate_limiter = rate_limiter
+        # (content type, ID) pairs TMDb answered with 404, so they are not requested again
+        self.not_found_ids: Set[Tuple[str, str]] = set()
+        self._pool_size: Optional[int] = None
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Issue a GET request, waiting on the rate limiter first if configured."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        return self.session.get(url, **kwargs)
+    
+    def set_pool_size(self, size: int) -> None:
+        """Size the HTTP connection pool so concurrent workers don't wait on connections."""
+        if size == self._pool_size:
+            return
+        previous = self.session.adapters.get('https://')
+        self.session.mount('https://', HTTPAdapter(pool_connections=size, pool_maxsize=size))
+        if previous is not None:
+            previous.close()
+        self._pool_size = size
     
     def search_movie(self, title: str) -> Optional[Dict]:
         """Search for a movie by title."""
         try:
-            response = self.session.get(f"{self.base_url}/search/movie", params={
+            response = self._get(f"{self.base_url}/search/movie", params={
                 'query': title,
                 'language': 'en-US',
                 'page': 1,
@@ -71,13 +207,13 @@ class TMDbAPI:
                 return data['results'][0]  # Return first (most relevant) result
             return None
         except Exception as e:
-            logger.error(f"Error searching for movie '{title}': {e}")
+            logger.error("Error searching for movie '%s': %s", title, e)
             return None
     
     def search_tv(self, title: str) -> Optional[Dict]:
         """Search for a TV show by title."""
         try:
-            response = self.session.get(f"{self.base_url}/search/tv", params={
+            response = self._get(f"{self.base_url}/search/tv", params={
                 'query': title,
                 'language': 'en-US',
                 'page': 1,
@@ -90,140 +226,82 @@ class TMDbAPI:
                 return data['results'][0]  # Return first (most relevant) result
             return None
         except Exception as e:
-            logger.error(f"Error searching for TV show '{title}': {e}")
+            logger.error("Error searching for TV show '%s': %s", title, e)
             return None
     
     def get_movie_details(self, movie_id: int) -> Optional[Dict]:
         """Get detailed information for a movie."""
+        if ('movie', str(movie_id)) in self.not_found_ids:
+            return None
         try:
-            response = self.session.get(f"{self.base_url}/movie/{movie_id}", params={
+            response = self._get(f"{self.base_url}/movie/{movie_id}", params={
                 'language': 'en-US',
-                'append_to_response': 'credits,images,videos'
+                'append_to_response': DETAILS_APPEND_TO_RESPONSE
             })
+            if response.status_code == 404:
+                self.not_found_ids.add(('movie', str(movie_id)))
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Error getting movie details for ID {movie_id}: {e}")
+            logger.error("Error getting movie details for ID %s: %s", movie_id, e)
             return None
     
     def get_tv_details(self, tv_id: int) -> Optional[Dict]:
         """Get detailed information for a TV show."""
+        if ('tv', str(tv_id)) in self.not_found_ids:
+            return None
         try:
-            response = self.session.get(f"{self.base_url}/tv/{tv_id}", params={
+            response = self._get(f"{self.base_url}/tv/{tv_id}", params={
                 'language': 'en-US',
-                'append_to_response': 'credits,images,videos'
+                'append_to_response': DETAILS_APPEND_TO_RESPONSE
             })
+            if response.status_code == 404:
+                self.not_found_ids.add(('tv', str(tv_id)))
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Error getting TV details for ID {tv_id}: {e}")
+            logger.error("Error getting TV details for ID %s: %s", tv_id, e)
             return None
     
     def get_watch_providers(self, content_type: str, content_id: int) -> Optional[Dict]:
         """Get watch providers for a movie or TV show."""
         try:
             endpoint = f"{self.base_url}/{content_type}/{content_id}/watch/providers"
-            response = self.session.get(endpoint)
+            response = self._get(endpoint)
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Error getting watch providers for {content_type} {content_id}: {e}")
+            logger.error("Error getting watch providers for %s %s: %s", content_type, content_id, e)
             return None
     
     def normalize_provider_name(self, provider_name: str) -> str:
         """Normalize provider names to condense similar services using smart pattern matching."""
-        if not provider_name:
-            return provider_name
-        
-        # Start with the original name
-        normalized = provider_name.strip()
-        
-        # Pattern 1: Handle "Plus" vs "+" variations
-        # Convert "Plus" to "+" for consistency
-        normalized = normalized.replace(' Plus', '+')
-        normalized = normalized.replace('Plus ', '+')
-        
-        # Pattern 2: Remove channel suffixes (order matters - most specific first)
-        channel_patterns = [
-            ' Premium Amazon Channel',
-            ' Premium Plus',
-            ' Free with Ads',
-            ' Standard with Ads',
-            ' with Ads',
-            ' Amazon Channel',
-            ' Roku Premium Channel', 
-            ' Apple TV Channel',
-            ' Premium Channel',
-            ' Channel',
-            ' Premium',
-            ' Standard',
-            ' Free',
-        ]
-        
-        for pattern in channel_patterns:
-            if normalized.endswith(pattern):
-                normalized = normalized[:-len(pattern)]
-                break
-        
-        # Pattern 3: Handle specific service name variations
-        service_mappings = {
-            'Apple TV': 'Apple TV+',
-            'Disney Plus': 'Disney+',
-            'MGM Plus': 'MGM+',
-            'AMC Plus': 'AMC+',
-            'FXNow': 'FX',
-            'Spectrum On Demand': 'Spectrum',
-            'Shout! Factory Amazon Channel': 'Shout! Factory',
-            'Shout! Factory TV': 'Shout! Factory',
-            'MUBI Amazon Channel': 'MUBI',
-            'Cinemax Amazon Channel': 'Cinemax',
-            'Cinemax Apple TV Channel': 'Cinemax',
-            'Showtime Amazon Channel': 'Showtime',
-            'Showtime Roku Premium Channel': 'Showtime',
-            'Starz Amazon Channel': 'Starz',
-            'Starz Roku Premium Channel': 'Starz',
-            # ALLBLK consolidation
-            'ALLBLK Apple TV Channel': 'ALLBLK',
-            'ALLBLK Amazon Channel': 'ALLBLK',
-            # Paramount consolidation
-            'Paramount+ Essential': 'Paramount+',
-            # Case-insensitive Adult Swim
-            'Adultswim': 'Adult Swim',
-        }
-        
-        # Apply specific service mappings
-        normalized = service_mappings.get(normalized, normalized)
-        
-        # Pattern 4: Additional case-insensitive mappings for common variations
-        # Check lowercase version for case-insensitive matches
-        lower_normalized = normalized.lower()
-        case_insensitive_mappings = {
-            'adultswim': 'Adult Swim',
-            'hbo max': 'HBO Max',  # Ensures consistent spacing
-        }
-        if lower_normalized in case_insensitive_mappings:
-            normalized = case_insensitive_mappings[lower_normalized]
-        
-        # Pattern 5: Handle "with Showtime" and similar combinations
-        if ' with Showtime' in normalized:
-            normalized = normalized.replace(' with Showtime', '')
-        
-        # Final cleanup: trim any remaining whitespace
-        normalized = normalized.strip()
-        
-        return normalized
+        return _normalize_provider_name(provider_name)
     
 
 class NotionTMDbSync:
     """Main class for synchronizing Notion database with TMDb data."""
     
+    # Page icon per content type
+    _ICON_BY_TYPE = {'movie': '🎬', 'tv': '📺'}
+    
+    # TMDb statuses that mark an entry as complete (no further updates expected)
+    _COMPLETED_STATUS_BY_TYPE = {
+        'tv': frozenset(('ended', 'canceled')),
+        'movie': frozenset(('released',)),
+    }
+    
     def __init__(self, notion_token: str, tmdb_api_key: str, database_id: str):
-        self.notion = NotionAPI(notion_token)
-        self.tmdb = TMDbAPI(tmdb_api_key)
+        # Rate limiting: token buckets shared by all worker threads
+        self.notion = NotionAPI(notion_token, TokenBucket(NOTION_REQUESTS_PER_SECOND))
+        self.tmdb = TMDbAPI(tmdb_api_key, TokenBucket(TMDB_REQUESTS_PER_SECOND))
         self.database_id = database_id
         
-        # Rate limiting
-        self.request_delay = 0.25  # 250ms between requests to respect API limits
+        # (search, details) TMDb lookups per content type
+        self._tmdb_funcs = {
+            'movie': (self.tmdb.search_movie, self.tmdb.get_movie_details),
+            'tv': (self.tmdb.search_tv, self.tmdb.get_tv_details),
+        }
         
         # Property mapping - will be populated from database schema
         self.property_mapping = {}
@@ -232,7 +310,12 @@ class NotionTMDbSync:
         self.field_behavior = FIELD_BEHAVIOR
         
         self._load_database_schema()
+        self._feature_flags = self._compute_feature_flags()
         self._type_cache: Dict[str, str] = {}
+        self._current_data_cache: Dict[Tuple[str, str], Dict] = {}
+        self._current_data_lock = threading.Lock()
+        self._last_edited_field: Optional[str] = None
+        self._last_edited_field_resolved = False
     
     def _load_database_schema(self):
         """Load and analyze the database schema to create property mappings."""
@@ -316,6 +399,17 @@ class NotionTMDbSync:
             logger.error(f"Error loading database schema: {e}")
             self.property_mapping = {}
     
+    def _compute_feature_flags(self) -> int:
+        """Fold the optional per-page feature properties into a bitmask once per instance."""
+        flags = 0
+        if self.property_mapping.get('adult_content_property_id'):
+            flags |= FEATURE_ADULT_CONTENT
+        if self.property_mapping.get('collection_property_id'):
+            flags |= FEATURE_COLLECTION
+        if self.property_mapping.get('watch_providers_property_id'):
+            flags |= FEATURE_WATCH_PROVIDERS
+        return flags
+    
     def _parse_tmdb_url(self, url: str) -> Optional[Dict[str, str]]:
         """
         Parse TMDB URL and extract type + ID.
@@ -346,6 +440,18 @@ class NotionTMDbSync:
     
     def get_notion_pages(self, status_filter: Optional[str] = None, created_after: Optional[str] = None) -> List[Dict]:
         """Get all pages from the Notion database, optionally filtered by status and/or creation date."""
+        filter_params = self._build_pages_filter(status_filter, created_after)
+        logger.info(f"Fetching pages from database {self.database_id}")
+        return self.notion.query_database(self.database_id, filter_params)
+    
+    def iter_notion_pages(self, status_filter: Optional[str] = None, created_after: Optional[str] = None) -> Iterator[Dict]:
+        """Yield pages from the Notion database batch by batch, with the same filters as get_notion_pages."""
+        filter_params = self._build_pages_filter(status_filter, created_after)
+        logger.info(f"Streaming pages from database {self.database_id}")
+        return self.notion.iter_database_pages(self.database_id, filter_params)
+    
+    def _build_pages_filter(self, status_filter: Optional[str], created_after: Optional[str]) -> Optional[Dict]:
+        """Build the Notion query filter for status and/or creation date."""
         filter_params = None
         filters_to_combine = []
         
@@ -384,16 +490,36 @@ class NotionTMDbSync:
         elif len(filters_to_combine) > 1:
             filter_params = {"and": filters_to_combine}
         
-        logger.info(f"Fetching pages from database {self.database_id}")
-        return self.notion.query_database(self.database_id, filter_params)
+        return filter_params
     
     def extract_current_data(self, page: Dict) -> Dict:
-        """Extract current data from a Notion page for comparison."""
+        """Extract current data from a Notion page for comparison.
+        
+        Results are memoized per (page ID, last_edited_time), so re-syncing an
+        unchanged page in the same process skips re-parsing its properties.
+        """
+        if not page:
+            logger.warning("Page is None or empty")
+            return {}
+        
+        cache_key = (page.get('id'), page.get('last_edited_time'))
+        if cache_key[0] and cache_key[1]:
+            cached = self._current_data_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        current_data = self._extract_current_data(page)
+        if cache_key[0] and cache_key[1] and current_data:
+            with self._current_data_lock:
+                if len(self._current_data_cache) >= CURRENT_DATA_CACHE_SIZE:
+                    # Evict the oldest entry (dicts preserve insertion order)
+                    self._current_data_cache.pop(next(iter(self._current_data_cache)))
+                self._current_data_cache[cache_key] = current_data
+        return current_data
+    
+    def _extract_current_data(self, page: Dict) -> Dict:
+        """Parse the configured properties of a Notion page into a flat dict."""
         try:
-            if not page:
-                logger.warning("Page is None or empty")
-                return {}
-                
             properties = page.get('properties', {})
             current_data = {}
             
@@ -443,7 +569,7 @@ class NotionTMDbSync:
             return current_data
             
         except Exception as e:
-            logger.error(f"Error extracting current data from page {page.get('id')}: {e}")
+            logger.error("Error extracting current data from page %s: %s", page.get('id'), e)
             return {}
     
     def extract_title_and_type(self, page: Dict, current_data: Dict) -> Optional[tuple]:
@@ -487,7 +613,7 @@ class NotionTMDbSync:
             return None
                 
         except Exception as e:
-            logger.error(f"Error extracting data from page {page.get('id')}: {e}")
+            logger.error("Error extracting data from page %s: %s", page.get('id'), e)
             return None
 
     def _infer_content_type(self, page_id: Optional[str], title: Optional[str], current_data: Dict) -> Optional[str]:
@@ -808,7 +934,7 @@ class NotionTMDbSync:
                     }
             
             # Adult Content
-            if tmdb_data.get('adult') and self.property_mapping['adult_content_property_id']:
+            if self._feature_flags & FEATURE_ADULT_CONTENT and tmdb_data.get('adult'):
                 property_key = self._get_property_key(self.property_mapping['adult_content_property_id'])
                 if property_key:
                     properties[property_key] = {
@@ -816,7 +942,7 @@ class NotionTMDbSync:
                     }
             
             # Collection (Movies only)
-            if content_type == 'movie' and tmdb_data.get('belongs_to_collection') and self.property_mapping['collection_property_id']:
+            if self._feature_flags & FEATURE_COLLECTION and content_type == 'movie' and tmdb_data.get('belongs_to_collection'):
                 collection = tmdb_data['belongs_to_collection']
                 if collection and collection.get('name'):
                     property_key = self._get_property_key(self.property_mapping['collection_property_id'])
@@ -825,8 +951,11 @@ class NotionTMDbSync:
                         properties[property_key] = {'multi_select': collection_options}
             
             # Watch Providers
-            if self.property_mapping['watch_providers_property_id'] and tmdb_data.get('id'):
-                watch_providers_data = self.tmdb.get_watch_providers(content_type, tmdb_data['id'])
+            if self._feature_flags & FEATURE_WATCH_PROVIDERS and tmdb_data.get('id'):
+                # Details requests append watch providers; only fetch them separately if absent
+                watch_providers_data = tmdb_data.get('watch/providers')
+                if watch_providers_data is None:
+                    watch_providers_data = self.tmdb.get_watch_providers(content_type, tmdb_data['id'])
                 if watch_providers_data:
                     us_providers = watch_providers_data.get('results', {}).get('US', {})
                     new_providers = []
@@ -844,7 +973,7 @@ class NotionTMDbSync:
                             properties[property_key] = {'multi_select': provider_options}
             
         except Exception as e:
-            logger.error(f"Error formatting properties: {e}")
+            logger.error("Error formatting properties: %s", e)
         
         return properties
     
@@ -908,39 +1037,39 @@ class NotionTMDbSync:
     def _handle_field_behavior(self, tmdb_data: List[str], current_data: List[str], field_name: str, behavior: str) -> Optional[List[str]]:
         """Handle field behavior based on configuration."""
         if behavior == 'skip':
-            logger.info(f"Skipping {field_name} field (configured to skip)")
+            logger.info("Skipping %s field (configured to skip)", field_name)
             return None
         
         elif behavior == 'default':
             # Always overwrite with TMDb data (even if empty)
             if tmdb_data:
-                logger.info(f"Default behavior for {field_name}: overwriting with TMDb data: {tmdb_data}")
+                logger.info("Default behavior for %s: overwriting with TMDb data: %s", field_name, tmdb_data)
                 return tmdb_data
             else:
-                logger.info(f"Default behavior for {field_name}: clearing field (TMDb has no data)")
+                logger.info("Default behavior for %s: clearing field (TMDb has no data)", field_name)
                 return []
         
         elif behavior == 'merge':
             # Merge TMDb data with existing data
             if not tmdb_data:
-                logger.info(f"No TMDb {field_name} data - preserving existing: {current_data}")
+                logger.info("No TMDb %s data - preserving existing: %s", field_name, current_data)
                 return current_data
             
             merged = list(set(tmdb_data + current_data))
-            logger.info(f"Merging {field_name}: TMDb={tmdb_data}, Existing={current_data}, Merged={merged}")
+            logger.info("Merging %s: TMDb=%s, Existing=%s, Merged=%s", field_name, tmdb_data, current_data, merged)
             return merged
         
         elif behavior == 'preserve':
             # Only update if TMDb has data
             if tmdb_data:
-                logger.info(f"Preserve behavior for {field_name}: updating with TMDb data: {tmdb_data}")
+                logger.info("Preserve behavior for %s: updating with TMDb data: %s", field_name, tmdb_data)
                 return tmdb_data
             else:
-                logger.info(f"Preserve behavior for {field_name}: preserving existing data: {current_data}")
+                logger.info("Preserve behavior for %s: preserving existing data: %s", field_name, current_data)
                 return None  # Don't update the field
         
         else:
-            logger.warning(f"Unknown behavior '{behavior}' for {field_name}, using default")
+            logger.warning("Unknown behavior '%s' for %s, using default", behavior, field_name)
             return tmdb_data if tmdb_data else []
 
     def _get_property_key(self, property_id: str) -> Optional[str]:
@@ -970,7 +1099,7 @@ class NotionTMDbSync:
             return None
             
         except Exception as e:
-            logger.debug(f"Error searching for page by TMDB ID {tmdb_id}: {e}")
+            logger.debug("Error searching for page by TMDB ID %s: %s", tmdb_id, e)
             return None
     
     def _create_movie_from_tmdb(self, tmdb_data: Dict, tmdb_id: int) -> Dict:
@@ -1007,7 +1136,7 @@ class NotionTMDbSync:
                 self.database_id,
                 properties,
                 cover_url,
-                '🎬'  # Movie icon
+                self._ICON_BY_TYPE['movie']
             )
             
             if not page_id:
@@ -1067,7 +1196,7 @@ class NotionTMDbSync:
                 self.database_id,
                 properties,
                 cover_url,
-                '📺'  # TV icon
+                self._ICON_BY_TYPE['tv']
             )
             
             if not page_id:
@@ -1180,51 +1309,23 @@ class NotionTMDbSync:
             title_and_type = self.extract_title_and_type(page, current_data)
             
             if not title_and_type:
-                logger.warning(f"Missing title or content type for page {page_id}")
-                logger.warning(f"Skipping page {page_id} - missing title or content type")
+                logger.warning("Skipping page %s - missing title or content type", page_id)
                 return None  # Indicate skipped, not failed
             
             title, content_type = title_and_type
             
             # Skip TMDb sync for YouTube content
             if content_type and content_type.lower() == 'youtube':
-                logger.info(f"Skipping TMDb sync for YouTube content: {title}")
+                logger.info("Skipping TMDb sync for YouTube content: %s", title)
                 return True  # Successfully processed, no sync needed
             
-            logger.info(f"Processing: {title} ({content_type})")
+            logger.info("Processing: %s (%s)", title, content_type)
             
             # Extract current data for comparison (already pulled before inference)
             
-            # Check if we already have TMDb ID and can skip search
-            current_tmdb_id = current_data.get('tmdb_id_property_id')
-            details = None  # Initialize details variable
-            
-            if current_tmdb_id:
-                # Try to get details directly using existing TMDb ID
-                if content_type == 'movie':
-                    details = self.tmdb.get_movie_details(current_tmdb_id)
-                else:
-                    details = self.tmdb.get_tv_details(current_tmdb_id)
-                
-                if details:
-                    logger.info(f"Using existing TMDb ID {current_tmdb_id} for {title}")
-                else:
-                    # TMDb ID might be invalid, fall back to search
-                    details = None
-            
-            # If no direct lookup, search TMDb
+            details = self._resolve_details(content_type, title, current_data.get('tmdb_id_property_id'))
             if not details:
-                if content_type == 'movie':
-                    search_result = self.tmdb.search_movie(title)
-                    if search_result:
-                        details = self.tmdb.get_movie_details(search_result['id'])
-                else:
-                    search_result = self.tmdb.search_tv(title)
-                    if search_result:
-                        details = self.tmdb.get_tv_details(search_result['id'])
-            
-            if not details:
-                logger.warning(f"Could not get details for: {title}")
+                logger.warning("Could not get details for: %s", title)
                 return False
             
             # Check if content is completed and should be skipped (unless force_update is enabled)
@@ -1233,13 +1334,11 @@ class NotionTMDbSync:
                 status = details.get('status', '').lower()
                 has_tmdb_data = bool(current_data.get('tmdb_id_property_id'))
                 
-                if content_type == 'tv' and status in ['ended', 'canceled'] and has_tmdb_data:
-                    logger.info(f"Skipping completed TV show: {title} (status: {status}, already synced)")
-                    if type_missing:
-                        self._ensure_content_type_property(page_id, content_type)
-                    return True  # Skip but don't count as failed
-                elif content_type == 'movie' and status in ['released'] and has_tmdb_data:
-                    logger.info(f"Skipping released movie: {title} (status: {status}, already synced)")
+                if has_tmdb_data and status in self._COMPLETED_STATUS_BY_TYPE.get(content_type, ()):
+                    if content_type == 'tv':
+                        logger.info("Skipping completed TV show: %s (status: %s, already synced)", title, status)
+                    else:
+                        logger.info("Skipping released movie: %s (status: %s, already synced)", title, status)
                     if type_missing:
                         self._ensure_content_type_property(page_id, content_type)
                     return True  # Skip but don't count as failed
@@ -1268,25 +1367,21 @@ class NotionTMDbSync:
             # Only set cover if there's no existing cover
             if details.get('backdrop_path') and not current_cover_url:
                 new_cover_url = f"https://image.tmdb.org/t/p/original{details['backdrop_path']}"
-                logger.info(f"Setting cover image for {title} (no existing cover)")
+                logger.info("Setting cover image for %s (no existing cover)", title)
             elif current_cover_url:
-                logger.info(f"Skipping cover update for {title} (cover already exists)")
+                logger.info("Skipping cover update for %s (cover already exists)", title)
             
             cover_changed = new_cover_url is not None
             
             # Only update if there are changes (or if forcing icon updates)
             if not changes_detected and not cover_changed and not force_icons:
-                logger.info(f"No changes detected for: {title}")
+                logger.info("No changes detected for: %s", title)
                 if type_missing:
                     self._ensure_content_type_property(page_id, content_type)
                 return True
             
             # Determine icon based on content type (default to emojis)
-            icon = None
-            if content_type == 'movie':
-                icon = '🎬'  # Movie camera emoji
-            elif content_type == 'tv':
-                icon = '📺'  # Television emoji
+            icon = self._ICON_BY_TYPE.get(content_type)
             
             # Update the page with only changed properties (or force icon update)
             if self.notion.update_page(page_id, properties, new_cover_url if cover_changed else None, icon):
@@ -1301,41 +1396,63 @@ class NotionTMDbSync:
                 
                 # Special message for force icons mode
                 if force_icons and not changes_detected and not cover_changed:
-                    logger.info(f"Forced icon update: {title}{icon_text}")
+                    logger.info("Forced icon update: %s%s", title, icon_text)
                 else:
-                    logger.info(f"Successfully updated: {title} ({change_text}{cover_text}{icon_text})")
+                    logger.info("Successfully updated: %s (%s%s%s)", title, change_text, cover_text, icon_text)
                 return True
             else:
-                logger.error(f"Failed to update: {title}")
+                logger.error("Failed to update: %s", title)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error syncing page {page.get('id')}: {e}")
+            logger.error("Error syncing page %s: %s", page.get('id'), e)
             return False
     
+    def _resolve_last_edited_field(self) -> Optional[str]:
+        """Return the property key of a last-edited field, resolving the schema only once."""
+        if self._last_edited_field_resolved:
+            return self._last_edited_field
+        
+        database = self.notion.get_database(self.database_id)
+        if not database:
+            logger.error("Could not retrieve database schema")
+            return None
+        
+        last_edited_field = None
+        for prop_key, prop_data in database.get('properties', {}).items():
+            if _LAST_EDITED_FIELD_PATTERN.search(prop_data.get('name', '').lower()):
+                last_edited_field = prop_key
+                logger.info(f"Found last edited time field: {prop_key} -> {prop_data.get('name')}")
+                break
+        
+        self._last_edited_field = last_edited_field
+        self._last_edited_field_resolved = True
+        return last_edited_field
+    
+    def _resolve_details(self, content_type: str, title: str, current_tmdb_id: Optional[int]) -> Optional[Dict]:
+        """Fetch TMDb details by the stored ID, falling back to a title search."""
+        # Anything that is not a movie is looked up as a TV show
+        search_fn, details_fn = self._tmdb_funcs.get(content_type, self._tmdb_funcs['tv'])
+        
+        if current_tmdb_id:
+            details = details_fn(current_tmdb_id)
+            if details:
+                logger.info("Using existing TMDb ID %s for %s", current_tmdb_id, title)
+                return details
+            # TMDb ID might be invalid, fall back to search
+        
+        search_result = search_fn(title)
+        if search_result:
+            return details_fn(search_result['id'])
+        return None
+    
     def get_last_edited_page(self) -> Optional[Dict]:
         """Get the most recently edited page from the Notion database."""
         try:
             logger.info("Fetching last edited page from database")
             
             # First, try to find a last_edited_time field in the database schema
-            database = self.notion.get_database(self.database_id)
-            if not database:
-                logger.error("Could not retrieve database schema")
-                return None
-            
-            properties = database.get('properties', {})
-            last_edited_field = None
-            
-            # Look for common variations of last edited time field names
-            possible_names = ['last edit', 'Last Edit', 'last_edited_time', 'Last Edited Time', 'last_edited', 'Last Edited', 'edited_time', 'Edited Time']
-            
-            for prop_key, prop_data in properties.items():
-                prop_name = prop_data.get('name', '').lower()
-                if any(name.lower() in prop_name for name in possible_names):
-                    last_edited_field = prop_key
-                    logger.info(f"Found last edited time field: {prop_key} -> {prop_data.get('name')}")
-                    break
+            last_edited_field = self._resolve_last_edited_field()
             
             if last_edited_field:
                 # Use the database field for sorting (most efficient)
@@ -1348,18 +1465,16 @@ class NotionTMDbSync:
                     page_size=1
                 )
             else:
-                # Fall back to sorting by Notion's built-in last_edited_time
+                # Fall back to sorting by Notion's built-in last_edited_time timestamp
                 logger.info("No last_edited_time field found, using Notion's built-in sorting")
                 response = self.notion.client.databases.query(
                     self.database_id,
-                    page_size=100  # Get more pages to sort locally
+                    sorts=[{
+                        "timestamp": "last_edited_time",
+                        "direction": "descending"
+                    }],
+                    page_size=1
                 )
-                
-                if response.get('results'):
-                    # Sort pages by last_edited_time (most recent first)
-                    pages = response['results']
-                    pages.sort(key=lambda page: page.get('last_edited_time', ''), reverse=True)
-                    response['results'] = pages[:1]  # Keep only the most recent
             
             if response.get('results') and len(response['results']) > 0:
                 page = response['results'][0]
@@ -1398,42 +1513,30 @@ class NotionTMDbSync:
         
         logger.info(f"Processing last edited page: {page.get('id')}")
         
-        # Sync the single page
+        # Sync the single page directly - no worker pool for a single request
         result = self.sync_page(page, force_icons=force_icons, force_update=force_update)
         
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = time.time() - start_time
         
         if result is True:
             logger.info(f"Last page sync completed successfully in {duration:.2f} seconds")
-            return {
-                'success': True,
-                'total_pages': 1,
-                'successful_updates': 1,
-                'failed_updates': 0,
-                'skipped_updates': 0,
-                'duration': duration
-            }
         elif result is False:
             logger.error("Last page sync failed")
-            return {
-                'success': False,
-                'total_pages': 1,
-                'successful_updates': 0,
-                'failed_updates': 1,
-                'skipped_updates': 0,
-                'duration': duration
-            }
         else:  # result is None (skipped)
             logger.info(f"Last page sync skipped in {duration:.2f} seconds")
-            return {
-                'success': True,
-                'total_pages': 1,
-                'successful_updates': 0,
-                'failed_updates': 0,
-                'skipped_updates': 1,
-                'duration': duration
-            }
+        return self._single_page_results(result, duration)
+
+    @staticmethod
+    def _single_page_results(result: Optional[bool], duration: float) -> Dict:
+        """Build the run summary for a single-page sync from sync_page's result."""
+        return {
+            'success': result is not False,
+            'total_pages': 1,
+            'successful_updates': 1 if result is True else 0,
+            'failed_updates': 1 if result is False else 0,
+            'skipped_updates': 1 if result is None else 0,
+            'duration': duration
+        }
 
     def run_page_sync(
         self,
@@ -1468,52 +1571,36 @@ class NotionTMDbSync:
                     'message': f'Page {page_id} does not belong to the configured database',
                 }
 
+        start_time = time.time()
         result_flag = self.sync_page(page, force_icons=force_icons, force_update=force_update)
-
-        results = {
-            'success': True,
-            'total_pages': 1,
-            'successful_updates': 0,
-            'failed_updates': 0,
-            'skipped_updates': 0,
-            'duration': 0,
-        }
-
-        if result_flag is True:
-            results['successful_updates'] = 1
-        elif result_flag is False:
-            results['failed_updates'] = 1
-            results['success'] = False
-        else:
-            results['skipped_updates'] = 1
-
-        return results
+        return self._single_page_results(result_flag, time.time() - start_time)
 
     def run_sync(
         self, 
         force_icons: bool = False, 
-        max_workers: int = 3, 
+        max_workers: int = DEFAULT_WORKERS, 
         force_update: bool = False,
         status_filter: Optional[str] = None,
         update_only: Optional[List[str]] = None,
         created_after: Optional[str] = None,
         dry_run: bool = False,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
-        """Run the complete synchronization process."""
+        """Run the complete synchronization process.
+        
+        ``progress_callback`` (if given) is called with a SyncProgress snapshot
+        after each page completes.
+        """
         if dry_run:
             logger.warning("dry_run parameter not yet fully implemented for movies sync - proceeding with normal sync")
-        mode_parts = []
-        if force_icons:
-            mode_parts.append("FORCE ICONS")
-        if force_update:
-            mode_parts.append("FORCE UPDATE")
-        if status_filter:
-            mode_parts.append(f"STATUS={status_filter}")
-        if update_only:
-            mode_parts.append(f"UPDATE={','.join(update_only)}")
-        if created_after:
-            mode_parts.append(f"CREATED_AFTER={created_after[:10]}")
-        
+        mode_flags = (
+            (force_icons, "FORCE ICONS"),
+            (force_update, "FORCE UPDATE"),
+            (status_filter, f"STATUS={status_filter}"),
+            (update_only, f"UPDATE={','.join(update_only or [])}"),
+            (created_after, f"CREATED_AFTER={(created_after or '')[:10]}"),
+        )
+        mode_parts = [label for enabled, label in mode_flags if enabled]
         mode_str = " + ".join(mode_parts) if mode_parts else "STANDARD"
         logger.info(f"Starting Notion-TMDb synchronization ({mode_str} MODE)")
         logger.info(f"Using {max_workers} parallel workers for processing")
@@ -1528,65 +1615,141 @@ class NotionTMDbSync:
             return {'success': False, 'message': 'No content type property found'}
         
         start_time = time.time()
-        pages = self.get_notion_pages(status_filter=status_filter, created_after=created_after)
-        
-        if not pages:
-            logger.warning("No pages found in database")
-            return {'success': False, 'message': 'No pages found'}
+        self.tmdb.set_pool_size(max_workers)
+        progress = SyncProgress(progress_callback)
+        
+        # Stream pages through a bounded queue so workers start on the first
+        # result batch while later batches are still being fetched
+        page_queue: "queue.Queue[Optional[Dict]]" = queue.Queue(maxsize=max_workers * 2)
+        producer = threading.Thread(
+            target=self._produce_pages,
+            args=(page_queue, progress, max_workers, status_filter, created_after),
+            name="notion-page-producer",
+            daemon=True,
+        )
+        producer.start()
         
-        logger.info(f"Found {len(pages)} pages to process")
+        # Each worker pulls the next page as soon as it finishes one, and every
+        # result is tallied as it completes rather than at a final barrier
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            consumers = [
+                executor.submit(self._consume_pages, page_queue, progress, force_icons, force_update, update_only)
+                for _ in range(max_workers)
+            ]
+            for consumer in concurrent.futures.as_completed(consumers):
+                consumer.result()
         
-        successful_updates = 0
-        failed_updates = 0
-        skipped_updates = 0
+        producer.join()
+        totals = progress.snapshot()
         
-        # Process pages in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_page = {
-                executor.submit(self.sync_page, page, force_icons, force_update, update_only): page 
-                for page in pages
-            }
-            
-            # Process completed tasks as they finish
-            for i, future in enumerate(concurrent.futures.as_completed(future_to_page), 1):
-                page = future_to_page[future]
-                try:
-                    result = future.result()
-                    if result is True:
-                        successful_updates += 1
-                    elif result is False:
-                        failed_updates += 1
-                    else:  # result is None (skipped)
-                        skipped_updates += 1
-                    
-                    logger.info(f"Completed page {i}/{len(pages)}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing page {page.get('id')}: {e}")
-                    failed_updates += 1
-                
-                # Small delay to respect rate limits
-                time.sleep(self.request_delay / max_workers)
+        if not totals['total']:
+            logger.warning("No pages found in database")
+            return {'success': False, 'message': 'No pages found'}
         
         end_time = time.time()
         duration = end_time - start_time
         
         logger.info(f"Sync completed in {duration:.2f} seconds")
-        logger.info(f"Successful updates: {successful_updates}")
-        logger.info(f"Failed updates: {failed_updates}")
-        if skipped_updates > 0:
-            logger.info(f"Skipped updates: {skipped_updates}")
+        logger.info(f"Successful updates: {totals['successful_updates']}")
+        logger.info(f"Failed updates: {totals['failed_updates']}")
+        if totals['skipped_updates'] > 0:
+            logger.info(f"Skipped updates: {totals['skipped_updates']}")
         
         return {
             'success': True,
-            'total_pages': len(pages),
-            'successful_updates': successful_updates,
-            'failed_updates': failed_updates,
-            'skipped_updates': skipped_updates,
+            'total_pages': totals['total'],
+            'successful_updates': totals['successful_updates'],
+            'failed_updates': totals['failed_updates'],
+            'skipped_updates': totals['skipped_updates'],
             'duration': duration
         }
 
+    def _produce_pages(
+        self,
+        page_queue: "queue.Queue[Optional[Dict]]",
+        progress: "SyncProgress",
+        consumer_count: int,
+        status_filter: Optional[str],
+        created_after: Optional[str],
+    ) -> None:
+        """Feed streamed Notion pages into the queue, then one stop marker per consumer."""
+        discovered = 0
+        try:
+            for page in self.iter_notion_pages(status_filter=status_filter, created_after=created_after):
+                discovered += 1
+                progress.discovered = discovered
+                page_queue.put(page)
+            logger.info(f"Found {discovered} pages to process")
+        finally:
+            progress.total = discovered
+            for _ in range(consumer_count):
+                page_queue.put(None)
+    
+    def _consume_pages(
+        self,
+        page_queue: "queue.Queue[Optional[Dict]]",
+        progress: "SyncProgress",
+        force_icons: bool,
+        force_update: bool,
+        update_only: Optional[List[str]],
+    ) -> None:
+        """Sync pages from the queue until a stop marker arrives, recording each result."""
+        while True:
+            page = page_queue.get()
+            if page is None:
+                return
+            try:
+                result = self.sync_page(page, force_icons, force_update, update_only)
+            except Exception as e:
+                logger.error("Error processing page %s: %s", page.get('id'), e)
+                result = False
+            progress.record(result)
+
+
+class SyncProgress:
+    """Thread-safe running tally of run_sync page results.
+    
+    ``total`` stays None until pagination finishes; ``discovered`` counts the
+    pages streamed so far. The optional callback receives a snapshot after
+    every completed page.
+    """
+    
+    def __init__(self, callback: Optional[Callable[[Dict], None]] = None):
+        self.successful_updates = 0
+        self.failed_updates = 0
+        self.skipped_updates = 0
+        self.completed = 0
+        self.discovered = 0
+        self.total: Optional[int] = None
+        self._callback = callback
+        self._lock = threading.Lock()
+    
+    def record(self, result: Optional[bool]) -> None:
+        """Count one sync_page result (True/False/None) and notify the callback."""
+        with self._lock:
+            if result is True:
+                self.successful_updates += 1
+            elif result is False:
+                self.failed_updates += 1
+            else:  # result is None (skipped)
+                self.skipped_updates += 1
+            self.completed += 1
+            snapshot = self.snapshot()
+        logger.info("Completed page %s", snapshot['completed'])
+        if self._callback:
+            self._callback(snapshot)
+    
+    def snapshot(self) -> Dict:
+        return {
+            'completed': self.completed,
+            'discovered': self.discovered,
+            'total': self.total,
+            'successful_updates': self.successful_updates,
+            'failed_updates': self.failed_updates,
+            'skipped_updates': self.skipped_updates,
+        }
+
+
 def validate_environment():
     """Validate environment variables and configuration."""
     errors = []
@@ -1624,25 +1787,33 @@ def validate_environment():
     return True
 
 
+# Sync instance reused across run_sync calls in the same process, keyed by its credentials
+_SYNC_INSTANCE: Optional[Tuple[Tuple[Optional[str], ...], NotionTMDbSync]] = None
+
+
 def _build_sync_instance() -> NotionTMDbSync:
+    global _SYNC_INSTANCE
     notion_token = get_notion_token()
     tmdb_api_key = os.getenv('TMDB_API_KEY')
     database_id = get_database_id('NOTION_MOVIETV_DATABASE_ID', 'NOTION_DATABASE_ID')
-    return NotionTMDbSync(notion_token, tmdb_api_key, database_id)
+    cache_key = (notion_token, tmdb_api_key, database_id)
+    if _SYNC_INSTANCE is None or _SYNC_INSTANCE[0] != cache_key:
+        _SYNC_INSTANCE = (cache_key, NotionTMDbSync(notion_token, tmdb_api_key, database_id))
+    return _SYNC_INSTANCE[1]
 
 
 def enforce_worker_limits(workers: int) -> int:
     if workers < 1:
         raise ValueError("Number of workers must be at least 1")
-    if workers > 10:
-        logger.warning("Using %s workers may overwhelm APIs. Consider reducing to 5 or fewer.", workers)
+    if workers > 32:
+        logger.warning("Using %s workers adds threads without raising the rate-limited request budget.", workers)
     return workers
 
 
 def run_sync(
     *,
     force_icons: bool = False,
-    workers: int = 3,
+    workers: int = DEFAULT_WORKERS,
     last_page: bool = False,
     page_id: Optional[str] = None,
     force_update: bool = False,
@@ -1651,10 +1822,9 @@ def run_sync(
     created_after: Optional[str] = None,
     dry_run: bool = False,
     tmdb_url: Optional[str] = None,
+    progress_callback: Optional[Callable[[Dict], None]] = None,
 ) -> Dict:
     """Run the Movies/TV sync with the provided options."""
-    enforce_worker_limits(workers)
-
     # Handle TMDB URL creation mode (no page_id required)
     if tmdb_url and not page_id:
         logger.info(f"TMDB URL creation mode: {tmdb_url}")
@@ -1682,6 +1852,8 @@ def run_sync(
             force_update=force_update,
         )
 
+    # Worker settings only matter for the full-database pool
+    enforce_worker_limits(workers)
     return sync.run_sync(
         force_icons=force_icons,
         max_workers=workers,
@@ -1690,6 +1862,7 @@ def run_sync(
         update_only=update_only,
         created_after=created_after,
         dry_run=dry_run,
+        progress_callback=progress_callback,
     )
 
 
@@ -1706,8 +1879,8 @@ def main():
         parser = argparse.ArgumentParser(description='Synchronize Notion database with TMDb data')
         parser.add_argument('--force-icons', action='store_true', 
                            help='Force update all page icons (one-time operation)')
-        parser.add_argument('--workers', type=int, default=3, metavar='N',
-                           help='Number of parallel workers (default: 3, max recommended: 5)')
+        parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, metavar='N',
+                           help=f'Number of parallel workers (default: {DEFAULT_WORKERS})')
         parser.add_argument('--last-page', action='store_true',
                            help='Sync only the most recently edited page (useful for iOS shortcuts)')
         parser.add_argument('--force-update', action='store_true',
@@ -1718,8 +1891,8 @@ def main():
         if args.workers < 1:
             logger.error("Number of workers must be at least 1")
             sys.exit(1)
-        if args.workers > 10:
-            logger.warning(f"Using {args.workers} workers may overwhelm APIs. Consider reducing to 5 or fewer.")
+        if args.workers > 32:
+            logger.warning(f"Using {args.workers} workers adds threads without raising the rate-limited request budget.")
         
         logger.info("Starting Notion TMDb Sync")
         
@@ -1741,21 +1914,33 @@ def main():
         else:
             result = sync.run_sync(force_icons=args.force_icons, max_workers=args.workers, force_update=args.force_update)
         
+        if args.last_page:
+            mode = 'last_page'
+        elif args.force_icons:
+            mode = 'force_icons'
+        elif args.force_update:
+            mode = 'force_update'
+        else:
+            mode = 'optimization'
+        summary = {
+            'mode': mode,
+            'updated': result.get('successful_updates', 0),
+            'failed': result.get('failed_updates', 0),
+            'skipped': result.get('skipped_updates', 0),
+        }
+        
+        # One record for the whole outcome, then flush handlers before exiting
         if result['success']:
-            logger.info("Synchronization completed successfully")
-            logger.info(f"Updated: {result['successful_updates']} pages")
-            logger.info(f"Failed: {result['failed_updates']} pages")
-            if args.last_page:
-                logger.info("Last page mode completed - only the most recently edited page was processed")
-            if args.force_icons:
-                logger.info("Force icons mode completed - all page icons have been updated")
-            if args.force_update:
-                logger.info("Force update mode completed - all pages processed including completed content")
-            elif not args.force_icons and not args.last_page:
-                logger.info("Optimization mode completed - completed content was skipped for efficiency")
+            logger.info(
+                "Synchronization completed successfully | mode=%s updated=%s failed=%s skipped=%s",
+                summary['mode'], summary['updated'], summary['failed'], summary['skipped'],
+                extra={'sync_summary': summary},
+            )
+            logging.shutdown()
             sys.exit(0)
         else:
-            logger.error("Synchronization failed")
+            logger.error("Synchronization failed | mode=%s", mode, extra={'sync_summary': summary})
+            logging.shutdown()
             sys.exit(1)
             
     except KeyboardInterrupt:
@@ -6,17 +6,33 @@ Supports three databases: Artists, Albums, Songs, and Labels.
 """
 
 import os
+import heapq
 import logging
 import time
+import random
 import re
-from urllib.parse import urlparse
-from typing import Dict, List, Optional, Union
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
 from datetime import datetime, timezone
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+from shared.cache import TTLCache
 from shared.change_detection import has_property_changes
 from shared.logging_config import get_logger
 from shared.notion_api import NotionAPI
+from shared.rate_limit import TokenBucket
 from shared.utils import (
     build_multi_select_options,
     build_created_after_filter,
@@ -123,6 +139,169 @@ except ImportError as exc:
         "syncs/music/property_config.py not found. Copy the example file and set your property IDs."
     ) from exc
 
+# Request budgets: MusicBrainz's public policy is 1 request/second; Spotify
+# tolerates short bursts, so its bucket allows a second's worth at once;
+# Notion averages 3 requests/second
+MUSICBRAINZ_REQUESTS_PER_SECOND = 1
+NOTION_REQUESTS_PER_SECOND = 3
+SPOTIFY_REQUESTS_PER_SECOND = 10
+
+# Seconds before a Spotify access token's expires_in at which it is renewed
+SPOTIFY_TOKEN_REFRESH_MARGIN = 60
+
+# (connect, read) timeouts so a hung connection can't stall the sync; read
+# timeouts are retried by the session's urllib3 Retry like 5xx responses
+REQUEST_TIMEOUT = (5, 30)
+COVER_ART_TIMEOUT = (5, 60)
+
+# Album pages ahead of the current one whose cover art is fetched in the background
+COVER_ART_PREFETCH_WINDOW = 16
+
+# Recordings fetched (one MusicBrainz page) for the per-artist title index
+ARTIST_RECORDINGS_INDEX_LIMIT = 100
+
+# Release-browse pages worth spending to prime an artist's release-groups;
+# larger catalogs are cheaper to walk with per-group lookups
+RELEASE_BROWSE_MAX_PAGES = 5
+RELEASE_BROWSE_PAGE_SIZE = 100
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Sentinel distinguishing "not cached" from a cached None
+_CACHE_MISS = object()
+
+# Identifier formats; malformed values are rejected locally instead of
+# spending a rate-limited request on a guaranteed 400/404
+_MBID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+_ISRC_RE = re.compile(r'[A-Z]{2}[A-Z0-9]{3}[0-9]{7}')
+_SPOTIFY_URL_RE = re.compile(r'(?:https?://open\.spotify\.com/|spotify:)(track|album|artist)[/:]([a-zA-Z0-9]+)')
+_SPOTIFY_ARTIST_ID_RE = re.compile(r'(?:open\.spotify\.com/artist/|spotify:artist:)([A-Za-z0-9]+)', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+# ASCII-only equivalent of _NON_ALNUM_RE (and lowercasing) for str.translate
+_ASCII_TITLE_TABLE = str.maketrans({
+    c: c.lower() if c.isalnum() or c.isspace() else ' ' for c in map(chr, range(128))
+})
+
+# Characters with special meaning in MusicBrainz (Lucene) search queries
+_LUCENE_SPECIAL = re.compile(r'(&&|\|\||[+\-!(){}\[\]^"~*?:\\/])')
+
+
+@lru_cache(maxsize=8192)
+def _match_spotify_url(url: str) -> Optional[Tuple[str, str]]:
+    """Return (type, id) for a Spotify web URL or URI, memoized per URL."""
+    match = _SPOTIFY_URL_RE.search(url)
+    return (match[1], match[2]) if match else None
+
+
+def _is_valid_mbid(mbid: Optional[str]) -> bool:
+    """Return True if mbid looks like a MusicBrainz UUID."""
+    return bool(mbid) and _MBID_RE.fullmatch(mbid) is not None
+
+
+def _mb_escape(value: str, quote: bool = True) -> str:
+    """Escape a value for a MusicBrainz search query, wrapping it as a phrase by default."""
+    escaped = _LUCENE_SPECIAL.sub(r'\\\1', value)
+    return f'"{escaped}"' if quote else escaped
+
+
+@lru_cache(maxsize=1024)
+def _normalize_date(date_str: str) -> Optional[str]:
+    """Normalize a date string to YYYY-MM-DD format for comparison.
+
+    Handles partial dates:
+    - YYYY -> YYYY-01-01
+    - YYYY-MM -> YYYY-MM-01
+    - YYYY-MM-DD -> YYYY-MM-DD (unchanged)
+    """
+    if not date_str or len(date_str) < 4:
+        return None
+    parts = date_str.split('-')
+    if len(parts) == 1:
+        # Just YYYY
+        return f"{parts[0]}-01-01"
+    if len(parts) == 2:
+        # YYYY-MM
+        return f"{parts[0]}-{parts[1]}-01"
+    # YYYY-MM-DD (or more)
+    return date_str[:10]
+
+
+@lru_cache(maxsize=4096)
+def _title_words(title: str) -> Tuple[str, ...]:
+    """Lowercase alphanumeric words of a title, for exact word-for-word matching."""
+    if title.isascii():
+        return tuple(title.translate(_ASCII_TITLE_TABLE).split())
+    return tuple(_NON_ALNUM_RE.sub(' ', title).lower().split())
+
+
+def _title_contains_words(words: Tuple[str, ...], title: str) -> bool:
+    """Return True if words appear as a contiguous run of whole words in title."""
+    title_words = _title_words(title)
+    size = len(words)
+    return bool(size) and any(
+        title_words[i:i + size] == words for i in range(len(title_words) - size + 1)
+    )
+
+
+# Artist link fields keyed by MusicBrainz relation type, then by URL host
+_ARTIST_LINK_RELATION_TYPES = {
+    'instagram': 'ig',
+    'official homepage': 'website',
+    'official website': 'website',
+}
+_ARTIST_LINK_HOSTS = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'bandcamp.com': 'bandcamp',
+    'open.spotify.com': 'spotify',
+    'play.spotify.com': 'spotify',
+}
+
+
+def _classify_artist_link(relation_type: str, url: str) -> Optional[str]:
+    """Return the artist link field ('ig', 'website', 'youtube', 'bandcamp', 'spotify') for a URL relation."""
+    relation_type = relation_type.casefold()
+    field = _ARTIST_LINK_RELATION_TYPES.get(relation_type)
+    if field:
+        return field
+    try:
+        host = (urlsplit(url).hostname or '').removeprefix('www.').removeprefix('m.')
+    except ValueError:
+        return None
+    if host == 'instagram.com':
+        return 'ig' if relation_type == 'social network' else None
+    if host.endswith('.bandcamp.com'):
+        # Artist pages live on their own subdomain
+        return 'bandcamp'
+    return _ARTIST_LINK_HOSTS.get(host)
+
+
+@lru_cache(maxsize=4096)
+def _build_recording_query(title: str, artist: Optional[str] = None, album: Optional[str] = None,
+                           artist_mbid: Optional[str] = None) -> str:
+    """Build the recording search query for a title and optional artist/album."""
+    # Use less strict title matching when we have artist MBID
+    # This helps find recordings that might have slight title variations
+    # Note: When querying /recording endpoint, we don't need 'type:recording'
+    if artist_mbid:
+        # When we have artist MBID, use a more flexible title search
+        # This will match "New Genesis" even if the recording has additional text
+        query_parts = [f'recording:{_mb_escape(title, quote=False)}']  # No quotes = partial match
+        query_parts.append(f'arid:{artist_mbid}')
+    else:
+        # Use exact match when we don't have artist MBID
+        query_parts = [f'recording:{_mb_escape(title)}']
+        if artist:
+            query_parts.append(f'artist:{_mb_escape(artist)}')
+    if album:
+        query_parts.append(f'release:{_mb_escape(album)}')
+    return ' AND '.join(query_parts)
+
 
 class MusicBrainzAPI:
     """MusicBrainz API client for fetching music data."""
@@ -136,81 +315,142 @@ class MusicBrainzAPI:
             'Accept': 'application/json'
         })
         
-        # Rate limiting - MusicBrainz allows 1 request per second
-        self.request_delay = 1.0
-        self.last_request_time = 0
-        
-        # Caching to reduce API calls
+        # Transient failures (429/5xx) are retried by urllib3 with exponential
+        # backoff, honoring Retry-After; the pool is sized for Cover Art bursts.
+        # Once retries run out, the last response is returned so raise_for_status()
+        # surfaces it as an HTTPError like any other status
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        mb_adapter = HTTPAdapter(max_retries=retry, pool_connections=8, pool_maxsize=32)
+        self.session.mount('https://musicbrainz.org/', mb_adapter)
+        self.session.mount('https://coverartarchive.org/', mb_adapter)
+        
+        # Spotify calls use their own pooled session so connections to the
+        # accounts and API hosts are kept alive between requests. Status-based
+        # retries (429/5xx) live in _spotify_request; the adapter only retries
+        # dropped or refused connections
+        self.spotify_session = requests.Session()
+        spotify_retry = Retry(total=3, status=0, backoff_factor=0.5)
+        spotify_adapter = HTTPAdapter(max_retries=spotify_retry, pool_connections=4, pool_maxsize=20)
+        self.spotify_session.mount('https://accounts.spotify.com/', spotify_adapter)
+        self.spotify_session.mount('https://api.spotify.com/', spotify_adapter)
+        self._spotify_token: Optional[str] = None
+        self._spotify_token_expiry: float = 0.0
+        self._spotify_token_lock = threading.Lock()
+        
+        # Rate limiting - MusicBrainz allows 1 request per second; Spotify
+        # calls may burst but average out to SPOTIFY_REQUESTS_PER_SECOND
+        self._mb_bucket = TokenBucket(rate=MUSICBRAINZ_REQUESTS_PER_SECOND, capacity=1)
+        self._spotify_bucket = TokenBucket(rate=SPOTIFY_REQUESTS_PER_SECOND)
+        
+        # Cover Art Archive and Spotify are not bound by the MusicBrainz limit,
+        # so their lookups can run in the background alongside MusicBrainz calls
+        self._aux_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='music-aux')
+        # Cover art gets its own pool so a backlog of prefetched covers never
+        # queues ahead of the lookups a page is blocked on in _aux_executor
+        self._cover_art_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='cover-art')
+        self._cover_art_futures: Dict[str, Future] = {}
+        self._cover_art_lock = threading.Lock()
+        
+        # Release-groups seen in artist listings, mapped to the listing they came
+        # from, so a group's first lookup can prime its siblings on demand
+        self._release_group_sources: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._primed_release_sources: Set[Tuple[str, Optional[str]]] = set()
+        self._release_prime_lock = threading.Lock()
+        
+        # Caching to reduce API calls; bounded so long syncs don't grow without limit
         self._cache = {
-            'artists': {},
-            'releases': {},
-            'recordings': {},
-            'labels': {},
-            'cover_art': {},
-            'release_groups': {},
-            'artist_release_groups': {},
-            'artist_recordings': {}
+            'artists': TTLCache(maxsize=2048, ttl=3600),
+            'releases': TTLCache(maxsize=2048, ttl=3600),
+            'recordings': TTLCache(maxsize=2048, ttl=3600),
+            'labels': TTLCache(maxsize=2048, ttl=3600),
+            'cover_art': TTLCache(maxsize=8192, ttl=86400),
+            'release_groups': TTLCache(maxsize=2048, ttl=3600),
+            'artist_release_groups': TTLCache(maxsize=512, ttl=3600),
+            'artist_recordings': TTLCache(maxsize=512, ttl=3600),
+            'spotify_search': TTLCache(maxsize=2048, ttl=3600),
+            'isrc': TTLCache(maxsize=2048, ttl=3600),
+            'barcode': TTLCache(maxsize=2048, ttl=3600),
+            'artists_by_spotify_id': TTLCache(maxsize=2048, ttl=3600),
+            'spotify_tracks': TTLCache(maxsize=4096, ttl=3600),
+            'spotify_albums': TTLCache(maxsize=4096, ttl=3600),
+            'spotify_artists': TTLCache(maxsize=4096, ttl=3600)
         }
     
     def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Apply rate limiting between MusicBrainz requests."""
+        waited = self._mb_bucket.acquire()
+        if waited:
+            logger.debug(f"Rate limiting: slept for {waited:.2f} seconds")
+    
+    def _spotify_rate_limit(self):
+        """Wait for a Spotify request slot; only sleeps once the burst budget is spent."""
+        self._spotify_bucket.acquire()
     
-    def _make_api_request(self, url: str, params: Dict = None, headers: Dict = None, max_retries: int = 3) -> requests.Response:
-        """Make an API request with rate limiting and retry logic."""
-        if params is None:
-            params = {}
+    def _get_json(self, url: str, params: Dict = None, headers: Dict = None,
+                  rate_limited: bool = True) -> Any:
+        """Make an API request and return the decoded JSON body.
+        
+        Requests are rate-limited unless the host is not MusicBrainz. Returns None
+        for 404 and empty (204) responses. Retries for 429/5xx (honoring
+        Retry-After) are handled by the session's HTTPAdapter; other HTTP errors
+        are raised.
+        """
+        if rate_limited:
+            self._rate_limit()
+        response = self.session.get(url, params=params or {}, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code in (204, 404):
+            return None
+        response.raise_for_status()
+        return _decode_json(response)
+    
+    def warm_connections(self) -> Future:
+        """Open pooled connections to the music hosts in the background.
         
-        for attempt in range(max_retries + 1):
-            try:
-                # Apply rate limiting before each request
-                self._rate_limit()
-                
-                # Make the request
-                response = self.session.get(url, params=params, headers=headers)
-                
-                # Check for rate limiting (429)
-                if response.status_code == 429:
-                    if attempt < max_retries:
-                        wait_time = (2 ** attempt) + 1  # Exponential backoff
-                        logger.warning(f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Rate limit exceeded after {max_retries} retries")
-                        response.raise_for_status()
-                
-                # Check for other HTTP errors
-                if response.status_code >= 400:
-                    if attempt < max_retries:
-                        wait_time = 1 + (attempt * 0.5)
-                        logger.warning(f"HTTP {response.status_code} error. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        response.raise_for_status()
-                
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = 1 + (attempt * 0.5)
-                    logger.warning(f"Request failed: {e}. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"Request failed after {max_retries} retries: {e}")
-                    raise
+        Pays DNS and TLS setup while the caller is busy with Notion, so the first
+        real MusicBrainz, Cover Art Archive and Spotify requests reuse a warm connection.
+        """
+        def warm():
+            targets = [
+                (self.session, 'https://musicbrainz.org/ws/2/'),
+                (self.session, 'https://coverartarchive.org/'),
+            ]
+            if os.getenv('SPOTIFY_CLIENT_ID') and os.getenv('SPOTIFY_CLIENT_SECRET'):
+                targets.append((self.spotify_session, 'https://accounts.spotify.com/'))
+            for session, url in targets:
+                try:
+                    if 'musicbrainz.org' in url:
+                        self._rate_limit()
+                    session.head(url, timeout=5)
+                except Exception as e:
+                    logger.debug(f"Could not pre-warm connection to {url}: {e}")
         
-        raise Exception("Max retries exceeded")
+        return self._aux_executor.submit(warm)
+    
+    def _cache_get(self, kind: str, key: Any) -> Any:
+        """Look up key in a cache namespace with a single probe; _CACHE_MISS if absent."""
+        return self._cache[kind].get(key, _CACHE_MISS)
+    
+    def _cache_put(self, kind: str, key: Any, value: Any) -> None:
+        """Store a value (None for a known miss) in a cache namespace."""
+        self._cache[kind][key] = value
+    
+    def _cached(self, kind: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling fetch and caching its result on a miss."""
+        value = self._cache_get(kind, key)
+        if value is not _CACHE_MISS:
+            logger.debug("Using cached %s data for %s", kind, key)
+            return value
+        # Misses (None) are cached too, so repeated lookups skip the rate-limited round-trip
+        value = fetch()
+        self._cache_put(kind, key, value)
+        return value
     
     def search_artists(self, name: str, limit: int = 5) -> List[Dict]:
         """Search for artists by name."""
@@ -222,8 +462,7 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            data = response.json()
+            data = self._get_json(url, params) or {}
             
             return data.get('artists', [])
             
@@ -233,25 +472,17 @@ class MusicBrainzAPI:
     
     def get_artist(self, mbid: str) -> Optional[Dict]:
         """Get detailed artist information by MBID."""
+        if not _is_valid_mbid(mbid):
+            logger.debug(f"Skipping artist lookup for malformed MBID {mbid!r}")
+            return None
         try:
-            # Check cache first
-            if mbid in self._cache['artists']:
-                logger.debug(f"Using cached artist data for MBID {mbid}")
-                return self._cache['artists'][mbid]
-            
             url = f"{self.base_url}/artist/{mbid}"
             params = {
                 'inc': 'aliases+tags+ratings+release-groups+genres+url-rels+area-rels',
                 'fmt': 'json'
             }
             # Note: 'genres' in inc will include genres on both artist and release-groups
-            
-            response = self._make_api_request(url, params)
-            artist = response.json()
-            
-            # Cache the result
-            self._cache['artists'][mbid] = artist
-            return artist
+            return self._cached('artists', mbid, lambda: self._get_json(url, params))
             
         except Exception as e:
             logger.error(f"Error getting artist {mbid}: {e}")
@@ -263,9 +494,9 @@ class MusicBrainzAPI:
             url = f"{self.base_url}/release"
             
             # Build query
-            query_parts = [f'release:"{title}"']
+            query_parts = [f'release:{_mb_escape(title)}']
             if artist:
-                query_parts.append(f'artist:"{artist}"')
+                query_parts.append(f'artist:{_mb_escape(artist)}')
             
             params = {
                 'query': ' AND '.join(query_parts),
@@ -273,8 +504,7 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            data = response.json()
+            data = self._get_json(url, params) or {}
             
             return data.get('releases', [])
             
@@ -294,8 +524,7 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            data = response.json()
+            data = self._get_json(url, params) or {}
             
             return data.get('releases', [])
             
@@ -305,24 +534,16 @@ class MusicBrainzAPI:
     
     def get_release(self, mbid: str) -> Optional[Dict]:
         """Get detailed release information by MBID."""
+        if not _is_valid_mbid(mbid):
+            logger.debug(f"Skipping release lookup for malformed MBID {mbid!r}")
+            return None
         try:
-            # Check cache first
-            if mbid in self._cache['releases']:
-                logger.debug(f"Using cached release data for MBID {mbid}")
-                return self._cache['releases'][mbid]
-            
             url = f"{self.base_url}/release/{mbid}"
             params = {
                 'inc': 'artists+labels+recordings+release-groups+ratings+genres+url-rels',
                 'fmt': 'json'
             }
-            
-            response = self._make_api_request(url, params)
-            release = response.json()
-            
-            # Cache the result
-            self._cache['releases'][mbid] = release
-            return release
+            return self._cached('releases', mbid, lambda: self._get_json(url, params))
             
         except Exception as e:
             logger.error(f"Error getting release {mbid}: {e}")
@@ -330,10 +551,12 @@ class MusicBrainzAPI:
     
     def get_release_group(self, mbid: str) -> Optional[Dict]:
         """Get release-group details (including releases) by MBID."""
+        if not _is_valid_mbid(mbid):
+            logger.debug(f"Skipping release-group lookup for malformed MBID {mbid!r}")
+            return None
         try:
-            if mbid in self._cache['release_groups']:
-                logger.debug(f"Using cached release-group data for MBID {mbid}")
-                return self._cache['release_groups'][mbid]
+            if self._cache_get('release_groups', mbid) is _CACHE_MISS:
+                self._prime_release_groups(mbid)
             
             url = f"{self.base_url}/release-group/{mbid}"
             params = {
@@ -341,56 +564,120 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            release_group = response.json()
-            
-            self._cache['release_groups'][mbid] = release_group
-            return release_group
+            return self._cached('release_groups', mbid, lambda: self._get_json(url, params))
         except Exception as e:
             logger.error(f"Error getting release-group {mbid}: {e}")
             return None
     
+    def _fetch_pages(self, url: str, params: Dict, list_key: str, count_key: str,
+                     limit: int = 100, max_pages: Optional[int] = None,
+                     max_count: Optional[int] = None) -> Tuple[List[Dict], bool]:
+        """Page through a browse/search endpoint.
+        
+        Returns the collected items and whether every page was fetched. When the
+        first page reports more than max_count items, paging stops there.
+        """
+        items = []
+        offset = 0
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            page_params = dict(params, limit=limit, offset=offset, fmt='json')
+            data = self._get_json(url, page_params) or {}
+            pages += 1
+            
+            batch = data.get(list_key, [])
+            if not batch:
+                return items, True
+            
+            items.extend(batch)
+            
+            count = data.get(count_key)
+            offset += len(batch)
+            if count is None or offset >= count:
+                return items, True
+            if max_count is not None and count > max_count:
+                break
+        return items, False
+    
     def get_artist_release_groups(self, artist_mbid: str, primary_type: str = 'album') -> List[Dict]:
         """Get all release-groups for an artist, optionally filtered by primary type."""
         cache_key = f"{artist_mbid}:{primary_type or 'any'}"
-        if cache_key in self._cache['artist_release_groups']:
-            return self._cache['artist_release_groups'][cache_key]
-        
-        release_groups = []
-        offset = 0
-        limit = 100
+        cached = self._cache_get('artist_release_groups', cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            while True:
+            params = {
+                'artist': artist_mbid,
+                'inc': 'genres+ratings+tags'
+            }
+            if primary_type:
+                params['type'] = primary_type
+            
+            release_groups, _ = self._fetch_pages(
+                f"{self.base_url}/release-group", params, 'release-groups', 'release-group-count'
+            )
+            self._cache_put('artist_release_groups', cache_key, release_groups)
+            source = (artist_mbid, primary_type)
+            for group in release_groups:
+                if group.get('id'):
+                    self._release_group_sources.setdefault(group['id'], source)
+            return release_groups
+        except Exception as e:
+            logger.error(f"Error fetching release-groups for artist {artist_mbid}: {e}")
+            return []
+    
+    def _prime_release_groups(self, group_id: str):
+        """Fill the release-group cache for a group's whole artist listing.
+        
+        The release-group browse endpoint cannot include releases, so the first
+        time a listed group is looked up, the artist's releases are browsed (with
+        their release-group) and grouped locally. Each listing is primed once.
+        The browse reports no per-group release count, so a group's release list
+        is only known to be complete once the browse itself is; catalogs too big
+        to browse cost one extra request and fall back to per-group lookups.
+        """
+        source = self._release_group_sources.get(group_id)
+        if not source:
+            return
+        artist_mbid, primary_type = source
+        with self._release_prime_lock:
+            if source in self._primed_release_sources:
+                return
+            self._primed_release_sources.add(source)
+            release_groups = self._cache_get('artist_release_groups', f"{artist_mbid}:{primary_type or 'any'}")
+            if release_groups is _CACHE_MISS or not release_groups:
+                return
+            try:
                 params = {
                     'artist': artist_mbid,
-                    'limit': limit,
-                    'offset': offset,
-                    'fmt': 'json'
+                    'inc': 'release-groups'
                 }
                 if primary_type:
                     params['type'] = primary_type
                 
-                url = f"{self.base_url}/release-group"
-                response = self._make_api_request(url, params)
-                data = response.json()
-                
-                batch = data.get('release-groups', [])
-                if not batch:
-                    break
+                releases, complete = self._fetch_pages(
+                    f"{self.base_url}/release", params, 'releases', 'release-count',
+                    limit=RELEASE_BROWSE_PAGE_SIZE, max_pages=RELEASE_BROWSE_MAX_PAGES,
+                    max_count=RELEASE_BROWSE_MAX_PAGES * RELEASE_BROWSE_PAGE_SIZE
+                )
+                if not complete:
+                    logger.debug(f"Release catalog for artist {artist_mbid} too large to prime; using per-group lookups")
+                    return
                 
-                release_groups.extend(batch)
+                releases_by_group: Dict[str, List[Dict]] = {}
+                for release in releases:
+                    release_group_id = (release.get('release-group') or {}).get('id')
+                    if release_group_id:
+                        releases_by_group.setdefault(release_group_id, []).append(release)
                 
-                count = data.get('release-group-count')
-                offset += len(batch)
-                if count is None or offset >= count:
-                    break
-            
-            self._cache['artist_release_groups'][cache_key] = release_groups
-            return release_groups
-        except Exception as e:
-            logger.error(f"Error fetching release-groups for artist {artist_mbid}: {e}")
-            return release_groups
+                for group in release_groups:
+                    listed_id = group.get('id')
+                    if (listed_id and listed_id in releases_by_group
+                            and self._cache_get('release_groups', listed_id) is _CACHE_MISS):
+                        self._cache_put('release_groups', listed_id, dict(group, releases=releases_by_group[listed_id]))
+            except Exception as e:
+                logger.debug(f"Could not prefetch releases for artist {artist_mbid}: {e}")
     
     def search_recordings(self, title: str, artist: str = None, album: str = None, artist_mbid: str = None, limit: int = 5) -> List[Dict]:
         """Search for recordings (songs) by title and optionally artist and album.
@@ -402,34 +689,24 @@ class MusicBrainzAPI:
             artist_mbid: Artist MBID (preferred over artist name for accuracy)
             limit: Maximum number of results
         """
+        if artist_mbid:
+            # Exact title/alias hits in an already-built artist index are as
+            # good as the search; anything less definite runs the query below
+            matches = self._match_artist_recordings(title, artist_mbid, album, limit)
+            if matches:
+                return matches
+        
         try:
             url = f"{self.base_url}/recording"
             
-            # Build query - use less strict title matching when we have artist MBID
-            # This helps find recordings that might have slight title variations
-            # Note: When querying /recording endpoint, we don't need 'type:recording'
-            if artist_mbid:
-                # When we have artist MBID, use a more flexible title search
-                # This will match "New Genesis" even if the recording has additional text
-                query_parts = [f'recording:{title}']  # No quotes = partial match
-                query_parts.append(f'arid:{artist_mbid}')
-            else:
-                # Use exact match when we don't have artist MBID
-                query_parts = [f'recording:"{title}"']
-                if artist:
-                    query_parts.append(f'artist:"{artist}"')
-            if album:
-                query_parts.append(f'release:"{album}"')
-            
             params = {
-                'query': ' AND '.join(query_parts),
+                'query': _build_recording_query(title, artist, album, artist_mbid),
                 'limit': limit,
                 'fmt': 'json',
                 'inc': 'artist-credits+aliases+releases'
             }
             
-            response = self._make_api_request(url, params)
-            data = response.json()
+            data = self._get_json(url, params) or {}
             
             return data.get('recordings', [])
             
@@ -437,25 +714,52 @@ class MusicBrainzAPI:
             logger.error(f"Error searching for recording '{title}': {e}")
             return []
 
+    def _match_artist_recordings(self, title: str, artist_mbid: str, album: str = None, limit: int = 5) -> List[Dict]:
+        """Return recordings whose title or an alias exactly matches title, from a cached artist index.
+        
+        The index is never fetched here: it is built lazily by the song sync's
+        artist-wide fallback, so a plain lookup costs only its one search.
+        """
+        recordings = self._cache_get('artist_recordings', f"{artist_mbid}:{ARTIST_RECORDINGS_INDEX_LIMIT}")
+        title_words = _title_words(title)
+        if recordings is _CACHE_MISS or not recordings or not title_words:
+            return []
+        album_words = _title_words(album) if album else ()
+        matches = []
+        for recording in recordings:
+            names = [recording.get('title') or ''] + [a.get('name') or '' for a in recording.get('aliases', [])]
+            if not any(_title_words(name) == title_words for name in names):
+                continue
+            if album_words and not any(
+                _title_contains_words(album_words, release.get('title') or '')
+                for release in recording.get('releases', [])
+            ):
+                continue
+            matches.append(recording)
+            if len(matches) >= limit:
+                break
+        return matches
+    
     def get_artist_recordings(self, artist_mbid: str, limit: int = 100) -> List[Dict]:
         """Return cached recordings for an artist, fetching once when needed."""
         if not artist_mbid:
             return []
         cache_key = f"{artist_mbid}:{limit}"
-        if cache_key in self._cache['artist_recordings']:
-            return self._cache['artist_recordings'][cache_key]
+        cached = self._cache_get('artist_recordings', cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
         try:
             url = f"{self.base_url}/recording"
             params = {
                 'query': f'arid:{artist_mbid}',
-                'limit': limit,
-                'fmt': 'json',
                 'inc': 'artist-credits+aliases+releases'
             }
-            response = self._make_api_request(url, params)
-            data = response.json()
-            recordings = data.get('recordings', [])
-            self._cache['artist_recordings'][cache_key] = recordings
+            page_size = min(limit, 100)
+            recordings, _ = self._fetch_pages(
+                url, params, 'recordings', 'count', limit=page_size, max_pages=-(-limit // page_size)
+            )
+            recordings = recordings[:limit]
+            self._cache_put('artist_recordings', cache_key, recordings)
             return recordings
         except Exception as e:
             logger.error(f"Error fetching recordings for artist {artist_mbid}: {e}")
@@ -463,24 +767,16 @@ class MusicBrainzAPI:
     
     def get_recording(self, mbid: str) -> Optional[Dict]:
         """Get detailed recording information by MBID."""
+        if not _is_valid_mbid(mbid):
+            logger.debug(f"Skipping recording lookup for malformed MBID {mbid!r}")
+            return None
         try:
-            # Check cache first
-            if mbid in self._cache['recordings']:
-                logger.debug(f"Using cached recording data for MBID {mbid}")
-                return self._cache['recordings'][mbid]
-            
             url = f"{self.base_url}/recording/{mbid}"
             params = {
                 'inc': 'artists+releases+release-groups+tags+ratings+isrcs+url-rels+genres+aliases',
                 'fmt': 'json'
             }
-            
-            response = self._make_api_request(url, params)
-            recording = response.json()
-            
-            # Cache the result
-            self._cache['recordings'][mbid] = recording
-            return recording
+            return self._cached('recordings', mbid, lambda: self._get_json(url, params))
             
         except Exception as e:
             logger.error(f"Error getting recording {mbid}: {e}")
@@ -497,19 +793,25 @@ class MusicBrainzAPI:
             if not isrc:
                 return None
             
+            isrc = isrc.replace('-', '').strip().upper()
+            if not _ISRC_RE.fullmatch(isrc):
+                logger.debug(f"Skipping lookup for malformed ISRC {isrc!r}")
+                return None
+            
             url = f"{self.base_url}/isrc/{isrc}"
             params = {
                 'inc': 'artists+releases+release-groups+artist-credits+aliases+genres+tags',
                 'fmt': 'json'
             }
             
-            # Use max_retries=0 since 404 is a valid response (ISRC doesn't exist)
-            response = self._make_api_request(url, params, max_retries=0)
-            data = response.json()
+            def fetch():
+                data = self._get_json(url, params)
+                # ISRC lookup returns a recording directly (not a list)
+                return data if data and 'id' in data else None
             
-            # ISRC lookup returns a recording directly (not a list)
-            if data and 'id' in data:
-                logger.info(f"Found recording via ISRC {isrc}: {data.get('title')} by {data.get('artist-credit', [{}])[0].get('name')}")
+            data = self._cached('isrc', isrc, fetch)
+            if data:
+                logger.info("Found recording via ISRC %s: %s by %s", isrc, data.get('title'), (data.get('artist-credit') or [{}])[0].get('name', ''))
                 return data
             
             logger.debug(f"No recording found for ISRC {isrc}")
@@ -532,20 +834,19 @@ class MusicBrainzAPI:
             
             url = f"{self.base_url}/release"
             params = {
-                'query': f'barcode:{barcode}',
+                'query': f'barcode:{_mb_escape(barcode, quote=False)}',
                 'fmt': 'json',
                 'limit': 5
             }
             
-            # Use max_retries=0 since 404 is a valid response (barcode doesn't exist)
-            response = self._make_api_request(url, params, max_retries=0)
-            data = response.json()
+            def fetch():
+                releases = (self._get_json(url, params) or {}).get('releases', [])
+                # Keep the first (best) match
+                return releases[0] if releases else None
             
-            releases = data.get('releases', [])
-            if releases:
-                # Return the first (best) match
-                release = releases[0]
-                logger.info(f"Found release via barcode {barcode}: {release.get('title')} by {release.get('artist-credit', [{}])[0].get('name')}")
+            release = self._cached('barcode', barcode, fetch)
+            if release:
+                logger.info("Found release via barcode %s: %s by %s", barcode, release.get('title'), (release.get('artist-credit') or [{}])[0].get('name', ''))
                 return release
             
             logger.debug(f"No release found for barcode {barcode}")
@@ -568,19 +869,18 @@ class MusicBrainzAPI:
             spotify_url = f"https://open.spotify.com/artist/{spotify_id}"
             url = f"{self.base_url}/artist"
             params = {
-                'query': f'url:"{spotify_url}"',
+                'query': f'url:{_mb_escape(spotify_url)}',
                 'fmt': 'json',
                 'limit': 5
             }
             
-            # Use max_retries=0 since no match is a valid response
-            response = self._make_api_request(url, params, max_retries=0)
-            data = response.json()
+            def fetch():
+                artists = (self._get_json(url, params) or {}).get('artists', [])
+                # Keep the first (best) match
+                return artists[0] if artists else None
             
-            artists = data.get('artists', [])
-            if artists:
-                # Return the first (best) match
-                artist = artists[0]
+            artist = self._cached('artists_by_spotify_id', spotify_id, fetch)
+            if artist:
                 logger.info(f"Found artist via Spotify ID {spotify_id}: {artist.get('name')}")
                 return artist
             
@@ -593,39 +893,60 @@ class MusicBrainzAPI:
     
     def get_cover_art_url(self, release_mbid: str) -> Optional[str]:
         """Get cover art URL from Cover Art Archive."""
+        if not _is_valid_mbid(release_mbid):
+            return None
         try:
             # Check cache first
-            if release_mbid in self._cache['cover_art']:
+            cached = self._cache_get('cover_art', release_mbid)
+            if cached is not _CACHE_MISS:
                 logger.debug(f"Using cached cover art URL for release {release_mbid}")
-                return self._cache['cover_art'][release_mbid]
+                return cached
             
-            # Cover Art Archive API
-            url = f"https://coverartarchive.org/release/{release_mbid}"
+            # The /front endpoint redirects straight to the image, so a HEAD
+            # gives us the URL without fetching the full JSON image index
+            url = f"https://coverartarchive.org/release/{release_mbid}/front"
             
-            response = self._make_api_request(url, max_retries=0)
-            data = response.json()
-            
-            # Get front cover image
-            images = data.get('images', [])
-            front_cover = next((img for img in images if img.get('front', False)), None)
-            
-            if front_cover:
-                cover_url = front_cover.get('image')
-                # Cache the result
-                self._cache['cover_art'][release_mbid] = cover_url
-                return cover_url
+            response = self.session.head(url, allow_redirects=False, timeout=COVER_ART_TIMEOUT)
+            cover_url = None
+            if response.is_redirect:
+                cover_url = response.headers.get('Location')
+            elif response.status_code != 404:
+                response.raise_for_status()
             
-            # Cache negative result to avoid repeated 404s
-            self._cache['cover_art'][release_mbid] = None
-            return None
+            # Cache the result; a 404 means the release has no front cover
+            self._cache_put('cover_art', release_mbid, cover_url)
+            return cover_url
             
         except Exception as e:
             logger.debug(f"No cover art found for release {release_mbid}: {e}")
-            self._cache['cover_art'][release_mbid] = None
+            self._cache_put('cover_art', release_mbid, None)
             return None
     
+    def prefetch_cover_art_url(self, release_mbid: str) -> Future:
+        """Start a Cover Art Archive lookup in the background and return its future.
+        
+        A lookup already in flight for the same release is shared rather than repeated.
+        """
+        with self._cover_art_lock:
+            future = self._cover_art_futures.get(release_mbid)
+            if future is None:
+                future = self._cover_art_executor.submit(self.get_cover_art_url, release_mbid)
+                self._cover_art_futures[release_mbid] = future
+                future.add_done_callback(lambda _: self._cover_art_futures.pop(release_mbid, None))
+        return future
+    
     def _get_spotify_access_token(self) -> Optional[str]:
-        """Get Spotify access token using client credentials flow."""
+        """Get Spotify access token using client credentials flow, reusing it until it expires."""
+        if self._spotify_token and time.monotonic() < self._spotify_token_expiry:
+            return self._spotify_token
+        with self._spotify_token_lock:
+            # Another thread may have refreshed the token while we waited
+            if self._spotify_token and time.monotonic() < self._spotify_token_expiry:
+                return self._spotify_token
+            return self._request_spotify_access_token()
+    
+    def _request_spotify_access_token(self) -> Optional[str]:
+        """Exchange the client credentials for a new Spotify access token."""
         try:
             client_id = os.getenv('SPOTIFY_CLIENT_ID')
             client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
@@ -643,17 +964,22 @@ class MusicBrainzAPI:
                 'grant_type': 'client_credentials'
             }
             
-            response = requests.post(
+            response = self._spotify_request(
+                'POST',
                 url, 
                 headers=headers, 
                 data=data,
-                auth=(client_id, client_secret),
-                timeout=10
+                auth=(client_id, client_secret)
             )
             
             if response.status_code == 200:
-                token_data = response.json()
-                return token_data.get('access_token')
+                token_data = _decode_json(response)
+                self._spotify_token = token_data.get('access_token')
+                # Refresh a little early so a token never expires mid-request
+                self._spotify_token_expiry = (
+                    time.monotonic() + token_data.get('expires_in', 3600) - SPOTIFY_TOKEN_REFRESH_MARGIN
+                )
+                return self._spotify_token
             else:
                 logger.debug(f"Spotify token request failed with status {response.status_code}")
                 return None
@@ -662,179 +988,135 @@ class MusicBrainzAPI:
             logger.debug(f"Error getting Spotify access token: {e}")
             return None
     
-    def _get_spotify_album_url(self, album_title: str, artist_name: str = None) -> Optional[str]:
-        """Get Spotify album URL by searching Spotify API."""
-        try:
-            # Get access token
+    def _spotify_request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        """Send a paced Spotify request, retrying 429s after Retry-After and 5xx with backoff.
+        
+        Each attempt takes a rate-limit token; a small jitter keeps concurrent
+        callers from retrying in lockstep.
+        """
+        kwargs.setdefault('timeout', 10)
+        for attempt in range(max_retries + 1):
+            self._spotify_rate_limit()
+            response = self.spotify_session.request(method, url, **kwargs)
+            if attempt == max_retries:
+                break
+            if response.status_code == 429:
+                try:
+                    delay = float(response.headers.get('Retry-After', 1))
+                except ValueError:
+                    delay = 1.0
+            elif response.status_code >= 500:
+                delay = 2 ** attempt * 0.5
+            else:
+                break
+            delay += random.uniform(0, 0.25)
+            logger.debug(f"Spotify returned {response.status_code}; retrying in {delay:.2f}s")
+            time.sleep(delay)
+        return response
+    
+    def _spotify_get_json(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """GET a Spotify API endpoint and return its JSON body, or None on failure.
+        
+        A 404 returns an empty dict so callers can tell a genuine miss (safe to
+        cache) from a transient failure. A rejected (401) token is dropped and the
+        request retried once with a fresh one.
+        """
+        for _ in range(2):
             access_token = self._get_spotify_access_token()
             if not access_token:
                 return None
             
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for album
-            url = "https://api.spotify.com/v1/search"
             headers = {
                 'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json'
             }
-            
-            # Build query: album title and optionally artist name
-            if artist_name:
-                query = f'album:"{album_title}" artist:"{artist_name}"'
-            else:
-                query = f'album:"{album_title}"'
-            
-            params = {
-                'q': query,
-                'type': 'album',
-                'limit': 1
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('albums') and 
-                    data['albums'].get('items') and 
-                    len(data['albums']['items']) > 0):
-                    album = data['albums']['items'][0]
-                    
-                    # Get the Spotify external URL
-                    if album.get('external_urls') and album['external_urls'].get('spotify'):
-                        return album['external_urls']['spotify']
-                    else:
-                        logger.debug(f"Spotify album {album_title} has no external URL")
-                else:
-                    logger.debug(f"Spotify search returned no results for album {album_title}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for album {album_title}")
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error fetching Spotify album URL: {e}")
+            response = self._spotify_request('GET', url, headers=headers, params=params)
+            if response.status_code != 401:
+                break
+            logger.debug("Spotify access token expired or invalid")
+            self._spotify_token = None
+        
+        if response.status_code == 404:
+            return {}
+        if response.status_code != 200:
+            logger.debug(f"Spotify API returned status {response.status_code} for {url}")
             return None
+        return _decode_json(response)
     
-    def _get_spotify_album_image(self, album_title: str, artist_name: str = None) -> Optional[str]:
-        """Get album cover image URL from Spotify API."""
+    def _spotify_search(self, kind: str, title: str, artist: Optional[str] = None, limit: int = 1) -> Optional[Dict]:
+        """Search Spotify for an album or track and return the first result.
+        
+        Results (including misses) are cached per (kind, title, artist), so the
+        same search made for different fields is only sent once.
+        """
+        cache_key = (kind, title.lower(), (artist or '').lower())
+        cached = self._cache_get('spotify_search', cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        
         try:
-            # Get access token
-            access_token = self._get_spotify_access_token()
-            if not access_token:
-                return None
-            
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for album
-            url = "https://api.spotify.com/v1/search"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Build query: album title and optionally artist name
-            if artist_name:
-                query = f'album:"{album_title}" artist:"{artist_name}"'
+            # Build query: title and optionally artist name
+            if artist:
+                query = f'{kind}:"{title}" artist:"{artist}"'
             else:
-                query = f'album:"{album_title}"'
+                query = f'{kind}:"{title}"'
             
             params = {
                 'q': query,
-                'type': 'album',
-                'limit': 1
+                'type': kind,
+                'limit': limit
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('albums') and 
-                    data['albums'].get('items') and 
-                    len(data['albums']['items']) > 0):
-                    album = data['albums']['items'][0]
-                    
-                    # Spotify returns images in an array, sorted by size (largest first)
-                    if album.get('images') and len(album['images']) > 0:
-                        # Get the first (largest) image
-                        image = album['images'][0]
-                        if image.get('url'):
-                            return image['url']
-                    else:
-                        logger.debug(f"Spotify album {album_title} has no images")
-                else:
-                    logger.debug(f"Spotify search returned no results for album {album_title}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for album {album_title}")
+            data = self._spotify_get_json("https://api.spotify.com/v1/search", params)
+            if data is None:
+                return None
             
-            return None
+            items = (data.get(f'{kind}s') or {}).get('items') or []
+            result = items[0] if items else None
+            if not result:
+                logger.debug(f"Spotify search returned no results for {kind} {title}")
+            self._cache_put('spotify_search', cache_key, result)
+            return result
             
         except Exception as e:
-            logger.debug(f"Error fetching Spotify album image: {e}")
+            logger.debug(f"Error searching Spotify for {kind} {title}: {e}")
             return None
     
+    def _get_spotify_album_info(self, album_title: str, artist_name: str = None) -> Tuple[Optional[str], Optional[str]]:
+        """Search Spotify once for an album and return its (url, image_url)."""
+        album = self._spotify_search('album', album_title, artist_name)
+        if not album:
+            return None, None
+        
+        # Spotify returns images in an array, sorted by size (largest first)
+        album_url = (album.get('external_urls') or {}).get('spotify')
+        images = album.get('images') or []
+        image_url = images[0].get('url') if images else None
+        if not album_url:
+            logger.debug(f"Spotify album {album_title} has no external URL")
+        if not image_url:
+            logger.debug(f"Spotify album {album_title} has no images")
+        return album_url, image_url
+    
+    def _get_spotify_album_url(self, album_title: str, artist_name: str = None) -> Optional[str]:
+        """Get Spotify album URL by searching Spotify API."""
+        return self._get_spotify_album_info(album_title, artist_name)[0]
+    
+    def _get_spotify_album_image(self, album_title: str, artist_name: str = None) -> Optional[str]:
+        """Get album cover image URL from Spotify API."""
+        return self._get_spotify_album_info(album_title, artist_name)[1]
+    
     def _get_spotify_track_url(self, track_title: str, artist_name: str = None) -> Optional[str]:
         """Get Spotify track URL by searching Spotify API."""
-        try:
-            # Get access token
-            access_token = self._get_spotify_access_token()
-            if not access_token:
-                return None
-            
-            # Rate limit: Spotify allows many requests, but we'll be conservative
-            time.sleep(0.1)  # 100ms delay
-            
-            # Search for track
-            url = "https://api.spotify.com/v1/search"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Build query: track title and optionally artist name
-            if artist_name:
-                query = f'track:"{track_title}" artist:"{artist_name}"'
-            else:
-                query = f'track:"{track_title}"'
-            
-            params = {
-                'q': query,
-                'type': 'track',
-                'limit': 1
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if (data.get('tracks') and 
-                    data['tracks'].get('items') and 
-                    len(data['tracks']['items']) > 0):
-                    track = data['tracks']['items'][0]
-                    
-                    # Get the Spotify external URL
-                    if track.get('external_urls') and track['external_urls'].get('spotify'):
-                        return track['external_urls']['spotify']
-                    else:
-                        logger.debug(f"Spotify track {track_title} has no external URL")
-                else:
-                    logger.debug(f"Spotify search returned no results for track {track_title}")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid")
-            else:
-                logger.debug(f"Spotify API returned status {response.status_code} for track {track_title}")
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error fetching Spotify track URL: {e}")
+        track = self._spotify_search('track', track_title, artist_name)
+        if not track:
             return None
+        
+        # Get the Spotify external URL
+        track_url = (track.get('external_urls') or {}).get('spotify')
+        if not track_url:
+            logger.debug(f"Spotify track {track_title} has no external URL")
+        return track_url
     
     def _extract_spotify_artist_id(self, artist_data: Optional[Dict]) -> Optional[str]:
         """Extract Spotify artist ID from MusicBrainz relations."""
@@ -848,16 +1130,9 @@ class MusicBrainzAPI:
             url = (relation.get('url') or {}).get('resource') or ''
             if not url:
                 continue
-            lowercase = url.lower()
-            if 'open.spotify.com/artist/' in lowercase:
-                parsed = urlparse(url)
-                path = parsed.path or ''
-                segments = [segment for segment in path.split('/') if segment]
-                if len(segments) >= 2 and segments[0] == 'artist':
-                    spotify_id = segments[1]
-                    return spotify_id
-            elif lowercase.startswith('spotify:artist:'):
-                return url.split(':')[-1]
+            match = _SPOTIFY_ARTIST_ID_RE.search(url)
+            if match:
+                return match.group(1)
         return None
     
     def _get_spotify_artist_image(self, artist_name: str, artist_mbid: str = None, spotify_artist_id: Optional[str] = None) -> Optional[str]:
@@ -867,39 +1142,19 @@ class MusicBrainzAPI:
             return None
         
         try:
-            access_token = self._get_spotify_access_token()
-            if not access_token:
+            data = self._get_spotify_artist_by_id(spotify_artist_id)
+            if data is None:
                 return None
             
-            time.sleep(0.1)  # stay polite
-            
-            url = f"https://api.spotify.com/v1/artists/{spotify_artist_id}"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                images = data.get('images') or []
-                if images:
-                    image = images[0]
-                    if image.get('url'):
-                        logger.info(f"Using Spotify image for %s via artist ID %s", artist_name, spotify_artist_id)
-                        return image['url']
-                    logger.debug(f"Spotify artist {artist_name} returned image payload without URL")
-                else:
-                    logger.debug(f"Spotify artist {artist_name} (ID {spotify_artist_id}) has no images")
-            elif response.status_code == 401:
-                logger.debug("Spotify access token expired or invalid while fetching artist %s", artist_name)
+            images = data.get('images') or []
+            if images:
+                image = images[0]
+                if image.get('url'):
+                    logger.info(f"Using Spotify image for %s via artist ID %s", artist_name, spotify_artist_id)
+                    return image['url']
+                logger.debug(f"Spotify artist {artist_name} returned image payload without URL")
             else:
-                logger.debug(
-                    "Spotify API returned status %s for artist %s (ID %s)",
-                    response.status_code,
-                    artist_name,
-                    spotify_artist_id
-                )
+                logger.debug(f"Spotify artist {artist_name} (ID {spotify_artist_id}) has no images")
             return None
         except Exception as e:
             logger.debug(f"Error fetching Spotify image for {artist_name}: {e}")
@@ -942,41 +1197,31 @@ class MusicBrainzAPI:
         
         Returns: {"type": "track"|"album"|"artist", "id": "spotify_id"} or None
         """
-        import re
-        
-        if not url:
+        if not url or 'spotify' not in url:
             return None
         
-        # Pattern for https://open.spotify.com/{type}/{id}
-        web_pattern = r'https?://open\.spotify\.com/(track|album|artist)/([a-zA-Z0-9]+)'
-        web_match = re.search(web_pattern, url)
-        if web_match:
-            return {"type": web_match.group(1), "id": web_match.group(2)}
-        
-        # Pattern for spotify:{type}:{id}
-        uri_pattern = r'spotify:(track|album|artist):([a-zA-Z0-9]+)'
-        uri_match = re.search(uri_pattern, url)
-        if uri_match:
-            return {"type": uri_match.group(1), "id": uri_match.group(2)}
+        parsed = _match_spotify_url(url)
+        if parsed:
+            return {"type": parsed[0], "id": parsed[1]}
         
         logger.warning(f"Unable to parse Spotify URL: {url}")
         return None
     
     def _get_spotify_track_by_id(self, track_id: str) -> Optional[Dict]:
         """Fetch full track metadata from Spotify API by ID."""
-        access_token = self._get_spotify_access_token()
-        if not access_token:
-            return None
-        
-        url = f"https://api.spotify.com/v1/tracks/{track_id}"
-        headers = {"Authorization": f"Bearer {access_token}"}
+        cached = self._cache_get('spotify_tracks', track_id)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            response = self._make_api_request(url, headers=headers, max_retries=1)
-            data = response.json()
+            data = self._spotify_get_json(f"https://api.spotify.com/v1/tracks/{track_id}")
             if data and data.get("id"):
-                logger.info(f"Fetched Spotify track: {data.get('name')} by {data.get('artists', [{}])[0].get('name')}")
+                logger.info("Fetched Spotify track: %s by %s", data.get('name'), (data.get('artists') or [{}])[0].get('name', ''))
+                self._cache_put('spotify_tracks', track_id, data)
                 return data
+            if data is not None:
+                # Remember IDs Spotify doesn't know so later lookups skip the request
+                self._cache_put('spotify_tracks', track_id, None)
         except Exception as e:
             logger.warning(f"Error fetching Spotify track {track_id}: {e}")
         
@@ -984,19 +1229,19 @@ class MusicBrainzAPI:
     
     def _get_spotify_album_by_id(self, album_id: str) -> Optional[Dict]:
         """Fetch full album metadata from Spotify API by ID."""
-        access_token = self._get_spotify_access_token()
-        if not access_token:
-            return None
-        
-        url = f"https://api.spotify.com/v1/albums/{album_id}"
-        headers = {"Authorization": f"Bearer {access_token}"}
+        cached = self._cache_get('spotify_albums', album_id)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            response = self._make_api_request(url, headers=headers, max_retries=1)
-            data = response.json()
+            data = self._spotify_get_json(f"https://api.spotify.com/v1/albums/{album_id}")
             if data and data.get("id"):
-                logger.info(f"Fetched Spotify album: {data.get('name')} by {data.get('artists', [{}])[0].get('name')}")
+                logger.info("Fetched Spotify album: %s by %s", data.get('name'), (data.get('artists') or [{}])[0].get('name', ''))
+                self._cache_put('spotify_albums', album_id, data)
                 return data
+            if data is not None:
+                # Remember IDs Spotify doesn't know so later lookups skip the request
+                self._cache_put('spotify_albums', album_id, None)
         except Exception as e:
             logger.warning(f"Error fetching Spotify album {album_id}: {e}")
         
@@ -1004,24 +1249,76 @@ class MusicBrainzAPI:
     
     def _get_spotify_artist_by_id(self, artist_id: str) -> Optional[Dict]:
         """Fetch full artist metadata from Spotify API by ID."""
-        access_token = self._get_spotify_access_token()
-        if not access_token:
-            return None
-        
-        url = f"https://api.spotify.com/v1/artists/{artist_id}"
-        headers = {"Authorization": f"Bearer {access_token}"}
+        cached = self._cache_get('spotify_artists', artist_id)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            response = self._make_api_request(url, headers=headers, max_retries=1)
-            data = response.json()
+            data = self._spotify_get_json(f"https://api.spotify.com/v1/artists/{artist_id}")
             if data and data.get("id"):
                 logger.info(f"Fetched Spotify artist: {data.get('name')}")
+                self._cache_put('spotify_artists', artist_id, data)
                 return data
+            if data is not None:
+                # Remember IDs Spotify doesn't know so later lookups skip the request
+                self._cache_put('spotify_artists', artist_id, None)
         except Exception as e:
             logger.warning(f"Error fetching Spotify artist {artist_id}: {e}")
         
         return None
     
+    def _get_spotify_batch(self, kind: str, ids: List[str], chunk_size: int) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch several Spotify objects of one kind via the multi-ID endpoint.
+        
+        Cached IDs are served from the by-ID cache; the rest are requested in
+        chunks of ``chunk_size`` and cached individually, so later single-ID
+        lookups hit the cache too.
+        
+        Returns: {spotify_id: data or None}
+        """
+        cache_kind = f"spotify_{kind}s"
+        results: Dict[str, Optional[Dict]] = {}
+        missing: List[str] = []
+        for spotify_id in dict.fromkeys(i for i in ids if i):
+            cached = self._cache_get(cache_kind, spotify_id)
+            if cached is _CACHE_MISS:
+                missing.append(spotify_id)
+            else:
+                results[spotify_id] = cached
+        
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
+            try:
+                data = self._spotify_get_json(
+                    f"https://api.spotify.com/v1/{kind}s", {'ids': ','.join(chunk)}
+                )
+                if data is None:
+                    continue
+                # Spotify returns items in request order, with null for unknown IDs
+                items = data.get(f"{kind}s") or []
+                for spotify_id, item in zip(chunk, items):
+                    item = item if item and item.get("id") else None
+                    self._cache_put(cache_kind, spotify_id, item)
+                    results[spotify_id] = item
+                logger.debug(f"Fetched {len(items)} Spotify {kind}s in one request")
+            except Exception as e:
+                logger.warning(f"Error fetching Spotify {kind}s {','.join(chunk)}: {e}")
+        
+        return results
+    
+    def _get_spotify_tracks_batch(self, ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch up to 50 Spotify tracks per request."""
+        return self._get_spotify_batch('track', ids, 50)
+    
+    def _get_spotify_albums_batch(self, ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch up to 20 Spotify albums per request."""
+        return self._get_spotify_batch('album', ids, 20)
+    
+    def _get_spotify_artists_batch(self, ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch up to 50 Spotify artists per request."""
+        return self._get_spotify_batch('artist', ids, 50)
+    
     def _extract_external_ids(self, spotify_data: Dict) -> Dict[str, Optional[str]]:
         """
         Extract external IDs (ISRC, UPC, EAN) from Spotify response.
@@ -1046,12 +1343,13 @@ class MusicBrainzAPI:
         
         return external_ids
     
-    def _extract_spotify_genres(self, spotify_data: Dict, entity_type: str) -> List[str]:
+    def _extract_spotify_genres(self, spotify_data: Union[Dict, List[Dict]], entity_type: str) -> List[str]:
         """
         Extract genres from Spotify album or artist data.
         
         Args:
-            spotify_data: Spotify API response for album or artist
+            spotify_data: Spotify API response for album or artist, or a track
+                response (or list of track responses) when entity_type is 'track'
             entity_type: 'album', 'artist', or 'track'
         
         Returns:
@@ -1064,17 +1362,23 @@ class MusicBrainzAPI:
         elif entity_type == 'artist' and spotify_data.get('genres'):
             genres.extend(spotify_data['genres'])
         elif entity_type == 'track':
-            # Tracks don't have genres directly; get from album and artist
-            album_data = spotify_data.get('album', {})
-            if album_data.get('id'):
-                full_album = self._get_spotify_album_by_id(album_data['id'])
+            # Tracks don't have genres directly; get them from each track's album
+            # and first artist, fetching all albums and artists in batches; the
+            # artist batch runs in the background while the albums are fetched
+            tracks = spotify_data if isinstance(spotify_data, list) else [spotify_data]
+            album_ids = [(t.get('album') or {}).get('id') for t in tracks]
+            artist_ids = [(t.get('artists') or [{}])[0].get('id') for t in tracks]
+            
+            artists_future = self._aux_executor.submit(self._get_spotify_artists_batch, artist_ids)
+            albums = self._get_spotify_albums_batch(album_ids)
+            artists = artists_future.result()
+            
+            for spotify_id in dict.fromkeys(album_ids):
+                full_album = albums.get(spotify_id)
                 if full_album and full_album.get('genres'):
                     genres.extend(full_album['genres'])
-            
-            # Also get from first artist
-            artists = spotify_data.get('artists', [])
-            if artists and artists[0].get('id'):
-                artist_data = self._get_spotify_artist_by_id(artists[0]['id'])
+            for spotify_id in dict.fromkeys(artist_ids):
+                artist_data = artists.get(spotify_id)
                 if artist_data and artist_data.get('genres'):
                     genres.extend(artist_data['genres'])
         
@@ -1090,8 +1394,7 @@ class MusicBrainzAPI:
                 'fmt': 'json'
             }
             
-            response = self._make_api_request(url, params)
-            data = response.json()
+            data = self._get_json(url, params) or {}
             
             return data.get('labels', [])
             
@@ -1101,39 +1404,164 @@ class MusicBrainzAPI:
     
     def get_label(self, mbid: str) -> Optional[Dict]:
         """Get detailed label information by MBID."""
+        if not _is_valid_mbid(mbid):
+            logger.debug(f"Skipping label lookup for malformed MBID {mbid!r}")
+            return None
         try:
-            # Check cache first
-            if mbid in self._cache['labels']:
-                logger.debug(f"Using cached label data for MBID {mbid}")
-                return self._cache['labels'][mbid]
-            
             url = f"{self.base_url}/label/{mbid}"
             params = {
                 'inc': 'aliases+tags+ratings+url-rels+area-rels+genres',
                 'fmt': 'json'
             }
-            
-            response = self._make_api_request(url, params)
-            label = response.json()
-            
-            # Cache the result
-            self._cache['labels'][mbid] = label
-            return label
+            return self._cached('labels', mbid, lambda: self._get_json(url, params))
             
         except Exception as e:
             logger.error(f"Error getting label {mbid}: {e}")
             return None
 
 
+# Property-ID maps for each database; the DNS property has no fixed ID and is
+# looked up in the fetched schema
+_ARTISTS_PROPERTIES_TEMPLATE = {
+    'title': ARTISTS_TITLE_PROPERTY_ID,
+    'musicbrainz_id': ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID,
+    'sort_name': ARTISTS_SORT_NAME_PROPERTY_ID,
+    'type': ARTISTS_TYPE_PROPERTY_ID,
+    'gender': ARTISTS_GENDER_PROPERTY_ID,
+    'area': ARTISTS_AREA_PROPERTY_ID,
+    'born_in': ARTISTS_BORN_IN_PROPERTY_ID,
+    'ig_link': ARTISTS_IG_LINK_PROPERTY_ID,
+    'website_link': ARTISTS_WEBSITE_LINK_PROPERTY_ID,
+    'youtube_link': ARTISTS_YOUTUBE_LINK_PROPERTY_ID,
+    'bandcamp_link': ARTISTS_BANDCAMP_LINK_PROPERTY_ID,
+    'streaming_link': ARTISTS_STREAMING_LINK_PROPERTY_ID,
+    'country': ARTISTS_COUNTRY_PROPERTY_ID,
+    'begin_date': ARTISTS_BEGIN_DATE_PROPERTY_ID,
+    'end_date': ARTISTS_END_DATE_PROPERTY_ID,
+    'disambiguation': ARTISTS_DISAMBIGUATION_PROPERTY_ID,
+    'description': ARTISTS_DESCRIPTION_PROPERTY_ID,
+    'genres': ARTISTS_GENRES_PROPERTY_ID,
+    'tags': ARTISTS_TAGS_PROPERTY_ID,
+    'rating': ARTISTS_RATING_PROPERTY_ID,
+    'last_updated': ARTISTS_LAST_UPDATED_PROPERTY_ID,
+    'musicbrainz_url': ARTISTS_MUSICBRAINZ_URL_PROPERTY_ID,
+}
+
+_ALBUMS_PROPERTIES_TEMPLATE = {
+    'title': ALBUMS_TITLE_PROPERTY_ID,
+    'musicbrainz_id': ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID,
+    'artist': ALBUMS_ARTIST_PROPERTY_ID,
+    'release_date': ALBUMS_RELEASE_DATE_PROPERTY_ID,
+    'country': ALBUMS_COUNTRY_PROPERTY_ID,
+    'label': ALBUMS_LABEL_PROPERTY_ID,
+    'type': ALBUMS_TYPE_PROPERTY_ID,
+    'listen': ALBUMS_LISTEN_PROPERTY_ID,
+    'status': ALBUMS_STATUS_PROPERTY_ID,
+    'packaging': ALBUMS_PACKAGING_PROPERTY_ID,
+    'barcode': ALBUMS_BARCODE_PROPERTY_ID,
+    'format': ALBUMS_FORMAT_PROPERTY_ID,
+    'track_count': ALBUMS_TRACK_COUNT_PROPERTY_ID,
+    'description': ALBUMS_DESCRIPTION_PROPERTY_ID,
+    'genres': ALBUMS_GENRES_PROPERTY_ID,
+    'tags': ALBUMS_TAGS_PROPERTY_ID,
+    'rating': ALBUMS_RATING_PROPERTY_ID,
+    'cover_image': ALBUMS_COVER_IMAGE_PROPERTY_ID,
+    'musicbrainz_url': ALBUMS_MUSICBRAINZ_URL_PROPERTY_ID,
+    'last_updated': ALBUMS_LAST_UPDATED_PROPERTY_ID,
+    'discs': ALBUMS_DISCS_PROPERTY_ID,
+    'songs': ALBUMS_SONGS_PROPERTY_ID,
+}
+
+_SONGS_PROPERTIES_TEMPLATE = {
+    'title': SONGS_TITLE_PROPERTY_ID,
+    'musicbrainz_id': SONGS_MUSICBRAINZ_ID_PROPERTY_ID,
+    'artist': SONGS_ARTIST_PROPERTY_ID,
+    'album': SONGS_ALBUM_PROPERTY_ID,
+    'track_number': SONGS_TRACK_NUMBER_PROPERTY_ID,
+    'length': SONGS_LENGTH_PROPERTY_ID,
+    'isrc': SONGS_ISRC_PROPERTY_ID,
+    'disambiguation': SONGS_DISAMBIGUATION_PROPERTY_ID,
+    'description': SONGS_DESCRIPTION_PROPERTY_ID,
+    'genres': SONGS_GENRES_PROPERTY_ID,
+    'tags': SONGS_TAGS_PROPERTY_ID,
+    'listen': SONGS_LISTEN_PROPERTY_ID,
+    'rating': SONGS_RATING_PROPERTY_ID,
+    'musicbrainz_url': SONGS_MUSICBRAINZ_URL_PROPERTY_ID,
+    'last_updated': SONGS_LAST_UPDATED_PROPERTY_ID,
+    'disc': SONGS_DISC_PROPERTY_ID,
+}
+
+_LABELS_PROPERTIES_TEMPLATE = {
+    'title': LABELS_TITLE_PROPERTY_ID,
+    'musicbrainz_id': LABELS_MUSICBRAINZ_ID_PROPERTY_ID,
+    'type': LABELS_TYPE_PROPERTY_ID,
+    'country': LABELS_COUNTRY_PROPERTY_ID,
+    'begin_date': LABELS_BEGIN_DATE_PROPERTY_ID,
+    'end_date': LABELS_END_DATE_PROPERTY_ID,
+    'disambiguation': LABELS_DISAMBIGUATION_PROPERTY_ID,
+    'description': LABELS_DESCRIPTION_PROPERTY_ID,
+    'genres': LABELS_GENRES_PROPERTY_ID,
+    'tags': LABELS_TAGS_PROPERTY_ID,
+    'rating': LABELS_RATING_PROPERTY_ID,
+    'last_updated': LABELS_LAST_UPDATED_PROPERTY_ID,
+    'musicbrainz_url': LABELS_MUSICBRAINZ_URL_PROPERTY_ID,
+    'official_website': LABELS_OFFICIAL_WEBSITE_PROPERTY_ID,
+    'ig': LABELS_IG_PROPERTY_ID,
+    'bandcamp': LABELS_BANDCAMP_PROPERTY_ID,
+    'founded': LABELS_FOUNDED_PROPERTY_ID,
+    'albums': LABELS_ALBUMS_PROPERTY_ID,
+    'area': LABELS_AREA_PROPERTY_ID,
+}
+
+
+def _lazy_schema_attr(database: str, name: str) -> property:
+    """Property whose first read loads ``database``'s schema and MBID cache."""
+    def getter(self):
+        self._ensure_schema_loaded(database)
+        return self._schema_state[name]
+    
+    def setter(self, value):
+        self._schema_state[name] = value
+    
+    return property(getter, setter)
+
+
 class NotionMusicBrainzSync:
     """Main class for synchronizing Notion databases with MusicBrainz data."""
     
+    # database -> (MBID cache attribute, entity name used in log messages, property-ID template)
+    _SCHEMA_DATABASES = {
+        'artists': ('_artist_mbid_map', 'artist', _ARTISTS_PROPERTIES_TEMPLATE),
+        'albums': ('_album_mbid_map', 'album', _ALBUMS_PROPERTIES_TEMPLATE),
+        'songs': ('_song_mbid_map', 'song', _SONGS_PROPERTIES_TEMPLATE),
+        'labels': ('_label_mbid_map', 'label', _LABELS_PROPERTIES_TEMPLATE),
+    }
+    
+    _PROPERTY_KEY_MAPS = {database: f'{database}_property_id_to_key' for database in _SCHEMA_DATABASES}
+    
+    artists_properties = _lazy_schema_attr('artists', 'artists_properties')
+    artists_property_id_to_key = _lazy_schema_attr('artists', 'artists_property_id_to_key')
+    artists_property_keys = _lazy_schema_attr('artists', 'artists_property_keys')
+    _artist_mbid_map = _lazy_schema_attr('artists', '_artist_mbid_map')
+    albums_properties = _lazy_schema_attr('albums', 'albums_properties')
+    albums_property_id_to_key = _lazy_schema_attr('albums', 'albums_property_id_to_key')
+    albums_property_keys = _lazy_schema_attr('albums', 'albums_property_keys')
+    _album_mbid_map = _lazy_schema_attr('albums', '_album_mbid_map')
+    songs_properties = _lazy_schema_attr('songs', 'songs_properties')
+    songs_property_id_to_key = _lazy_schema_attr('songs', 'songs_property_id_to_key')
+    songs_property_keys = _lazy_schema_attr('songs', 'songs_property_keys')
+    _song_mbid_map = _lazy_schema_attr('songs', '_song_mbid_map')
+    labels_properties = _lazy_schema_attr('labels', 'labels_properties')
+    labels_property_id_to_key = _lazy_schema_attr('labels', 'labels_property_id_to_key')
+    labels_property_keys = _lazy_schema_attr('labels', 'labels_property_keys')
+    _label_mbid_map = _lazy_schema_attr('labels', '_label_mbid_map')
+    
     def __init__(self, notion_token: str, musicbrainz_user_agent: str,
                  artists_db_id: Optional[str] = None,
                  albums_db_id: Optional[str] = None,
                  songs_db_id: Optional[str] = None,
                  labels_db_id: Optional[str] = None):
-        self.notion = NotionAPI(notion_token)
+        self.notion = NotionAPI(notion_token, TokenBucket(NOTION_REQUESTS_PER_SECOND))
         self.mb = MusicBrainzAPI(musicbrainz_user_agent)
         
         self.artists_db_id = artists_db_id
@@ -1142,258 +1570,92 @@ class NotionMusicBrainzSync:
         self.labels_db_id = labels_db_id
         self.locations_db_id = os.getenv('NOTION_LOCATIONS_DATABASE_ID')
         
-        # Property mappings for each database
-        self.artists_properties = {}
-        self.albums_properties = {}
-        self.songs_properties = {}
-        self.labels_properties = {}
-        
-        # Property ID to key mappings
-        self.artists_property_id_to_key = {}
-        self.albums_property_id_to_key = {}
-        self.songs_property_id_to_key = {}
-        self.labels_property_id_to_key = {}
+        # Schemas, property ID to key mappings and MBID caches load on first
+        # access (see _ensure_schema_loaded), so a sync only pays for the
+        # databases it touches
+        self._schema_state = {
+            attr: {}
+            for database, (mbid_map, _, _) in self._SCHEMA_DATABASES.items()
+            for attr in (f'{database}_properties', f'{database}_property_id_to_key',
+                         f'{database}_property_keys', mbid_map)
+        }
+        self._loaded_schemas = set()
         
         # Caches for performance optimization
         self._location_cache = None  # Cache location name -> page_id (None = not loaded, {} = loaded empty)
         self._locations_title_key = None  # Cache title property key for locations
         self._database_pages_cache = {}  # Cache full database queries
-        self._artist_mbid_map = {}
-        self._album_mbid_map = {}
-        self._song_mbid_map = {}
-        self._label_mbid_map = {}
-        
-        # Load database schemas
-        if self.artists_db_id:
-            self._load_artists_schema()
-            self._artist_mbid_map = self._build_mbid_cache(
-                self.artists_db_id,
-                self.artists_properties.get('musicbrainz_id'),
-                self.artists_property_id_to_key,
-                'artist',
-            )
-        if self.albums_db_id:
-            self._load_albums_schema()
-            self._album_mbid_map = self._build_mbid_cache(
-                self.albums_db_id,
-                self.albums_properties.get('musicbrainz_id'),
-                self.albums_property_id_to_key,
-                'album',
-            )
-        if self.songs_db_id:
-            self._load_songs_schema()
-            self._song_mbid_map = self._build_mbid_cache(
-                self.songs_db_id,
-                self.songs_properties.get('musicbrainz_id'),
-                self.songs_property_id_to_key,
-                'song',
-            )
-        if self.labels_db_id:
-            self._load_labels_schema()
-            self._label_mbid_map = self._build_mbid_cache(
-                self.labels_db_id,
-                self.labels_properties.get('musicbrainz_id'),
-                self.labels_property_id_to_key,
-                'label',
-            )
+        self._release_dates_cache: Dict[str, Tuple[str, ...]] = {}  # artist MBID -> normalized release dates
+        self._release_recordings_cache: Dict[str, frozenset] = {}  # release MBID -> recording MBIDs on it
+        self._release_track_index: Dict[str, Tuple[Any, frozenset, frozenset]] = {}  # release MBID -> (media, ids, titles)
+        self._related_mbid_cache: Dict[str, str] = {}  # page_id -> MBID, the inverse of the MBID caches
+        self._related_page_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}  # page_id -> (title, MBID)
     
-    def _load_artists_schema(self):
-        """Load and analyze the Artists database schema."""
-        try:
-            database = self.notion.get_database(self.artists_db_id)
-            if not database:
-                logger.error("Could not retrieve Artists database schema")
-                return
-            
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.artists_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.artists_properties = {
-                'title': ARTISTS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'sort_name': ARTISTS_SORT_NAME_PROPERTY_ID,
-                'type': ARTISTS_TYPE_PROPERTY_ID,
-                'gender': ARTISTS_GENDER_PROPERTY_ID,
-                'area': ARTISTS_AREA_PROPERTY_ID,
-                'born_in': ARTISTS_BORN_IN_PROPERTY_ID,
-                'ig_link': ARTISTS_IG_LINK_PROPERTY_ID,
-                'website_link': ARTISTS_WEBSITE_LINK_PROPERTY_ID,
-                'youtube_link': ARTISTS_YOUTUBE_LINK_PROPERTY_ID,
-                'bandcamp_link': ARTISTS_BANDCAMP_LINK_PROPERTY_ID,
-                'streaming_link': ARTISTS_STREAMING_LINK_PROPERTY_ID,
-                'country': ARTISTS_COUNTRY_PROPERTY_ID,
-                'begin_date': ARTISTS_BEGIN_DATE_PROPERTY_ID,
-                'end_date': ARTISTS_END_DATE_PROPERTY_ID,
-                'disambiguation': ARTISTS_DISAMBIGUATION_PROPERTY_ID,
-                'description': ARTISTS_DESCRIPTION_PROPERTY_ID,
-                'genres': ARTISTS_GENRES_PROPERTY_ID,
-                'tags': ARTISTS_TAGS_PROPERTY_ID,
-                'rating': ARTISTS_RATING_PROPERTY_ID,
-                'last_updated': ARTISTS_LAST_UPDATED_PROPERTY_ID,
-                'musicbrainz_url': ARTISTS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'dns': properties.get('DNS', {}).get('id'),
-            }
-            
-            logger.info("✓ Artists database schema loaded")
-            
-        except Exception as e:
-            logger.error(f"Error loading Artists database schema: {e}")
+    def _ensure_schema_loaded(self, database: str):
+        """Load a database's schema and build its MBID cache the first time it is needed."""
+        if database in self._loaded_schemas:
+            return
+        # Mark first: loading reads these attributes back through their properties
+        self._loaded_schemas.add(database)
+        database_id = getattr(self, f'{database}_db_id')
+        if not database_id:
+            return
+        self._load_schema(database)
+        mbid_map, entity_name, _ = self._SCHEMA_DATABASES[database]
+        cache = self._build_mbid_cache(
+            database_id,
+            getattr(self, f'{database}_properties').get('musicbrainz_id'),
+            getattr(self, f'{database}_property_id_to_key'),
+            entity_name,
+        )
+        setattr(self, mbid_map, cache)
+        self._related_mbid_cache.update((page_id, mbid) for mbid, page_id in cache.items())
     
-    def _load_albums_schema(self):
-        """Load and analyze the Albums database schema."""
+    def _load_schema(self, database: str):
+        """Load and analyze a database schema ('artists', 'albums', 'songs' or 'labels')."""
+        label = database.capitalize()
         try:
-            database = self.notion.get_database(self.albums_db_id)
-            if not database:
-                logger.error("Could not retrieve Albums database schema")
+            database_info = self.notion.get_database(getattr(self, f'{database}_db_id'))
+            if not database_info:
+                logger.error(f"Could not retrieve {label} database schema")
                 return
             
-            properties = database.get('properties', {})
+            properties = database_info.get('properties', {})
             
             # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.albums_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.albums_properties = {
-                'title': ALBUMS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'artist': ALBUMS_ARTIST_PROPERTY_ID,
-                'release_date': ALBUMS_RELEASE_DATE_PROPERTY_ID,
-                'country': ALBUMS_COUNTRY_PROPERTY_ID,
-                'label': ALBUMS_LABEL_PROPERTY_ID,
-                'type': ALBUMS_TYPE_PROPERTY_ID,
-                'listen': ALBUMS_LISTEN_PROPERTY_ID,
-                'status': ALBUMS_STATUS_PROPERTY_ID,
-                'packaging': ALBUMS_PACKAGING_PROPERTY_ID,
-                'barcode': ALBUMS_BARCODE_PROPERTY_ID,
-                'format': ALBUMS_FORMAT_PROPERTY_ID,
-                'track_count': ALBUMS_TRACK_COUNT_PROPERTY_ID,
-                'description': ALBUMS_DESCRIPTION_PROPERTY_ID,
-                'genres': ALBUMS_GENRES_PROPERTY_ID,
-                'tags': ALBUMS_TAGS_PROPERTY_ID,
-                'rating': ALBUMS_RATING_PROPERTY_ID,
-                'cover_image': ALBUMS_COVER_IMAGE_PROPERTY_ID,
-                'musicbrainz_url': ALBUMS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'last_updated': ALBUMS_LAST_UPDATED_PROPERTY_ID,
-                'discs': ALBUMS_DISCS_PROPERTY_ID,
-                'songs': ALBUMS_SONGS_PROPERTY_ID,
-                'dns': properties.get('DNS', {}).get('id'),
+            property_id_to_key = {
+                prop_data['id']: prop_key
+                for prop_key, prop_data in properties.items()
+                if prop_data.get('id')
             }
-            
-            logger.info("✓ Albums database schema loaded")
-            
-        except Exception as e:
-            logger.error(f"Error loading Albums database schema: {e}")
-    
-    def _load_songs_schema(self):
-        """Load and analyze the Songs database schema."""
-        try:
-            database = self.notion.get_database(self.songs_db_id)
-            if not database:
-                logger.error("Could not retrieve Songs database schema")
-                return
-            
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.songs_property_id_to_key[prop_id] = prop_key
+            setattr(self, f'{database}_property_id_to_key', property_id_to_key)
             
             # Map property IDs
-            self.songs_properties = {
-                'title': SONGS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': SONGS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'artist': SONGS_ARTIST_PROPERTY_ID,
-                'album': SONGS_ALBUM_PROPERTY_ID,
-                'track_number': SONGS_TRACK_NUMBER_PROPERTY_ID,
-                'length': SONGS_LENGTH_PROPERTY_ID,
-                'isrc': SONGS_ISRC_PROPERTY_ID,
-                'disambiguation': SONGS_DISAMBIGUATION_PROPERTY_ID,
-                'description': SONGS_DESCRIPTION_PROPERTY_ID,
-                'genres': SONGS_GENRES_PROPERTY_ID,
-                'tags': SONGS_TAGS_PROPERTY_ID,
-                'listen': SONGS_LISTEN_PROPERTY_ID,
-                'rating': SONGS_RATING_PROPERTY_ID,
-                'musicbrainz_url': SONGS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'last_updated': SONGS_LAST_UPDATED_PROPERTY_ID,
-                'disc': SONGS_DISC_PROPERTY_ID,
-                'dns': properties.get('DNS', {}).get('id'),
-            }
+            database_properties = self._SCHEMA_DATABASES[database][2].copy()
+            database_properties['dns'] = properties.get('DNS', {}).get('id')
+            setattr(self, f'{database}_properties', database_properties)
             
-            logger.info("✓ Songs database schema loaded")
+            # Resolve each property name straight to its key once, so per-page
+            # code needn't chain the ID and key lookups for every property
+            setattr(self, f'{database}_property_keys', {
+                name: property_id_to_key[prop_id]
+                for name, prop_id in database_properties.items()
+                if prop_id in property_id_to_key
+            })
             
-        except Exception as e:
-            logger.error(f"Error loading Songs database schema: {e}")
-    
-    def _load_labels_schema(self):
-        """Load and analyze the Labels database schema."""
-        try:
-            database = self.notion.get_database(self.labels_db_id)
-            if not database:
-                logger.error("Could not retrieve Labels database schema")
-                return
-            
-            properties = database.get('properties', {})
-            
-            # Create property ID to key mapping
-            for prop_key, prop_data in properties.items():
-                prop_id = prop_data.get('id')
-                if prop_id:
-                    self.labels_property_id_to_key[prop_id] = prop_key
-            
-            # Map property IDs
-            self.labels_properties = {
-                'title': LABELS_TITLE_PROPERTY_ID,
-                'musicbrainz_id': LABELS_MUSICBRAINZ_ID_PROPERTY_ID,
-                'type': LABELS_TYPE_PROPERTY_ID,
-                'country': LABELS_COUNTRY_PROPERTY_ID,
-                'begin_date': LABELS_BEGIN_DATE_PROPERTY_ID,
-                'end_date': LABELS_END_DATE_PROPERTY_ID,
-                'disambiguation': LABELS_DISAMBIGUATION_PROPERTY_ID,
-                'description': LABELS_DESCRIPTION_PROPERTY_ID,
-                'genres': LABELS_GENRES_PROPERTY_ID,
-                'tags': LABELS_TAGS_PROPERTY_ID,
-                'rating': LABELS_RATING_PROPERTY_ID,
-                'last_updated': LABELS_LAST_UPDATED_PROPERTY_ID,
-                'musicbrainz_url': LABELS_MUSICBRAINZ_URL_PROPERTY_ID,
-                'official_website': LABELS_OFFICIAL_WEBSITE_PROPERTY_ID,
-                'ig': LABELS_IG_PROPERTY_ID,
-                'bandcamp': LABELS_BANDCAMP_PROPERTY_ID,
-                'founded': LABELS_FOUNDED_PROPERTY_ID,
-                'albums': LABELS_ALBUMS_PROPERTY_ID,
-                'area': LABELS_AREA_PROPERTY_ID,
-                'dns': properties.get('DNS', {}).get('id'),
-            }
-            
-            logger.info("✓ Labels database schema loaded")
+            logger.info(f"✓ {label} database schema loaded")
             
         except Exception as e:
-            logger.error(f"Error loading Labels database schema: {e}")
+            logger.error(f"Error loading {label} database schema: {e}")
     
     def _get_property_key(self, property_id: Optional[str], database: str) -> Optional[str]:
         """Get the property key for a given property ID in a specific database."""
         if not property_id:
             return None
         
-        if database == 'artists':
-            return self.artists_property_id_to_key.get(property_id)
-        elif database == 'albums':
-            return self.albums_property_id_to_key.get(property_id)
-        elif database == 'songs':
-            return self.songs_property_id_to_key.get(property_id)
-        elif database == 'labels':
-            return self.labels_property_id_to_key.get(property_id)
-        return None
+        # Resolved per call: the maps load lazily and are replaced when a schema loads
+        map_attr = self._PROPERTY_KEY_MAPS.get(database)
+        return getattr(self, map_attr).get(property_id) if map_attr else None
     
     def _fetch_artist_data_by_mbid_or_name(self, artist_name: str, artist_mbid: Optional[str]) -> Optional[Dict]:
         """Fetch full artist data from MusicBrainz by MBID or name search."""
@@ -1458,11 +1720,22 @@ class NotionMusicBrainzSync:
         self._database_pages_cache[database_id] = pages
         return pages
 
+    def _prefetch_database_pages(self, database_ids: List[Optional[str]]):
+        """Query several databases in parallel so their pagination round-trips overlap."""
+        pending = [db_id for db_id in dict.fromkeys(database_ids) if db_id and db_id not in self._database_pages_cache]
+        if len(pending) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='notion-pages') as pool:
+            for db_id, pages in zip(pending, pool.map(self.notion.query_database, pending)):
+                self._database_pages_cache[db_id] = pages
+        logger.debug("Prefetched pages for %d databases", len(pending))
+    
     @staticmethod
     def _normalize_mbid(mbid: Optional[str]) -> Optional[str]:
         if not mbid:
             return None
-        return mbid.strip().lower()
+        # Interned so the caches and page data share one copy per MBID
+        return sys.intern(mbid.strip().lower())
 
     @staticmethod
     def _extract_rich_text_plain(prop: Optional[Dict]) -> Optional[str]:
@@ -1481,7 +1754,12 @@ class NotionMusicBrainzSync:
         property_id_to_key: Dict[str, str],
         entity_name: str,
     ) -> Dict[str, str]:
-        """Create a {mbid -> page_id} cache for the specified database."""
+        """Create a {mbid -> page_id} cache for the specified database.
+        
+        Keys are normalized here because the MBID property is user-editable;
+        lookups with MBIDs taken from MusicBrainz responses (lowercase UUIDs)
+        can use them as-is.
+        """
         if not database_id or not mbid_property_id:
             return {}
         property_key = property_id_to_key.get(mbid_property_id)
@@ -1489,13 +1767,15 @@ class NotionMusicBrainzSync:
             logger.warning("Skipping %s MBID cache; property %s missing in schema", entity_name, mbid_property_id)
             return {}
         pages = self._get_database_pages(database_id)
-        cache: Dict[str, str] = {}
-        for page in pages:
-            page_id = page.get('id')
-            mbid_prop = page.get('properties', {}).get(property_key)
-            mbid = self._normalize_mbid(self._extract_rich_text_plain(mbid_prop))
-            if mbid and page_id:
-                cache[mbid] = page_id
+        normalize = self._normalize_mbid
+        extract = self._extract_rich_text_plain
+        cache: Dict[str, str] = {
+            mbid: page_id
+            for page in pages
+            for page_id in (page.get('id'),)
+            for mbid in (normalize(extract(page.get('properties', {}).get(property_key))),)
+            if mbid and page_id
+        }
         if cache:
             logger.debug("Cached %d %s MBIDs", len(cache), entity_name)
         return cache
@@ -1504,6 +1784,7 @@ class NotionMusicBrainzSync:
         normalized = self._normalize_mbid(mbid)
         if normalized and page_id:
             cache[normalized] = page_id
+            self._related_mbid_cache[page_id] = normalized
 
     def _persist_mbid_on_page(
         self,
@@ -1524,6 +1805,7 @@ class NotionMusicBrainzSync:
         current_value = self._normalize_mbid(self._extract_rich_text_plain(existing_prop))
         if current_value == normalized:
             cache[normalized] = page_id
+            self._related_mbid_cache[page_id] = normalized
             return
         update_payload = {
             prop_key: {
@@ -1532,6 +1814,7 @@ class NotionMusicBrainzSync:
         }
         if self.notion.update_page(page_id, update_payload):
             cache[normalized] = page_id
+            self._related_mbid_cache[page_id] = normalized
     
     def sync_artist_page(self, page: Dict, force_update: bool = False, spotify_url: str = None) -> Optional[bool]:
         """Sync a single artist page with MusicBrainz data."""
@@ -1539,6 +1822,20 @@ class NotionMusicBrainzSync:
             page_id = page['id']
             properties = page.get('properties', {})
             
+            # Check for existing MBID first: already-synced pages are skipped
+            # before any other parsing unless force_update is set. A malformed
+            # MBID falls through so the name search below can repair it
+            existing_mbid = None
+            mb_id_key = self.artists_property_id_to_key.get(self.artists_properties.get('musicbrainz_id'))
+            if mb_id_key:
+                # MBID is stored as rich_text (UUID string)
+                mb_id_rich_text = properties.get(mb_id_key, {}).get('rich_text')
+                if mb_id_rich_text:
+                    existing_mbid = mb_id_rich_text[0]['plain_text']
+            if existing_mbid and not force_update and _is_valid_mbid(existing_mbid):
+                logger.info("Skipping artist page %s - already has MBID %s (use --force-update to update)", page_id, existing_mbid)
+                return None
+            
             # Extract title
             title_prop_id = self.artists_properties.get('title')
             if not title_prop_id:
@@ -1558,17 +1855,6 @@ class NotionMusicBrainzSync:
             title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing artist: {title}")
             
-            # Check for existing MBID
-            mb_id_prop_id = self.artists_properties.get('musicbrainz_id')
-            existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'artists')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
-            
             # Check for Spotify URL (dual-purpose: input and output)
             spotify_url_from_notion = None
             spotify_prop_id = self.artists_properties.get('streaming_link')  # Spotify property
@@ -1614,10 +1900,6 @@ class NotionMusicBrainzSync:
                 if not artist_data:
                     logger.warning(f"Could not find artist with MBID {existing_mbid}, searching by name")
                     existing_mbid = None
-                elif not force_update:
-                    # Skip pages with existing MBIDs unless force_update is True
-                    logger.info(f"Skipping artist '{title}' - already has MBID {existing_mbid} (use --force-update to update)")
-                    return None
             
             if not artist_data:
                 search_results = self.mb.search_artists(title, limit=5)
@@ -1684,64 +1966,73 @@ class NotionMusicBrainzSync:
         """Format MusicBrainz artist data for Notion properties."""
         properties = {}
         primary_artist_mbid = None
+        # Bind the schema maps once; every property below is a plain dict lookup
+        artists_properties = self.artists_properties
+        key_by_id = self.artists_property_id_to_key
         
         try:
+            artist_id = artist_data.get('id')
+            artist_name = artist_data.get('name')
+            area = artist_data.get('area') or {}
+            begin_area = artist_data.get('begin-area') or {}
+            genres = artist_data.get('genres') or ()
+            tags = artist_data.get('tags') or ()
+            
             # Title (name)
-            if artist_data.get('name') and self.artists_properties.get('title'):
-                prop_key = self._get_property_key(self.artists_properties['title'], 'artists')
+            if artist_name and artists_properties.get('title'):
+                prop_key = key_by_id.get(artists_properties['title'])
                 if prop_key:
                     properties[prop_key] = {
-                        'title': [{'text': {'content': artist_data['name']}}]
+                        'title': [{'text': {'content': artist_name}}]
                     }
             
             # MusicBrainz ID (store as string in rich_text since MBIDs are UUIDs)
-            if artist_data.get('id') and self.artists_properties.get('musicbrainz_id'):
-                prop_key = self._get_property_key(self.artists_properties['musicbrainz_id'], 'artists')
+            if artist_id and artists_properties.get('musicbrainz_id'):
+                prop_key = key_by_id.get(artists_properties['musicbrainz_id'])
                 if prop_key:
                     # Store MBID as string - it's a UUID, not a number
                     properties[prop_key] = {
-                        'rich_text': [{'text': {'content': artist_data['id']}}]
+                        'rich_text': [{'text': {'content': artist_id}}]
                     }
             
             # Sort name
-            if artist_data.get('sort-name') and self.artists_properties.get('sort_name'):
-                prop_key = self._get_property_key(self.artists_properties['sort_name'], 'artists')
+            if artist_data.get('sort-name') and artists_properties.get('sort_name'):
+                prop_key = key_by_id.get(artists_properties['sort_name'])
                 if prop_key:
                     properties[prop_key] = {
                         'rich_text': [{'text': {'content': artist_data['sort-name']}}]
                     }
             
             # Type
-            if artist_data.get('type') and self.artists_properties.get('type'):
-                prop_key = self._get_property_key(self.artists_properties['type'], 'artists')
+            if artist_data.get('type') and artists_properties.get('type'):
+                prop_key = key_by_id.get(artists_properties['type'])
                 if prop_key:
                     properties[prop_key] = {'select': {'name': artist_data['type']}}
             
             # Gender
-            if artist_data.get('gender') and self.artists_properties.get('gender'):
-                prop_key = self._get_property_key(self.artists_properties['gender'], 'artists')
+            if artist_data.get('gender') and artists_properties.get('gender'):
+                prop_key = key_by_id.get(artists_properties['gender'])
                 if prop_key:
                     properties[prop_key] = {'select': {'name': artist_data['gender']}}
             
             # Area (relation to Locations database)
-            if artist_data.get('area') and artist_data['area'].get('name') and self.artists_properties.get('area') and self.locations_db_id:
-                area_name = artist_data['area']['name']
-                location_page_id = self._find_or_create_location_page(area_name)
+            # Resolve the property key first so no location is created for a missing property
+            prop_key = key_by_id.get(artists_properties.get('area'))
+            if area.get('name') and prop_key and self.locations_db_id:
+                location_page_id = self._find_or_create_location_page(area['name'])
                 if location_page_id:
-                    prop_key = self._get_property_key(self.artists_properties['area'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {
-                            'relation': [{'id': location_page_id}]
-                        }
+                    properties[prop_key] = {
+                        'relation': [{'id': location_page_id}]
+                    }
             
             # Born In (relation to Locations database)
-            if self.artists_properties.get('born_in') and self.locations_db_id:
+            if artists_properties.get('born_in') and self.locations_db_id:
                 born_in_location = None
                 # Try to get from begin-area
-                if artist_data.get('begin-area') and artist_data['begin-area'].get('name'):
-                    born_in_location = artist_data['begin-area']['name']
+                if begin_area.get('name'):
+                    born_in_location = begin_area['name']
                 
-                prop_key = self._get_property_key(self.artists_properties['born_in'], 'artists')
+                prop_key = key_by_id.get(artists_properties['born_in'])
                 if prop_key:
                     if born_in_location:
                         # Only set relation if we have data from MusicBrainz
@@ -1756,77 +2047,62 @@ class NotionMusicBrainzSync:
                             'relation': []
                         }
             
-            # Extract URLs from relationships
-            ig_url = None
-            website_url = None
-            youtube_url = None
-            bandcamp_url = None
-            spotify_url = None
-            
-            if artist_data.get('relations'):
-                for relation in artist_data['relations']:
-                    relation_type = relation.get('type', '').lower()
-                    url_resource = relation.get('url', {}).get('resource', '').lower()
-                    
-                    # Instagram
-                    if relation_type == 'instagram' or (relation_type == 'social network' and 'instagram' in url_resource):
-                        ig_url = relation.get('url', {}).get('resource')
-                    # Official homepage/website
-                    elif relation_type == 'official homepage' or relation_type == 'official website':
-                        website_url = relation.get('url', {}).get('resource')
-                    # YouTube (exclude YouTube Music)
-                    elif ('youtube' in url_resource or 'youtu.be' in url_resource) and 'music.youtube.com' not in url_resource:
-                        youtube_url = relation.get('url', {}).get('resource')
-                    # Bandcamp
-                    elif 'bandcamp' in url_resource:
-                        bandcamp_url = relation.get('url', {}).get('resource')
-                    # Spotify (only extract if we're allowed to write it)
-                    elif not skip_spotify_url and 'spotify' in url_resource:
-                        spotify_url = relation.get('url', {}).get('resource')
+            # Extract URLs from relationships, one host lookup per relation
+            links = {}
+            for relation in artist_data.get('relations') or []:
+                url = (relation.get('url') or {}).get('resource') or ''
+                field = _classify_artist_link(relation.get('type') or '', url) if url else None
+                # Spotify is only extracted if we're allowed to write it
+                if field and not (field == 'spotify' and skip_spotify_url):
+                    links[field] = url
+            ig_url = links.get('ig')
+            website_url = links.get('website')
+            youtube_url = links.get('youtube')
+            bandcamp_url = links.get('bandcamp')
+            spotify_url = links.get('spotify')
             
             # IG Link
-            if ig_url and self.artists_properties.get('ig_link'):
-                prop_key = self._get_property_key(self.artists_properties['ig_link'], 'artists')
+            if ig_url and artists_properties.get('ig_link'):
+                prop_key = key_by_id.get(artists_properties['ig_link'])
                 if prop_key:
                     properties[prop_key] = {'url': ig_url}
             
             # Official Website Link
-            if website_url and self.artists_properties.get('website_link'):
-                prop_key = self._get_property_key(self.artists_properties['website_link'], 'artists')
+            if website_url and artists_properties.get('website_link'):
+                prop_key = key_by_id.get(artists_properties['website_link'])
                 if prop_key:
                     properties[prop_key] = {'url': website_url}
             
             # YouTube Link
-            if youtube_url and self.artists_properties.get('youtube_link'):
-                prop_key = self._get_property_key(self.artists_properties['youtube_link'], 'artists')
+            if youtube_url and artists_properties.get('youtube_link'):
+                prop_key = key_by_id.get(artists_properties['youtube_link'])
                 if prop_key:
                     properties[prop_key] = {'url': youtube_url}
             
             # Bandcamp Link
-            if bandcamp_url and self.artists_properties.get('bandcamp_link'):
-                prop_key = self._get_property_key(self.artists_properties['bandcamp_link'], 'artists')
+            if bandcamp_url and artists_properties.get('bandcamp_link'):
+                prop_key = key_by_id.get(artists_properties['bandcamp_link'])
                 if prop_key:
                     properties[prop_key] = {'url': bandcamp_url}
             
             # Streaming Link (Spotify) - only write if it wasn't provided as input
-            if not skip_spotify_url and spotify_url and self.artists_properties.get('streaming_link'):
-                prop_key = self._get_property_key(self.artists_properties['streaming_link'], 'artists')
+            if not skip_spotify_url and spotify_url and artists_properties.get('streaming_link'):
+                prop_key = key_by_id.get(artists_properties['streaming_link'])
                 if prop_key:
                     properties[prop_key] = {'url': spotify_url}
             
             # Country
-            if artist_data.get('area') and artist_data['area'].get('iso-3166-1-code-list'):
-                country_code = artist_data['area']['iso-3166-1-code-list'][0]
-                if self.artists_properties.get('country'):
-                    prop_key = self._get_property_key(self.artists_properties['country'], 'artists')
-                    if prop_key:
-                        properties[prop_key] = {'select': {'name': country_code}}
+            prop_key = key_by_id.get(artists_properties.get('country'))
+            if prop_key and area.get('iso-3166-1-code-list'):
+                properties[prop_key] = {'select': {'name': area['iso-3166-1-code-list'][0]}}
             
             # Begin date and End date - based on first and latest release dates
-            # Using a single date property with start (first release) and end (latest release)
-            if artist_data.get('id'):
+            # Using a single date property with start (first release) and end (latest release);
+            # the releases are only fetched when the property exists
+            prop_key = key_by_id.get(artists_properties.get('begin_date'))
+            if artist_id and prop_key:
                 # Fetch releases for this artist to get release dates
-                release_dates = self._get_artist_release_dates(artist_data['id'])
+                release_dates = self._get_artist_release_dates(artist_id)
                 
                 if release_dates:
                     # Begin date = earliest release date (start of range)
@@ -1834,42 +2110,33 @@ class NotionMusicBrainzSync:
                     # End date = latest release date (end of range)
                     latest_date = max(release_dates)
                     
-                    if self.artists_properties.get('begin_date'):
-                        prop_key = self._get_property_key(self.artists_properties['begin_date'], 'artists')
-                        if prop_key:
-                            # Set both start and end dates in the same date property
-                            properties[prop_key] = {
-                                'date': {
-                                    'start': earliest_date[:10],  # First release date
-                                    'end': latest_date[:10]       # Latest release date
-                                }
-                            }
+                    # Set both start and end dates in the same date property
+                    properties[prop_key] = {
+                        'date': {
+                            'start': earliest_date[:10],  # First release date
+                            'end': latest_date[:10]       # Latest release date
+                        }
+                    }
             
             # Disambiguation
-            if artist_data.get('disambiguation') and self.artists_properties.get('disambiguation'):
-                prop_key = self._get_property_key(self.artists_properties['disambiguation'], 'artists')
+            if artist_data.get('disambiguation') and artists_properties.get('disambiguation'):
+                prop_key = key_by_id.get(artists_properties['disambiguation'])
                 if prop_key:
                     properties[prop_key] = {
                         'rich_text': [{'text': {'content': artist_data['disambiguation']}}]
                     }
             
             # Genres + tags - consolidate everything into the Genres property for artists
-            if self.artists_properties.get('genres'):
-                prop_key = self._get_property_key(self.artists_properties['genres'], 'artists')
+            if artists_properties.get('genres'):
+                prop_key = key_by_id.get(artists_properties['genres'])
                 if prop_key:
-                    genre_candidates = []
-                    if artist_data.get('genres'):
-                        genre_candidates.extend(
-                            genre['name']
-                            for genre in artist_data['genres']
-                            if isinstance(genre, dict) and genre.get('name')
-                        )
-                    if artist_data.get('tags'):
-                        genre_candidates.extend(
-                            tag['name']
-                            for tag in artist_data['tags']
-                            if isinstance(tag, dict) and tag.get('name')
-                        )
+                    # Lazy: build_multi_select_options de-duplicates and stops
+                    # reading once it has its 10 options
+                    genre_candidates = (
+                        item['name']
+                        for item in chain(genres, tags)
+                        if isinstance(item, dict) and item.get('name')
+                    )
                     genre_options = build_multi_select_options(
                         genre_candidates,
                         limit=10,
@@ -1879,15 +2146,15 @@ class NotionMusicBrainzSync:
                         properties[prop_key] = {'multi_select': genre_options}
             
             # MusicBrainz URL
-            if artist_data.get('id') and self.artists_properties.get('musicbrainz_url'):
-                mb_url = f"https://musicbrainz.org/artist/{artist_data['id']}"
-                prop_key = self._get_property_key(self.artists_properties['musicbrainz_url'], 'artists')
+            if artist_id and artists_properties.get('musicbrainz_url'):
+                mb_url = f"https://musicbrainz.org/artist/{artist_id}"
+                prop_key = key_by_id.get(artists_properties['musicbrainz_url'])
                 if prop_key:
                     properties[prop_key] = {'url': mb_url}
             
             # Last updated
-            if self.artists_properties.get('last_updated'):
-                prop_key = self._get_property_key(self.artists_properties['last_updated'], 'artists')
+            if artists_properties.get('last_updated'):
+                prop_key = key_by_id.get(artists_properties['last_updated'])
                 if prop_key:
                     properties[prop_key] = {'date': {'start': datetime.now().isoformat()}}
             
@@ -1896,21 +2163,26 @@ class NotionMusicBrainzSync:
         
         return properties
     
-    def _get_artist_release_dates(self, artist_mbid: str) -> List[str]:
-        """Get all release dates for an artist from MusicBrainz."""
+    def _get_artist_release_dates(self, artist_mbid: str) -> Tuple[str, ...]:
+        """Get all release dates for an artist from MusicBrainz (cached per artist for the run)."""
+        cached = self._release_dates_cache.get(artist_mbid)
+        if cached is not None:
+            return cached
+        
         release_dates = []
         
         try:
-            # Search for releases by this artist
+            # Browse (not search) the artist's releases: without inc= the browse
+            # response carries only the core release fields, date included,
+            # instead of search results' artist credits, labels and media
             url = f"{self.mb.base_url}/release"
             params = {
-                'query': f'arid:{artist_mbid}',
+                'artist': artist_mbid,
                 'limit': 100,  # Get up to 100 releases
                 'fmt': 'json'
             }
             
-            response = self.mb._make_api_request(url, params)
-            data = response.json()
+            data = self.mb._get_json(url, params) or {}
             
             releases = data.get('releases', [])
             
@@ -1920,17 +2192,22 @@ class NotionMusicBrainzSync:
                     # Only add valid dates (YYYY-MM-DD format or partial)
                     # Normalize partial dates: YYYY -> YYYY-01-01, YYYY-MM -> YYYY-MM-01
                     if release_date and len(release_date) >= 4:  # At least YYYY
-                        # Normalize to YYYY-MM-DD format for proper comparison
-                        normalized_date = self._normalize_date(release_date)
+                        # Normalize to YYYY-MM-DD format for proper comparison;
+                        # full dates are already canonical, so skip the call
+                        if len(release_date) == 10 and release_date[4] == '-' and release_date[7] == '-':
+                            normalized_date = release_date
+                        else:
+                            normalized_date = _normalize_date(release_date)
                         if normalized_date:
                             release_dates.append(normalized_date)
             
             logger.debug(f"Found {len(release_dates)} release dates for artist {artist_mbid}")
+            release_dates = self._release_dates_cache[artist_mbid] = tuple(release_dates)
             
         except Exception as e:
             logger.warning(f"Error fetching release dates for artist {artist_mbid}: {e}")
         
-        return release_dates
+        return tuple(release_dates)
     
     def _get_mbid_from_related_page(self, page_id: str, database_type: str) -> Optional[str]:
         """Get MusicBrainz ID from a related page.
@@ -1943,26 +2220,25 @@ class NotionMusicBrainzSync:
             The MusicBrainz ID if found, None otherwise
         """
         try:
+            # Get the MBID property ID based on database type (loading the
+            # schema also indexes that database's page MBIDs)
+            mb_id_prop_id = None
+            if database_type in self._SCHEMA_DATABASES:
+                mb_id_prop_id = getattr(self, f'{database_type}_properties').get('musicbrainz_id')
+            
+            if not mb_id_prop_id:
+                return None
+            
+            cached_mbid = self._related_mbid_cache.get(page_id)
+            if cached_mbid:
+                return cached_mbid
+            
             page = self.notion.get_page(page_id)
             if not page:
                 return None
             
             properties = page.get('properties', {})
             
-            # Get the MBID property ID based on database type
-            mb_id_prop_id = None
-            if database_type == 'artists':
-                mb_id_prop_id = self.artists_properties.get('musicbrainz_id')
-            elif database_type == 'albums':
-                mb_id_prop_id = self.albums_properties.get('musicbrainz_id')
-            elif database_type == 'songs':
-                mb_id_prop_id = self.songs_properties.get('musicbrainz_id')
-            elif database_type == 'labels':
-                mb_id_prop_id = self.labels_properties.get('musicbrainz_id')
-            
-            if not mb_id_prop_id:
-                return None
-            
             # Get the property key
             prop_key = self._get_property_key(mb_id_prop_id, database_type)
             if not prop_key:
@@ -1971,13 +2247,64 @@ class NotionMusicBrainzSync:
             # Extract MBID from rich_text
             mb_id_prop = properties.get(prop_key, {})
             if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                return mb_id_prop['rich_text'][0]['plain_text']
+                mbid = mb_id_prop['rich_text'][0]['plain_text']
+                self._related_mbid_cache[page_id] = mbid
+                return mbid
             
             return None
         except Exception as e:
             logger.debug(f"Error getting MBID from related page {page_id}: {e}")
             return None
     
+    def _get_related_page_info(self, page_id: str, database: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return the (title, MBID) of a related page, fetching the page at most once per run.
+        
+        Albums in the same library share artists (and songs move between
+        releases), so the same related page is read for many albums.
+        """
+        info = self._related_page_cache.get(page_id)
+        if info is None:
+            info = self._cache_related_page(page_id, database, self.notion.get_page(page_id))
+            if info is None:
+                return None, self._related_mbid_cache.get(page_id)
+        
+        title, mbid = info
+        # MBIDs persisted or matched since the page was read take precedence
+        return title, self._related_mbid_cache.get(page_id) or mbid
+    
+    def _cache_related_page(self, page_id: str, database: str,
+                            page: Optional[Dict]) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Extract and cache a fetched related page's (title, MBID); None if the fetch failed."""
+        if not page:
+            logger.warning(f"Could not fetch related {database} page {page_id}")
+            return None
+        
+        keys = getattr(self, f'{database}_property_keys')
+        page_properties = page.get('properties', {})
+        title = None
+        title_prop = page_properties.get(keys.get('title'))
+        if title_prop and title_prop.get('title'):
+            title = title_prop['title'][0]['plain_text']
+        mbid = self._extract_rich_text_plain(page_properties.get(keys.get('musicbrainz_id')))
+        if mbid:
+            self._related_mbid_cache.setdefault(page_id, mbid)
+        info = self._related_page_cache[page_id] = (title, mbid)
+        return info
+    
+    def _prefetch_related_pages(self, related: List[Tuple[Optional[str], str]]):
+        """Fetch uncached (page_id, database) related pages in parallel so their Notion round-trips overlap."""
+        pending = {
+            page_id: database for page_id, database in related
+            if page_id and page_id not in self._related_page_cache
+        }
+        if len(pending) < 2:
+            return
+        # NotionAPI's token bucket still paces the requests across workers
+        with ThreadPoolExecutor(max_workers=min(8, len(pending)), thread_name_prefix='notion-pages') as pool:
+            for (page_id, database), page in zip(pending.items(), pool.map(self.notion.get_page, pending)):
+                self._cache_related_page(page_id, database, page)
+        logger.debug("Prefetched %d related pages", len(pending))
+    
     def _recording_appears_on_album(self, recording_id: str, album_mbid: str) -> bool:
         """Check if a recording appears on a specific album.
         
@@ -1989,18 +2316,24 @@ class NotionMusicBrainzSync:
             True if the recording appears on the album, False otherwise
         """
         try:
-            # Get the album/release data
-            release_data = self.mb.get_release(album_mbid)
-            if not release_data:
-                return False
-            
-            # Check if any medium contains this recording
-            for medium in release_data.get('media', []):
-                for track in medium.get('tracks', []):
-                    if track.get('recording') and track['recording'].get('id') == recording_id:
-                        return True
+            recording_ids = self._release_recordings_cache.get(album_mbid)
+            if recording_ids is None:
+                # Get the album/release data
+                release_data = self.mb.get_release(album_mbid)
+                if not release_data:
+                    return False
+                
+                # Index every recording on the release once; later checks
+                # against the same album are a single set lookup
+                recording_ids = frozenset(
+                    track['recording'].get('id')
+                    for medium in release_data.get('media', ())
+                    for track in medium.get('tracks', ())
+                    if track.get('recording')
+                )
+                self._release_recordings_cache[album_mbid] = recording_ids
             
-            return False
+            return recording_id in recording_ids
         except Exception as e:
             logger.debug(f"Error checking if recording {recording_id} appears on album {album_mbid}: {e}")
             return False
@@ -2010,16 +2343,21 @@ class NotionMusicBrainzSync:
         if not release_groups:
             return []
         
+        # Normalize the preferred title once rather than per group
+        preferred_words = _title_words(preferred_title) if preferred_title else None
+        preferred_lower = preferred_title.lower() if preferred_title else None
+        
         def group_score(group: Dict) -> tuple:
             score = 0
             title = group.get('title', '') or ''
+            title_lower = title.lower()
             if preferred_title:
-                if self._titles_match_exactly(preferred_title, title):
+                if _title_words(title) == preferred_words:
                     score += 1000
-                elif preferred_title.lower() in title.lower():
+                elif preferred_lower in title_lower:
                     score += 100
             release_date = group.get('first-release-date') or '9999-12-31'
-            return (-score, release_date, title.lower())
+            return (-score, release_date, title_lower)
         
         return sorted(release_groups, key=group_score)
     
@@ -2059,19 +2397,46 @@ class NotionMusicBrainzSync:
             score, date = self._score_release_for_song(release)
             scored_releases.append((score, date, release))
         
-        scored_releases.sort(key=lambda x: (-x[0], x[1]))
-        seen = set()
-        
-        limit = min(max_candidates, len(scored_releases))
-        for i in range(limit):
-            _, _, release = scored_releases[i]
-            release_mbid = release.get('id')
-            if not release_mbid or release_mbid in seen:
-                continue
-            seen.add(release_mbid)
-            full_release = self.mb.get_release(release_mbid)
-            if full_release:
-                yield full_release
+        # Only the best max_candidates are fetched, so select them rather than
+        # sorting every candidate (same order as sorted(...)[:max_candidates])
+        top_releases = heapq.nsmallest(max_candidates, scored_releases, key=lambda x: (-x[0], x[1]))
+        release_mbids = list(dict.fromkeys(
+            release.get('id') for _, _, release in top_releases if release.get('id')
+        ))
+        
+        # Fetch one candidate ahead so its request overlaps the caller's work on
+        # the current one. Callers usually stop at the first match, so fetching
+        # further ahead would spend MusicBrainz's 1 req/s budget on unused releases.
+        pending = None
+        try:
+            for index, release_mbid in enumerate(release_mbids):
+                current = pending or self.mb._aux_executor.submit(self.mb.get_release, release_mbid)
+                pending = None
+                if index + 1 < len(release_mbids):
+                    pending = self.mb._aux_executor.submit(self.mb.get_release, release_mbids[index + 1])
+                full_release = current.result()
+                if full_release:
+                    yield full_release
+        finally:
+            if pending:
+                pending.cancel()
+    
+    def _iter_release_group_data(self, groups: List[Dict]):
+        """Yield (group, full release-group data) pairs in order, fetching one group ahead."""
+        # Same one-ahead lookahead as _iter_release_candidates: the next group's
+        # request overlaps the release lookups for the current one, while the
+        # shared MusicBrainz token bucket keeps the overall rate at 1 req/s
+        pending = None
+        try:
+            for index, group in enumerate(groups):
+                current = pending or self.mb._aux_executor.submit(self.mb.get_release_group, group['id'])
+                pending = None
+                if index + 1 < len(groups):
+                    pending = self.mb._aux_executor.submit(self.mb.get_release_group, groups[index + 1]['id'])
+                yield group, current.result()
+        finally:
+            if pending:
+                pending.cancel()
     
     def _match_track_in_release(self, release_data: Dict, search_title: str) -> Optional[Dict]:
         """Check if a release contains the target track, returning detailed match info."""
@@ -2150,11 +2515,11 @@ class NotionMusicBrainzSync:
         checked = 0
         disallowed_secondary = {'live', 'compilation', 'soundtrack', 'remix', 'dj-mix'}
         
+        # Apply the browse-level type filters before fetching anything, so no
+        # MusicBrainz requests are spent on groups that would be skipped anyway
+        eligible_groups = []
         for group in prioritized_groups:
-            if checked >= max_groups:
-                break
-            group_id = group.get('id')
-            if not group_id:
+            if not group.get('id'):
                 continue
             
             primary_type = (group.get('primary-type') or '').lower()
@@ -2169,10 +2534,13 @@ class NotionMusicBrainzSync:
                 )
                 continue
             
-            group_data = self.mb.get_release_group(group_id)
+            eligible_groups.append(group)
+        
+        for group, group_data in self._iter_release_group_data(eligible_groups):
             if not group_data or not group_data.get('releases'):
                 continue
             
+            primary_type = (group.get('primary-type') or '').lower()
             if not primary_type:
                 fetched_primary = (group_data.get('primary-type') or '').lower()
                 if fetched_primary and fetched_primary != 'album':
@@ -2199,6 +2567,8 @@ class NotionMusicBrainzSync:
                     )
                     match['release_group'] = group_data
                     return match
+            if checked >= max_groups:
+                break
         
         logger.info(f"No release containing '{song_title}' found via release-groups for artist {artist_mbid}")
         return None
@@ -2249,29 +2619,30 @@ class NotionMusicBrainzSync:
             recording_title = recording_data.get('title', 'Unknown')
             
             # Check artist-credit in recording data (may be present in search results)
-            if recording_data.get('artist-credit'):
-                for ac in recording_data['artist-credit']:
-                    if ac.get('artist') and ac['artist'].get('id') == artist_mbid:
-                        logger.info(f"Recording '{recording_title}' ({recording_id}) is by artist {artist_mbid} (from search result)")
-                        return True
-                    elif ac.get('artist'):
-                        logger.info(f"Recording '{recording_title}' artist: {ac['artist'].get('id')} (expected: {artist_mbid})")
+            credits = recording_data.get('artist-credit')
+            source = 'search result'
             
-            # If artist-credit not in search results, fetch full recording data
-            if recording_id:
+            # If artist-credit not in search results, fetch full recording data.
+            # Search results carry the recording's complete credit, so when it is
+            # present but doesn't name the artist, a full fetch can't change that.
+            if not credits and recording_id:
                 logger.info(f"Fetching full recording data for '{recording_title}' ({recording_id}) to verify artist")
                 full_recording = self.mb.get_recording(recording_id)
-                if full_recording and full_recording.get('artist-credit'):
-                    for ac in full_recording['artist-credit']:
-                        if ac.get('artist') and ac['artist'].get('id') == artist_mbid:
-                            logger.info(f"Recording '{recording_title}' ({recording_id}) is by artist {artist_mbid} (from full fetch)")
-                            return True
-                        elif ac.get('artist'):
-                            logger.info(f"Recording '{recording_title}' artist: {ac['artist'].get('id')} (expected: {artist_mbid})")
-                elif not full_recording:
+                if not full_recording:
                     logger.warning(f"Could not fetch full recording data for {recording_id}")
                 elif not full_recording.get('artist-credit'):
                     logger.warning(f"Full recording data for {recording_id} has no artist-credit")
+                else:
+                    credits = full_recording['artist-credit']
+                    source = 'full fetch'
+            
+            if credits:
+                artist_ids = {(ac.get('artist') or {}).get('id') for ac in credits}
+                artist_ids.discard(None)
+                logger.debug("Recording %s credits: %s (expected: %s)", recording_id, artist_ids, artist_mbid)
+                if artist_mbid in artist_ids:
+                    logger.info(f"Recording '{recording_title}' ({recording_id}) is by artist {artist_mbid} (from {source})")
+                    return True
             
             logger.info(f"Recording '{recording_title}' ({recording_id}) is NOT by artist {artist_mbid}")
             return False
@@ -2367,18 +2738,7 @@ class NotionMusicBrainzSync:
             return True
         
         try:
-            # Collect all recording IDs and titles from the release
-            release_recording_ids = set()
-            release_recording_titles = set()
-            for medium in release_data.get('media', []):
-                for track in medium.get('tracks', []):
-                    recording = track.get('recording', {})
-                    if recording.get('id'):
-                        release_recording_ids.add(recording['id'])
-                    if recording.get('title'):
-                        # Normalize title for comparison
-                        normalized_title = ' '.join(self._normalize_title_for_matching(recording['title']))
-                        release_recording_titles.add(normalized_title)
+            release_recording_ids, release_recording_titles = self._index_release_tracks(release_data)
             
             # Check by MBID first (most reliable)
             if recording_mbids:
@@ -2388,7 +2748,7 @@ class NotionMusicBrainzSync:
             
             # Check by title if MBIDs weren't available or as additional verification
             if recording_titles:
-                required_titles = {' '.join(self._normalize_title_for_matching(title)) for title in recording_titles}
+                required_titles = {self._normalize_title_for_matching(title) for title in recording_titles}
                 if not required_titles.issubset(release_recording_titles):
                     return False
             
@@ -2397,6 +2757,34 @@ class NotionMusicBrainzSync:
             logger.debug(f"Error checking if release contains recordings: {e}")
             return False
     
+    def _index_release_tracks(self, release_data: Dict) -> Tuple[frozenset, frozenset]:
+        """Return the recording MBIDs and normalized recording titles on a release.
+        
+        Indexed once per release. The entry remembers the media list it was built
+        from, so a search-result stub and the full release (same MBID, different
+        payload) don't share an index.
+        """
+        release_id = release_data.get('id')
+        media = release_data.get('media')
+        cached = self._release_track_index.get(release_id) if release_id else None
+        if cached and cached[0] is media:
+            return cached[1], cached[2]
+        
+        recordings = [
+            track.get('recording') or {}
+            for medium in media or ()
+            for track in medium.get('tracks', ())
+        ]
+        recording_ids = frozenset(recording['id'] for recording in recordings if recording.get('id'))
+        # Normalized word tuples compare the same as the joined words
+        recording_titles = frozenset(
+            self._normalize_title_for_matching(recording['title'])
+            for recording in recordings if recording.get('title')
+        )
+        if release_id:
+            self._release_track_index[release_id] = (media, recording_ids, recording_titles)
+        return recording_ids, recording_titles
+    
     def _merge_relations(self, page: Dict, new_properties: Dict, database_type: str) -> Dict:
         """Merge new relation properties with existing relations to preserve user-added connections.
         
@@ -2406,18 +2794,19 @@ class NotionMusicBrainzSync:
             database_type: 'artists', 'albums', or 'songs'
             
         Returns:
-            Updated properties dict with merged relations
+            new_properties, with its relation entries replaced by the merged
+            relations in place (callers rebind the result, so no copy is made)
         """
         try:
             existing_properties = page.get('properties', {})
-            merged_properties = new_properties.copy()
+            log_merges = logger.isEnabledFor(logging.DEBUG)
             
             # Get relation property IDs for this database type
             relation_property_ids = []
             if database_type == 'artists':
-                # Artists don't typically have relations to other artists/albums/songs in our schema
-                # But we should preserve any relations they might have
-                pass
+                # Artists don't typically have relations to other artists/albums/songs in our schema;
+                # any they have are preserved simply by not being in new_properties
+                return new_properties
             elif database_type == 'albums':
                 relation_property_ids = [
                     ('artist', self.albums_properties.get('artist')),
@@ -2443,36 +2832,45 @@ class NotionMusicBrainzSync:
                 # Get existing relations
                 existing_relation_prop = existing_properties.get(new_prop_key, {})
                 existing_relations = existing_relation_prop.get('relation', [])
-                existing_relation_ids = {rel.get('id') for rel in existing_relations if rel.get('id')}
                 
                 # Get new relations (if the property exists in new_properties)
                 new_relation_prop = new_properties.get(new_prop_key, {})
                 new_relations = new_relation_prop.get('relation', [])
-                new_relation_ids = {rel.get('id') for rel in new_relations if rel.get('id')}
                 
                 # If new_properties has this relation property, merge with existing
                 # If it doesn't have it, preserve existing relations by not updating
                 if new_prop_key in new_properties:
-                    # Merge: combine existing and new, avoiding duplicates
-                    merged_relation_ids = existing_relation_ids | new_relation_ids
+                    # Merge: combine existing and new, avoiding duplicates; dict keys
+                    # keep a stable order (existing first) so an unchanged
+                    # relation compares equal on the next run
+                    merged_relation_ids = dict.fromkeys(
+                        rel['id'] for rel in (*existing_relations, *new_relations) if rel.get('id')
+                    )
                     merged_relations = [{'id': rel_id} for rel_id in merged_relation_ids]
                     
                     # Always set the merged relations (even if empty, to preserve existing if new is empty)
-                    merged_properties[new_prop_key] = {'relation': merged_relations}
-                    logger.debug(f"Merged {relation_name} relations: {len(existing_relations)} existing + {len(new_relations)} new = {len(merged_relations)} total")
-                elif existing_relations:
+                    new_properties[new_prop_key] = {'relation': merged_relations}
+                    if log_merges:
+                        logger.debug(
+                            "Merged %s relations: %d existing + %d new = %d total",
+                            relation_name, len(existing_relations), len(new_relations), len(merged_relations)
+                        )
+                elif existing_relations and log_merges:
                     # If new_properties doesn't have this relation, preserve existing by not updating
                     # (existing relations will remain unchanged)
-                    logger.debug(f"Preserving existing {relation_name} relations: {len(existing_relations)} (not in new properties)")
+                    logger.debug(
+                        "Preserving existing %s relations: %d (not in new properties)",
+                        relation_name, len(existing_relations)
+                    )
             
-            return merged_properties
+            return new_properties
             
         except Exception as e:
             logger.warning(f"Error merging relations: {e}")
             # Return new properties if merge fails
             return new_properties
     
-    def _normalize_title_for_matching(self, title: str) -> List[str]:
+    def _normalize_title_for_matching(self, title: str) -> Tuple[str, ...]:
         """Normalize a title for exact word matching.
         
         Removes special characters, converts to lowercase, and splits into words.
@@ -2482,16 +2880,12 @@ class NotionMusicBrainzSync:
             title: The title to normalize
             
         Returns:
-            List of normalized words
+            Tuple of normalized words (memoized and hashable, so it can go
+            straight into a set)
         """
         if not title:
-            return []
-        
-        # Remove special characters, keep only alphanumeric and spaces
-        normalized = re.sub(r'[^a-zA-Z0-9\s]', ' ', title)
-        # Convert to lowercase and split into words
-        words = [word for word in normalized.lower().split() if word]
-        return words
+            return ()
+        return _title_words(title)
     
     def _titles_match_exactly(self, title1: str, title2: str) -> bool:
         """Check if two titles match exactly (word-for-word, case-insensitive, ignoring special chars).
@@ -2503,37 +2897,9 @@ class NotionMusicBrainzSync:
         Returns:
             True if titles match word-for-word, False otherwise
         """
-        words1 = self._normalize_title_for_matching(title1)
-        words2 = self._normalize_title_for_matching(title2)
-        return words1 == words2
-    
-    def _normalize_date(self, date_str: str) -> Optional[str]:
-        """Normalize a date string to YYYY-MM-DD format for comparison.
-        
-        Handles partial dates:
-        - YYYY -> YYYY-01-01
-        - YYYY-MM -> YYYY-MM-01
-        - YYYY-MM-DD -> YYYY-MM-DD (unchanged)
-        """
-        if not date_str or len(date_str) < 4:
-            return None
-        
-        try:
-            parts = date_str.split('-')
-            year = parts[0]
-            
-            if len(parts) == 1:
-                # Just YYYY
-                return f"{year}-01-01"
-            elif len(parts) == 2:
-                # YYYY-MM
-                month = parts[1]
-                return f"{year}-{month}-01"
-            else:
-                # YYYY-MM-DD (or more)
-                return date_str[:10]  # Take first 10 chars (YYYY-MM-DD)
-        except Exception:
-            return None
+        # Memoized per title, so repeated comparisons against the same search
+        # title don't re-normalize it
+        return _title_words(title1 or '') == _title_words(title2 or '')
     
     def sync_album_page(self, page: Dict, force_update: bool = False, spotify_url: str = None) -> Optional[bool]:
         """Sync a single album page with MusicBrainz data."""
@@ -2541,13 +2907,14 @@ class NotionMusicBrainzSync:
             page_id = page['id']
             properties = page.get('properties', {})
             
+            album_keys = self.albums_property_keys
+            
             # Extract title
-            title_prop_id = self.albums_properties.get('title')
-            if not title_prop_id:
+            if not self.albums_properties.get('title'):
                 logger.warning(f"Missing title property for Albums database")
                 return None
             
-            title_key = self._get_property_key(title_prop_id, 'albums')
+            title_key = album_keys.get('title')
             if not title_key:
                 logger.warning(f"Could not find title property key")
                 return None
@@ -2560,88 +2927,63 @@ class NotionMusicBrainzSync:
             title = title_prop['title'][0]['plain_text']
             logger.info(f"Processing album: {title}")
             
+            artist_key = album_keys.get('artist')
+            songs_key = album_keys.get('songs')
+            relation = properties.get(artist_key, {}).get('relation') if artist_key else None
+            songs_relation = properties.get(songs_key, {}).get('relation') if songs_key else None
+            
+            # Read the related artist and song pages up front in parallel; the
+            # lookups below are then served from the related-page cache
+            related_pages = [(song.get('id'), 'songs') for song in songs_relation or ()]
+            if relation:
+                related_pages.insert(0, (relation[0]['id'], 'artists'))
+            self._prefetch_related_pages(related_pages)
+            
             # Try to extract artist name and MBID from relation
             artist_name = None
             artist_mbid = None
-            artist_prop_id = self.albums_properties.get('artist')
-            if artist_prop_id:
-                artist_key = self._get_property_key(artist_prop_id, 'albums')
-                if artist_key:
-                    artist_prop = properties.get(artist_key, {})
-                    if artist_prop.get('relation'):
-                        # Get first related artist
-                        relation = artist_prop['relation']
-                        if relation:
-                            # Fetch the artist page to get the name and MBID
-                            artist_page_id = relation[0]['id']
-                            artist_page = self.notion.get_page(artist_page_id)
-                            if artist_page:
-                                artist_props = artist_page.get('properties', {})
-                                artist_title_key = self._get_property_key(self.artists_properties.get('title'), 'artists')
-                                if artist_title_key and artist_props.get(artist_title_key):
-                                    artist_title_prop = artist_props[artist_title_key]
-                                    if artist_title_prop.get('title') and artist_title_prop['title']:
-                                        artist_name = artist_title_prop['title'][0]['plain_text']
-                                        logger.debug(f"Found artist from relation: {artist_name}")
-                                
-                                # Get artist MBID for verification
-                                artist_mbid = self._get_mbid_from_related_page(artist_page_id, 'artists')
-                                if artist_mbid:
-                                    logger.debug(f"Found artist MBID from relation: {artist_mbid}")
+            if relation:
+                # Read the first related artist's name and MBID (for verification)
+                artist_name, artist_mbid = self._get_related_page_info(relation[0]['id'], 'artists')
+                if artist_name:
+                    logger.debug(f"Found artist from relation: {artist_name}")
+                if artist_mbid:
+                    logger.debug(f"Found artist MBID from relation: {artist_mbid}")
             
             # Try to extract related song MBIDs and titles from relation
             song_mbids = []
             song_titles = []
-            songs_prop_id = self.albums_properties.get('songs')
-            if songs_prop_id:
-                songs_key = self._get_property_key(songs_prop_id, 'albums')
-                if songs_key:
-                    songs_prop = properties.get(songs_key, {})
-                    if songs_prop.get('relation'):
-                        logger.info(f"Found {len(songs_prop['relation'])} related song(s) for album")
-                        # Get MBIDs and titles from all related song pages
-                        for song_relation in songs_prop['relation']:
-                            song_page_id = song_relation.get('id')
-                            if song_page_id:
-                                song_mbid = self._get_mbid_from_related_page(song_page_id, 'songs')
-                                if song_mbid:
-                                    song_mbids.append(song_mbid)
-                                    logger.debug(f"Found song MBID from relation: {song_mbid}")
-                                
-                                # Also get song title as fallback
-                                song_page = self.notion.get_page(song_page_id)
-                                if song_page:
-                                    song_props = song_page.get('properties', {})
-                                    song_title_key = self._get_property_key(self.songs_properties.get('title'), 'songs')
-                                    if song_title_key and song_props.get(song_title_key):
-                                        song_title_prop = song_props[song_title_key]
-                                        if song_title_prop.get('title') and song_title_prop['title']:
-                                            song_title = song_title_prop['title'][0]['plain_text']
-                                            song_titles.append(song_title)
-                                            logger.info(f"Found song title from relation: {song_title}")
-                                else:
-                                    logger.warning(f"Could not fetch song page {song_page_id} to get title")
+            if songs_relation:
+                logger.info(f"Found {len(songs_relation)} related song(s) for album")
+                # Get MBIDs and titles (as a fallback) from all related song pages
+                for song_relation in songs_relation:
+                    song_page_id = song_relation.get('id')
+                    if not song_page_id:
+                        continue
+                    song_title, song_mbid = self._get_related_page_info(song_page_id, 'songs')
+                    if song_mbid:
+                        song_mbids.append(song_mbid)
+                        logger.debug(f"Found song MBID from relation: {song_mbid}")
+                    if song_title:
+                        song_titles.append(song_title)
+                        logger.info(f"Found song title from relation: {song_title}")
             
             # Check for existing MBID
-            mb_id_prop_id = self.albums_properties.get('musicbrainz_id')
             existing_mbid = None
-            if mb_id_prop_id:
-                mb_id_key = self._get_property_key(mb_id_prop_id, 'albums')
-                if mb_id_key:
-                    mb_id_prop = properties.get(mb_id_key, {})
-                    # MBID is stored as rich_text (UUID string)
-                    if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
-                        existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
+            mb_id_key = album_keys.get('musicbrainz_id')
+            if mb_id_key:
+                mb_id_prop = properties.get(mb_id_key, {})
+                # MBID is stored as rich_text (UUID string)
+                if mb_id_prop.get('rich_text') and mb_id_prop['rich_text']:
+                    existing_mbid = mb_id_prop['rich_text'][0]['plain_text']
             
             # Check for Spotify URL (dual-purpose: input and output)
             spotify_url_from_notion = None
-            spotify_prop_id = self.albums_properties.get('listen')  # Spotify property
-            if spotify_prop_id:
-                spotify_key = self._get_property_key(spotify_prop_id, 'albums')
-                if spotify_key:
-                    spotify_prop = properties.get(spotify_key, {})
-                    if spotify_prop.get('url'):
-                        spotify_url_from_notion = spotify_prop['url']
+            spotify_key = album_keys.get('listen')  # Spotify property
+            if spotify_key:
+                spotify_prop = properties.get(spotify_key, {})
+                if spotify_prop.get('url'):
+                    spotify_url_from_notion = spotify_prop['url']
             
             # Determine which Spotify URL to use
             active_spotify_url = spotify_url or spotify_url_from_notion
@@ -2719,8 +3061,7 @@ class NotionMusicBrainzSync:
                         'limit': 100,  # Get up to 100 releases
                         'fmt': 'json'
                     }
-                    response = self.mb._make_api_request(url, params)
-                    data = response.json()
+                    data = self.mb._get_json(url, params) or {}
                     search_results = data.get('releases', [])
                     logger.info(f"Found {len(search_results)} releases by artist")
                 
@@ -2843,6 +3184,9 @@ class NotionMusicBrainzSync:
                 logger.warning(f"Could not get album data for: {title}")
                 return False
             
+            # Fetch cover art while the properties (and related pages) are built
+            cover_future = self.mb.prefetch_cover_art_url(release_data['id']) if release_data.get('id') else None
+            
             # Format properties
             # Skip writing Spotify URL if it was provided as input
             # Pass the Spotify URL we have so we can fetch album genres from Spotify
@@ -2870,8 +3214,8 @@ class NotionMusicBrainzSync:
             
             # Get cover art - try Cover Art Archive first, then Spotify as fallback
             cover_url = None
-            if release_data.get('id'):
-                cover_url = self.mb.get_cover_art_url(release_data['id'])
+            if cover_future:
+                cover_url = cover_future.result()
                 if not cover_url:
                     # Fallback to Spotify if Cover Art Archive doesn't have it
                     album_title = release_data.get('title', title)
@@ -3201,6 +3545,15 @@ class NotionMusicBrainzSync:
         if not database_id or not mbid or not mbid_prop_key:
             return None
         
+        mbid_map = {}
+        for database, (mbid_map_attr, _, _) in self._SCHEMA_DATABASES.items():
+            if database_id == getattr(self, f'{database}_db_id'):
+                mbid_map = getattr(self, mbid_map_attr)
+                break
+        cached_page_id = mbid_map.get(mbid)
+        if cached_page_id:
+            return cached_page_id
+        
         try:
             filter_params = {
                 'property': mbid_prop_key,
@@ -3242,7 +3595,8 @@ class NotionMusicBrainzSync:
             return None
         
         try:
-            normalized_mbid = self._normalize_mbid(artist_mbid)
+            # IDs passed here come from MusicBrainz responses, which are already canonical
+            normalized_mbid = artist_mbid
             if normalized_mbid:
                 cached_page_id = self._artist_mbid_map.get(normalized_mbid)
                 if cached_page_id:
@@ -3538,7 +3892,8 @@ class NotionMusicBrainzSync:
             return None
         
         try:
-            normalized_mbid = self._normalize_mbid(album_mbid)
+            # IDs passed here come from MusicBrainz responses, which are already canonical
+            normalized_mbid = album_mbid
             if normalized_mbid:
                 cached_page_id = self._album_mbid_map.get(normalized_mbid)
                 if cached_page_id:
@@ -3594,7 +3949,12 @@ class NotionMusicBrainzSync:
                         full_props = self._format_album_properties(album_data)
                         cover_url = self._get_album_cover_url(album_data)
                         logger.info(f"Updating existing album page with full metadata: '{album_title}'")
-                        self.notion.update_page(album_page_id, full_props, cover_url)
+                        mbid_prop_key = self._get_property_key(mbid_prop_id, 'albums')
+                        if (self.notion.update_page(album_page_id, full_props, cover_url)
+                                and mbid_prop_key in full_props):
+                            # The full update already wrote the MBID; don't PATCH it again
+                            self._register_mbid(self._album_mbid_map, album_data.get('id'), album_page_id)
+                            return album_page_id
                 if normalized_mbid:
                     self._persist_mbid_on_page(
                         'albums',
@@ -3679,7 +4039,8 @@ class NotionMusicBrainzSync:
             return None
         
         try:
-            normalized_mbid = self._normalize_mbid(label_mbid)
+            # IDs passed here come from MusicBrainz responses, which are already canonical
+            normalized_mbid = label_mbid
             if normalized_mbid:
                 cached_page_id = self._label_mbid_map.get(normalized_mbid)
                 if cached_page_id:
@@ -3816,16 +4177,23 @@ class NotionMusicBrainzSync:
             return
         
         try:
-            # Query all location pages once
-            all_pages = self.notion.query_database(self.locations_db_id)
+            # Query all location pages once (shared with the run_sync prefetch)
+            all_pages = self._get_database_pages(self.locations_db_id)
             
-            # Find the title property key
+            # Find the title property key; an empty database has no pages to
+            # inspect, so fall back to its schema
             if all_pages:
                 first_page_props = all_pages[0].get('properties', {})
                 for prop_key, prop_data in first_page_props.items():
                     if prop_data.get('type') == 'title':
                         self._locations_title_key = prop_key
                         break
+            else:
+                database = self.notion.get_database(self.locations_db_id) or {}
+                for prop_key, prop_data in database.get('properties', {}).items():
+                    if prop_data.get('type') == 'title':
+                        self._locations_title_key = prop_key
+                        break
             
             if not self._locations_title_key:
                 logger.warning("Could not find title property in Locations database")
@@ -3862,17 +4230,8 @@ class NotionMusicBrainzSync:
             if location_name_lower in self._location_cache:
                 return self._location_cache[location_name_lower]
             
-            # Location doesn't exist - create it
-            if not self._locations_title_key:
-                # Need to get title key if we don't have it
-                all_pages = self.notion.query_database(self.locations_db_id)
-                if all_pages:
-                    first_page_props = all_pages[0].get('properties', {})
-                    for prop_key, prop_data in first_page_props.items():
-                        if prop_data.get('type') == 'title':
-                            self._locations_title_key = prop_key
-                            break
-            
+            # Location doesn't exist - create it. The title key was resolved
+            # when the cache loaded; there's nothing more to learn by re-querying
             if not self._locations_title_key:
                 logger.warning("Could not find title property in Locations database")
                 return None
@@ -3913,7 +4272,8 @@ class NotionMusicBrainzSync:
             return None
         
         try:
-            normalized_mbid = self._normalize_mbid(song_mbid)
+            # IDs passed here come from MusicBrainz responses, which are already canonical
+            normalized_mbid = song_mbid
             if normalized_mbid:
                 cached_page = self._song_mbid_map.get(normalized_mbid)
                 if cached_page:
@@ -4026,6 +4386,11 @@ class NotionMusicBrainzSync:
                 if dns_key:
                     song_props[dns_key] = {'checkbox': True}
             
+            # If we have full song data, create the page with it in the same
+            # call rather than creating and then updating it
+            if song_data:
+                song_props.update(self._format_song_properties(song_data))
+            
             # Create the song page
             song_page_id = self.notion.create_page(
                 self.songs_db_id,
@@ -4036,10 +4401,6 @@ class NotionMusicBrainzSync:
             
             if song_page_id:
                 logger.info(f"Created song page: {song_title} (ID: {song_page_id})")
-                # If we have full song data, update the page with it
-                if song_data:
-                    full_props = self._format_song_properties(song_data)
-                    self.notion.update_page(song_page_id, full_props)
                 self._register_mbid(self._song_mbid_map, mbid_to_store, song_page_id)
             
             return song_page_id
@@ -4239,7 +4600,7 @@ class NotionMusicBrainzSync:
                     # and filter by title in code (more reliable)
                     if not search_results or not any(self._titles_match_exactly(title, r.get('title', '')) for r in search_results):
                         logger.info(f"No exact title matches found, searching all recordings by artist {artist_mbid}")
-                        all_artist_recordings = self.mb.get_artist_recordings(artist_mbid, limit=120)
+                        all_artist_recordings = self.mb.get_artist_recordings(artist_mbid, limit=ARTIST_RECORDINGS_INDEX_LIMIT)
                         logger.info(f"Found {len(all_artist_recordings)} total recordings by artist")
                         
                         # Filter by exact title match (including aliases)
@@ -5139,6 +5500,21 @@ class NotionMusicBrainzSync:
         
         return properties
     
+    def _prefetch_album_cover_art(self, pages: List[Dict]):
+        """Start Cover Art Archive lookups for the given album pages that already have an MBID."""
+        mbid_key = self._get_property_key(self.albums_properties.get('musicbrainz_id'), 'albums')
+        if not mbid_key:
+            return
+        mbids = {
+            self._normalize_mbid(self._extract_rich_text_plain(page.get('properties', {}).get(mbid_key)))
+            for page in pages
+        }
+        mbids.discard(None)
+        for mbid in mbids:
+            self.mb.prefetch_cover_art_url(mbid)
+        if mbids:
+            logger.debug("Prefetching cover art for %d albums", len(mbids))
+    
     def _init_results(self) -> Dict:
         """Return a fresh results dictionary."""
         return {
@@ -5752,6 +6128,7 @@ class NotionMusicBrainzSync:
         
         start_time = time.time()
         results = self._init_results()
+        self.mb.warm_connections()
         
         databases_to_sync = []
         if database == 'all':
@@ -5759,6 +6136,12 @@ class NotionMusicBrainzSync:
         else:
             databases_to_sync = [database]
         
+        prefetch_ids = [getattr(self, f'{db_name}_db_id', None) for db_name in databases_to_sync]
+        if {'artists', 'labels'} & set(databases_to_sync):
+            # Area relations resolve against the Locations database
+            prefetch_ids.append(self.locations_db_id)
+        self._prefetch_database_pages(prefetch_ids)
+        
         for db_name in databases_to_sync:
             if db_name == 'artists' and not self.artists_db_id:
                 logger.warning("Artists database ID not configured, skipping")
@@ -5783,7 +6166,11 @@ class NotionMusicBrainzSync:
             filter_params = build_created_after_filter(created_after)
             if filter_params:
                 logger.info(f"Filtering {db_name} pages created on/after {created_after}")
-            pages = self.notion.query_database(db_id, filter_params)
+            if filter_params:
+                pages = self.notion.query_database(db_id, filter_params)
+            else:
+                # The unfiltered query already ran when the MBID cache was built
+                pages = list(self._get_database_pages(db_id))
             
             if not pages:
                 logger.warning(f"No pages found in {db_name} database")
@@ -5798,12 +6185,20 @@ class NotionMusicBrainzSync:
             logger.info(f"Found {len(pages)} pages to process in {db_name}")
             results['total_pages'] += len(pages)
             
+            # Albums with an MBID are only re-synced when forced; warm their cover
+            # art a bounded window ahead of the page being processed
+            prefetch_covers = db_name == 'albums' and force_update
+            if prefetch_covers:
+                self._prefetch_album_cover_art(pages[:COVER_ART_PREFETCH_WINDOW])
+            
             successful = 0
             failed = 0
             skipped = 0
             
             # Process pages (single-threaded due to rate limiting)
             for i, page in enumerate(pages, 1):
+                if prefetch_covers and i + COVER_ART_PREFETCH_WINDOW <= len(pages):
+                    self._prefetch_album_cover_art([pages[i + COVER_ART_PREFETCH_WINDOW - 1]])
                 try:
                     result = self._process_page_by_db_name(db_name, page, force_update)
                     if result is True:
@@ -0,0 +1,31 @@
+import unittest
+from unittest import mock
+
+from shared.cache import TTLCache
+
+
+class TTLCacheTestCase(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)
+        cache["c"] = 3
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        with mock.patch("shared.cache.time.monotonic", return_value=100.0):
+            cache["a"] = None
+            self.assertIn("a", cache)
+        with mock.patch("shared.cache.time.monotonic", return_value=111.0):
+            self.assertNotIn("a", cache)
+            self.assertEqual(cache.get("a", "miss"), "miss")
+            with self.assertRaises(KeyError):
+                cache["a"]
+
+
+if __name__ == "__main__":
+    unittest.main()
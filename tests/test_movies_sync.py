@@ -0,0 +1,107 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from main import PROGRESS_LOG_INTERVAL, _build_progress_logger
+from syncs.movies.sync import NotionTMDbSync, TMDbAPI, _normalize_provider_name
+
+
+def _make_sync(pages, results):
+    """Build a NotionTMDbSync without touching the network."""
+    sync = NotionTMDbSync.__new__(NotionTMDbSync)
+    sync.database_id = "db"
+    sync.tmdb = TMDbAPI("dummy-key")
+    sync.property_mapping = {
+        "title_property_id": "title",
+        "content_type_property_id": "type",
+    }
+    sync.iter_notion_pages = lambda **_: iter(pages)
+    sync.sync_page = lambda page, *args: results[page["id"]]
+    return sync
+
+
+class ProviderNameTestCase(unittest.TestCase):
+    def test_normalize_provider_name_condenses_channels(self):
+        api = TMDbAPI("dummy-key")
+        self.assertEqual(api.normalize_provider_name("Starz Amazon Channel"), "Starz")
+        self.assertEqual(api.normalize_provider_name("Disney Plus"), "Disney+")
+        self.assertEqual(api.normalize_provider_name("hbo max"), "HBO Max")
+
+    def test_normalize_provider_name_is_cached(self):
+        _normalize_provider_name.cache_clear()
+        _normalize_provider_name("Netflix")
+        _normalize_provider_name("Netflix")
+        self.assertEqual(_normalize_provider_name.cache_info().hits, 1)
+
+
+class TMDbNotFoundTestCase(unittest.TestCase):
+    def test_not_found_details_are_not_requested_again(self):
+        api = TMDbAPI("dummy-key")
+        response = requests.Response()
+        response.status_code = 404
+        with mock.patch.object(api.session, "get", return_value=response) as get:
+            self.assertIsNone(api.get_movie_details(123))
+            self.assertIsNone(api.get_movie_details(123))
+        self.assertEqual(get.call_count, 1)
+        self.assertIn(("movie", "123"), api.not_found_ids)
+
+    def test_pool_is_only_remounted_when_its_size_changes(self):
+        api = TMDbAPI("dummy-key")
+        api.set_pool_size(8)
+        adapter = api.session.adapters["https://"]
+        api.set_pool_size(8)
+        self.assertIs(api.session.adapters["https://"], adapter)
+        with mock.patch.object(adapter, "close") as close:
+            api.set_pool_size(16)
+        close.assert_called_once_with()
+        self.assertIsNot(api.session.adapters["https://"], adapter)
+
+
+class RunSyncTestCase(unittest.TestCase):
+    def test_run_sync_tallies_streamed_pages(self):
+        results = {"a": True, "b": False, "c": None, "d": True, "e": True}
+        pages = [{"id": page_id} for page_id in results]
+        summary = _make_sync(pages, results).run_sync(max_workers=2)
+        self.assertTrue(summary["success"])
+        self.assertEqual(summary["total_pages"], 5)
+        self.assertEqual(summary["successful_updates"], 3)
+        self.assertEqual(summary["failed_updates"], 1)
+        self.assertEqual(summary["skipped_updates"], 1)
+
+    def test_run_sync_reports_progress_per_page(self):
+        results = {"a": True, "b": None, "c": False}
+        snapshots = []
+        _make_sync([{"id": page_id} for page_id in results], results).run_sync(
+            max_workers=2, progress_callback=snapshots.append
+        )
+        self.assertEqual(sorted(snap["completed"] for snap in snapshots), [1, 2, 3])
+        self.assertEqual(snapshots[-1]["successful_updates"] + snapshots[-1]["failed_updates"]
+                         + snapshots[-1]["skipped_updates"], snapshots[-1]["completed"])
+
+    def test_progress_is_logged_before_pagination_finishes(self):
+        results = {f"p{i}": True for i in range(PROGRESS_LOG_INTERVAL * 3)}
+        logger = mock.Mock()
+        _make_sync([{"id": page_id} for page_id in results], results).run_sync(
+            max_workers=1, progress_callback=_build_progress_logger(logger)
+        )
+        messages = [call.args[0] for call in logger.info.call_args_list]
+        self.assertIn("found so far", messages[0])
+        self.assertEqual(logger.info.call_args_list[0].args[1], PROGRESS_LOG_INTERVAL)
+        self.assertEqual(logger.info.call_args_list[-1].args[1], len(results))
+
+    def test_single_page_results(self):
+        failed = NotionTMDbSync._single_page_results(False, 0.5)
+        self.assertFalse(failed["success"])
+        self.assertEqual(failed["failed_updates"], 1)
+        skipped = NotionTMDbSync._single_page_results(None, 0.5)
+        self.assertTrue(skipped["success"])
+        self.assertEqual(skipped["skipped_updates"], 1)
+
+    def test_run_sync_without_pages_fails(self):
+        summary = _make_sync([], {}).run_sync(max_workers=2)
+        self.assertFalse(summary["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,618 @@
+import json
+import os
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from syncs.music.property_config import (
+    ALBUMS_ARTIST_PROPERTY_ID,
+    ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID,
+    ALBUMS_SONGS_PROPERTY_ID,
+    ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID,
+    ARTISTS_TITLE_PROPERTY_ID,
+    SONGS_MUSICBRAINZ_ID_PROPERTY_ID,
+)
+from syncs.music.sync import (
+    ARTIST_RECORDINGS_INDEX_LIMIT,
+    COVER_ART_TIMEOUT,
+    MusicBrainzAPI,
+    NotionMusicBrainzSync,
+    _build_recording_query,
+    _classify_artist_link,
+    _decode_json,
+    _mb_escape,
+    _title_words,
+)
+
+
+MBID = "f27ec8db-af05-4f36-916e-3d57f91ecf5e"
+
+
+def _json_response(payload, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def _token_response(token="abc", expires_in=3600):
+    return _json_response({"access_token": token, "expires_in": expires_in})
+
+
+def _spotify_responder(token=None, *responses):
+    """Return (side_effect, calls) serving the token for POSTs and responses in order for GETs."""
+    token = token or _token_response()
+    pending = list(responses)
+    calls = {"POST": 0, "GET": 0}
+
+    def request(method, url, **kwargs):
+        calls[method] += 1
+        return token if method == "POST" else pending.pop(0)
+
+    return request, calls
+
+
+@mock.patch.dict(os.environ, {"SPOTIFY_CLIENT_ID": "id", "SPOTIFY_CLIENT_SECRET": "secret"})
+class SpotifyTokenTestCase(unittest.TestCase):
+    def test_token_is_reused_until_expiry(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        request, calls = _spotify_responder()
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            self.assertEqual(api._get_spotify_access_token(), "abc")
+            self.assertEqual(api._get_spotify_access_token(), "abc")
+        self.assertEqual(calls["POST"], 1)
+
+    def test_token_is_refreshed_near_expiry(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        request, calls = _spotify_responder(_token_response(expires_in=10))
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            api._get_spotify_access_token()
+            api._get_spotify_access_token()
+        self.assertEqual(calls["POST"], 2)
+
+    def test_concurrent_callers_share_one_token_request(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        request, calls = _spotify_responder()
+        start = threading.Barrier(8)
+
+        def fetch():
+            start.wait(1)
+            return api._get_spotify_access_token()
+
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            threads = [threading.Thread(target=fetch) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(calls["POST"], 1)
+
+    def test_album_url_and_image_share_one_search(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        search = _json_response({"albums": {"items": [{
+            "external_urls": {"spotify": "https://open.spotify.com/album/x"},
+            "images": [{"url": "https://i.scdn.co/image/x"}],
+        }]}})
+        request, calls = _spotify_responder(None, search)
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            self.assertEqual(api._get_spotify_album_url("Album", "Artist"), "https://open.spotify.com/album/x")
+            self.assertEqual(api._get_spotify_album_image("album", "artist"), "https://i.scdn.co/image/x")
+        self.assertEqual(calls["GET"], 1)
+
+    def test_unknown_spotify_id_is_not_requested_again(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        request, calls = _spotify_responder(None, _json_response({}, status=404))
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            self.assertIsNone(api._get_spotify_track_by_id("missing"))
+            self.assertIsNone(api._get_spotify_track_by_id("missing"))
+        self.assertEqual(calls["GET"], 1)
+
+    def test_track_without_artists_is_returned(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        request, _ = _spotify_responder(None, _json_response({"id": "t1", "name": "Track", "artists": []}))
+        with mock.patch.object(api.spotify_session, "request", side_effect=request):
+            self.assertEqual(api._get_spotify_track_by_id("t1")["name"], "Track")
+
+    def test_rate_limited_request_waits_for_retry_after(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        throttled = _json_response({}, status=429)
+        throttled.headers["Retry-After"] = "2"
+        artist = _json_response({"id": "a1", "name": "Artist"})
+        request, calls = _spotify_responder(None, throttled, artist)
+        with mock.patch.object(api.spotify_session, "request", side_effect=request), \
+                mock.patch("syncs.music.sync.time.sleep") as sleep:
+            self.assertEqual(api._get_spotify_artist_by_id("a1")["name"], "Artist")
+        self.assertEqual(calls["GET"], 2)
+        self.assertGreaterEqual(sleep.call_args[0][0], 2)
+
+    def test_batch_lookup_fills_the_id_cache(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        batch = _json_response({"artists": [{"id": "a1", "name": "One"}, None]})
+        request, calls = _spotify_responder(None, batch)
+        with mock.patch.object(api.spotify_session, "request", side_effect=request) as spotify:
+            artists = api._get_spotify_artists_batch(["a1", "a2", "a1"])
+            self.assertEqual(api._get_spotify_artist_by_id("a1")["name"], "One")
+            self.assertIsNone(api._get_spotify_artist_by_id("a2"))
+        self.assertEqual(artists, {"a1": {"id": "a1", "name": "One"}, "a2": None})
+        self.assertEqual(calls["GET"], 1)
+        self.assertEqual(spotify.call_args.kwargs["params"], {"ids": "a1,a2"})
+
+
+class NegativeCacheTestCase(unittest.TestCase):
+    def test_missing_artist_is_not_requested_again(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        not_found = requests.Response()
+        not_found.status_code = 404
+        with mock.patch.object(api.session, "get", return_value=not_found) as get, \
+                mock.patch.object(api, "_rate_limit"):
+            self.assertIsNone(api.get_artist(MBID))
+            self.assertIsNone(api.get_artist(MBID))
+        self.assertEqual(get.call_count, 1)
+
+    def test_cached_recording_skips_the_rate_limiter(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        recording = _json_response({"id": MBID, "title": "Song"})
+        with mock.patch.object(api.session, "get", return_value=recording), \
+                mock.patch.object(api, "_rate_limit") as rate_limit:
+            api.get_recording(MBID)
+            api.get_recording(MBID)
+        self.assertEqual(rate_limit.call_count, 1)
+
+    def test_empty_barcode_search_is_cached(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        empty = _json_response({"releases": []})
+        with mock.patch.object(api.session, "get", return_value=empty) as get, \
+                mock.patch.object(api, "_rate_limit"):
+            self.assertIsNone(api.search_release_by_barcode("0000"))
+            self.assertIsNone(api.search_release_by_barcode("0000"))
+        self.assertEqual(get.call_count, 1)
+
+
+class CoverArtTestCase(unittest.TestCase):
+    def _head_response(self, status, location=None):
+        response = requests.Response()
+        response.status_code = status
+        if location:
+            response.headers["Location"] = location
+        return response
+
+    def test_front_redirect_location_is_used(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        redirect = self._head_response(307, "https://archive.org/download/mbid/front.jpg")
+        with mock.patch.object(api.session, "head", return_value=redirect) as head:
+            self.assertEqual(api.get_cover_art_url(MBID), "https://archive.org/download/mbid/front.jpg")
+        head.assert_called_once_with(
+            f"https://coverartarchive.org/release/{MBID}/front", allow_redirects=False, timeout=COVER_ART_TIMEOUT
+        )
+
+    def test_prefetch_shares_in_flight_lookup(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        release = threading.Event()
+
+        def slow_lookup(mbid):
+            release.wait(1)
+            return "https://archive.org/front.jpg"
+
+        with mock.patch.object(api, "get_cover_art_url", side_effect=slow_lookup) as lookup:
+            first = api.prefetch_cover_art_url("mbid")
+            second = api.prefetch_cover_art_url("mbid")
+            release.set()
+            self.assertIs(first, second)
+            self.assertEqual(first.result(), "https://archive.org/front.jpg")
+        self.assertEqual(lookup.call_count, 1)
+
+    def test_release_lookup_does_not_queue_behind_cover_prefetch(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        release = threading.Event()
+
+        def slow_lookup(mbid):
+            release.wait(5)
+
+        try:
+            with mock.patch.object(api, "get_cover_art_url", side_effect=slow_lookup), \
+                    mock.patch.object(api, "get_release", return_value={"id": MBID}):
+                for index in range(500):
+                    api.prefetch_cover_art_url(f"mbid-{index}")
+                future = api._aux_executor.submit(api.get_release, MBID)
+                self.assertEqual(future.result(timeout=1), {"id": MBID})
+        finally:
+            release.set()
+
+    def test_missing_front_cover_is_cached(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        with mock.patch.object(api.session, "head", return_value=self._head_response(404)) as head:
+            self.assertIsNone(api.get_cover_art_url(MBID))
+            self.assertIsNone(api.get_cover_art_url(MBID))
+        self.assertEqual(head.call_count, 1)
+
+
+class ReleaseGroupBrowseTestCase(unittest.TestCase):
+    OTHER_MBID = "11111111-2222-3333-4444-555555555555"
+
+    def _api(self, release_count, releases):
+        api = MusicBrainzAPI("test-agent/1.0")
+        pages = {
+            "release-group": {
+                "release-groups": [{"id": MBID, "title": "Album"}, {"id": self.OTHER_MBID, "title": "Other"}],
+                "release-group-count": 2,
+            },
+            "release": {"releases": releases, "release-count": release_count},
+        }
+
+        def fake_get_json(url, params=None, headers=None, rate_limited=True):
+            endpoint = url.rsplit("/", 1)[1]
+            return pages.get(endpoint, {"id": endpoint, "releases": []})
+
+        return api, mock.patch.object(api, "_get_json", side_effect=fake_get_json)
+
+    def test_release_groups_are_primed_on_first_lookup(self):
+        releases = [
+            {"id": "r1", "release-group": {"id": MBID}},
+            {"id": "r2", "release-group": {"id": self.OTHER_MBID}},
+        ]
+        api, patch = self._api(2, releases)
+        with patch as request:
+            self.assertEqual(len(api.get_artist_release_groups("artist")), 2)
+            self.assertEqual(request.call_count, 1)
+            group = api.get_release_group(MBID)
+            other = api.get_release_group(self.OTHER_MBID)
+        self.assertEqual([r["id"] for r in group["releases"]], ["r1"])
+        self.assertEqual([r["id"] for r in other["releases"]], ["r2"])
+        self.assertEqual(request.call_count, 2)
+
+    def test_large_catalog_stops_after_first_browse_page(self):
+        releases = [{"id": f"r{i}", "release-group": {"id": MBID}} for i in range(100)]
+        api, patch = self._api(5000, releases)
+        with patch as request:
+            api.get_artist_release_groups("artist")
+            api.get_release_group(MBID)
+            api.get_release_group(self.OTHER_MBID)
+        endpoints = [call.args[0].rsplit("/", 1)[1] for call in request.call_args_list]
+        self.assertEqual(endpoints, ["release-group", "release", MBID, self.OTHER_MBID])
+
+
+class QueryEscapingTestCase(unittest.TestCase):
+    def test_special_characters_are_escaped(self):
+        self.assertEqual(_mb_escape('Say "Hi"'), '"Say \\"Hi\\""')
+        self.assertEqual(_mb_escape("AC/DC", quote=False), "AC\\/DC")
+
+    def test_recording_query_uses_partial_title_with_artist_mbid(self):
+        self.assertEqual(
+            _build_recording_query("Song (Live)", artist_mbid="abc"),
+            "recording:Song \\(Live\\) AND arid:abc",
+        )
+
+    def test_title_words_match_for_ascii_and_unicode_titles(self):
+        self.assertEqual(_title_words("Don't\tStop (Live)"), ("don", "t", "stop", "live"))
+        self.assertEqual(_title_words("Café del Mar"), ("caf", "del", "mar"))
+
+
+class ArtistRecordingIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.api = MusicBrainzAPI("test-agent/1.0")
+        self.index = {"recordings": [
+            {"id": "r1", "title": "Lovely", "releases": [{"title": "Album (Deluxe)"}]},
+            {"id": "r2", "title": "新世界", "aliases": [{"name": "New Genesis"}], "releases": []},
+        ], "count": 2}
+        self.search = {"recordings": [{"id": "r3", "title": "Love"}]}
+
+    def fake_get_json(self, url, params=None, headers=None, rate_limited=True):
+        return self.index if params["query"] == "arid:artist" else self.search
+
+    def test_search_does_not_build_the_index(self):
+        with mock.patch.object(self.api, "_get_json", side_effect=self.fake_get_json) as request:
+            self.assertEqual([r["id"] for r in self.api.search_recordings("New Genesis", artist_mbid="artist")], ["r3"])
+        self.assertEqual(request.call_count, 1)
+
+    def test_exact_title_or_alias_in_cached_index_skips_the_search(self):
+        with mock.patch.object(self.api, "_get_json", side_effect=self.fake_get_json) as request:
+            self.api.get_artist_recordings("artist", limit=ARTIST_RECORDINGS_INDEX_LIMIT)
+            alias = self.api.search_recordings("new genesis", artist_mbid="artist")
+            album = self.api.search_recordings("Lovely", album="Album", artist_mbid="artist")
+            partial = self.api.search_recordings("Love", artist_mbid="artist")
+        self.assertEqual([r["id"] for r in alias], ["r2"])
+        self.assertEqual([r["id"] for r in album], ["r1"])
+        # "Love" is only a substring of "Lovely", so the real search runs
+        self.assertEqual([r["id"] for r in partial], ["r3"])
+        self.assertEqual(request.call_count, 2)
+
+
+class IdentifierValidationTestCase(unittest.TestCase):
+    def test_malformed_ids_skip_the_request(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        with mock.patch.object(api, "_get_json") as get_json:
+            self.assertIsNone(api.get_release("not-an-mbid"))
+            self.assertIsNone(api.search_recording_by_isrc("bogus"))
+            self.assertIsNone(api.get_release(f" {MBID}\n"))
+        get_json.assert_not_called()
+
+    def test_spotify_urls_and_uris_are_parsed(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        self.assertEqual(
+            api._parse_spotify_url("https://open.spotify.com/album/4aawyAB9vmqN3uQ7FjRGTy?si=x"),
+            {"type": "album", "id": "4aawyAB9vmqN3uQ7FjRGTy"},
+        )
+        self.assertEqual(api._parse_spotify_url("spotify:track:6rqhFgbb"), {"type": "track", "id": "6rqhFgbb"})
+        self.assertIsNone(api._parse_spotify_url("https://bandcamp.com/album/x"))
+
+    def test_spotify_artist_id_is_taken_from_first_matching_relation(self):
+        api = MusicBrainzAPI("test-agent/1.0")
+        artist = {"relations": [
+            {"url": {"resource": "https://www.discogs.com/artist/1"}},
+            {"url": None},
+            {"url": {"resource": "https://OPEN.SPOTIFY.COM/artist/0OdUWJ0sBjDrqHygGUXeCF?si=x"}},
+            {"url": {"resource": "spotify:artist:other"}},
+        ]}
+        self.assertEqual(api._extract_spotify_artist_id(artist), "0OdUWJ0sBjDrqHygGUXeCF")
+
+
+class MbidCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.sync = NotionMusicBrainzSync("token", "test-agent/1.0", artists_db_id="artists-db", albums_db_id="albums-db")
+        schema = {"properties": {"Album ID": {"id": ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID}}}
+        page = {"id": "page-1", "properties": {"Album ID": {"rich_text": [{"plain_text": MBID}]}}}
+        self.get_database = mock.patch.object(self.sync.notion, "get_database", return_value=schema).start()
+        self.query = mock.patch.object(self.sync.notion, "query_database", return_value=[page]).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_schemas_load_on_first_use(self):
+        self.get_database.assert_not_called()
+        self.assertEqual(self.sync._get_property_key(ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID, "albums"), "Album ID")
+        self.sync._get_property_key(ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID, "albums")
+        self.get_database.assert_called_once_with("albums-db")
+
+    def test_existing_page_lookup_uses_startup_mbid_cache(self):
+        self.assertEqual(self.sync._find_existing_page_by_mbid("albums-db", MBID, "Album ID"), "page-1")
+        # Only the unfiltered query that built the cache reached Notion
+        self.query.assert_called_once_with("albums-db")
+
+    def test_related_page_mbid_comes_from_database_query(self):
+        with mock.patch.object(self.sync.notion, "get_page") as get_page:
+            self.assertEqual(self.sync._get_mbid_from_related_page("page-1", "albums"), MBID)
+        get_page.assert_not_called()
+
+    def test_prefetched_pages_are_reused(self):
+        self.sync._prefetch_database_pages(["artists-db", "albums-db", None])
+        self.sync._get_database_pages("albums-db")
+        self.assertEqual(sorted(c.args[0] for c in self.query.call_args_list), ["albums-db", "artists-db"])
+
+
+class RelatedPageTestCase(unittest.TestCase):
+    def test_related_page_is_read_once_per_run(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0", artists_db_id="artists-db")
+        schema = {"properties": {
+            "Name": {"id": "title"},
+            "Artist ID": {"id": ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID},
+        }}
+        page = {"id": "artist-1", "properties": {
+            "Name": {"title": [{"plain_text": "Artist"}]},
+            "Artist ID": {"rich_text": [{"plain_text": MBID}]},
+        }}
+        with mock.patch.object(sync.notion, "get_database", return_value=schema), \
+                mock.patch.object(sync.notion, "query_database", return_value=[]), \
+                mock.patch.object(sync.notion, "get_page", return_value=page) as get_page:
+            self.assertEqual(sync.artists_property_keys["musicbrainz_id"], "Artist ID")
+            self.assertEqual(sync._get_related_page_info("artist-1", "artists"), ("Artist", MBID))
+            self.assertEqual(sync._get_related_page_info("artist-1", "artists"), ("Artist", MBID))
+        get_page.assert_called_once_with("artist-1")
+
+    def test_album_sync_reads_each_related_page_once(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0", artists_db_id="artists-db",
+                                     albums_db_id="albums-db", songs_db_id="songs-db")
+        schemas = {
+            "albums-db": {"properties": {
+                "Name": {"id": "title"},
+                "Album ID": {"id": ALBUMS_MUSICBRAINZ_ID_PROPERTY_ID},
+                "Artist": {"id": ALBUMS_ARTIST_PROPERTY_ID},
+                "Songs": {"id": ALBUMS_SONGS_PROPERTY_ID},
+            }},
+            "artists-db": {"properties": {"Name": {"id": "title"}, "Artist ID": {"id": ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID}}},
+            "songs-db": {"properties": {"Name": {"id": "title"}, "Song ID": {"id": SONGS_MUSICBRAINZ_ID_PROPERTY_ID}}},
+        }
+        related = {
+            "artist-1": {"id": "artist-1", "properties": {"Name": {"title": [{"plain_text": "Artist"}]}}},
+            "song-1": {"id": "song-1", "properties": {"Name": {"title": [{"plain_text": "One"}]}}},
+            "song-2": {"id": "song-2", "properties": {"Name": {"title": [{"plain_text": "Two"}]}}},
+        }
+        release = {"id": MBID, "media": [{"tracks": [
+            {"recording": {"id": "r1", "title": "One"}},
+            {"recording": {"id": "r2", "title": "Two"}},
+        ]}]}
+
+        def album(page_id, song_ids):
+            return {"id": page_id, "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "Album"}]},
+                "Album ID": {"rich_text": [{"plain_text": MBID}]},
+                "Artist": {"relation": [{"id": "artist-1"}]},
+                "Songs": {"relation": [{"id": song_id} for song_id in song_ids]},
+            }}
+
+        with mock.patch.object(sync.notion, "get_database", side_effect=schemas.get), \
+                mock.patch.object(sync.notion, "query_database", return_value=[]), \
+                mock.patch.object(sync.notion, "get_page", side_effect=related.get) as get_page, \
+                mock.patch.object(sync.mb, "get_release", return_value=release), \
+                mock.patch.object(sync, "_prefetch_related_pages", wraps=sync._prefetch_related_pages) as prefetch:
+            self.assertIsNone(sync.sync_album_page(album("album-1", ["song-1", "song-2"])))
+            self.assertIsNone(sync.sync_album_page(album("album-2", ["song-2"])))
+        self.assertEqual(sorted(c.args[0] for c in get_page.call_args_list), ["artist-1", "song-1", "song-2"])
+        self.assertEqual(prefetch.call_count, 2)
+        self.assertEqual(prefetch.call_args_list[0].args[0],
+                         [("artist-1", "artists"), ("song-1", "songs"), ("song-2", "songs")])
+
+    def test_related_pages_are_prefetched_together(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        pages = {page_id: {"id": page_id, "properties": {}} for page_id in ("a1", "s1", "s2")}
+        with mock.patch.object(NotionMusicBrainzSync, "artists_property_keys", {}), \
+                mock.patch.object(NotionMusicBrainzSync, "songs_property_keys", {}), \
+                mock.patch.object(sync.notion, "get_page", side_effect=pages.get) as get_page:
+            sync._prefetch_related_pages([("a1", "artists"), ("s1", "songs"), ("s2", "songs"), ("s1", "songs")])
+            self.assertEqual(sync._get_related_page_info("s2", "songs"), (None, None))
+        self.assertEqual(sorted(c.args[0] for c in get_page.call_args_list), ["a1", "s1", "s2"])
+
+
+class LocationCacheTestCase(unittest.TestCase):
+    def test_empty_locations_database_is_queried_once(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        sync.locations_db_id = "locations-db"
+        schema = {"properties": {"Name": {"id": "title", "type": "title"}}}
+        with mock.patch.object(sync.notion, "query_database", return_value=[]) as query, \
+                mock.patch.object(sync.notion, "get_database", return_value=schema), \
+                mock.patch.object(sync.notion, "create_page", return_value="loc-1") as create:
+            self.assertEqual(sync._find_or_create_location_page("Berlin"), "loc-1")
+            self.assertEqual(sync._find_or_create_location_page("berlin"), "loc-1")
+        query.assert_called_once_with("locations-db")
+        create.assert_called_once()
+        self.assertIn("Name", create.call_args.args[1])
+
+
+class MergeRelationsTestCase(unittest.TestCase):
+    def test_relations_are_merged_in_place_existing_first(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        page = {"properties": {"Artist": {"relation": [{"id": "a"}, {"id": "b"}]}}}
+        new_properties = {"Artist": {"relation": [{"id": "b"}, {"id": "c"}]}, "Title": {}}
+        with mock.patch.object(NotionMusicBrainzSync, "albums_properties", {"artist": "p1"}), \
+                mock.patch.object(sync, "_get_property_key", return_value="Artist"):
+            merged = sync._merge_relations(page, new_properties, "albums")
+        self.assertIs(merged, new_properties)
+        self.assertEqual(merged["Artist"], {"relation": [{"id": "a"}, {"id": "b"}, {"id": "c"}]})
+
+
+class ArtistSkipTestCase(unittest.TestCase):
+    def test_page_with_mbid_is_skipped_without_lookups(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0", artists_db_id="artists-db")
+        schema = {"properties": {"Artist ID": {"id": ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID}}}
+        page = {"id": "page-1", "properties": {"Artist ID": {"rich_text": [{"plain_text": MBID}]}}}
+        with mock.patch.object(sync.notion, "get_database", return_value=schema), \
+                mock.patch.object(sync.notion, "query_database", return_value=[]), \
+                mock.patch.object(sync.mb, "get_artist") as get_artist:
+            self.assertIsNone(sync.sync_artist_page(page))
+        get_artist.assert_not_called()
+
+    def test_malformed_mbid_falls_back_to_name_search(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0", artists_db_id="artists-db")
+        schema = {"properties": {
+            "Name": {"id": ARTISTS_TITLE_PROPERTY_ID},
+            "Artist ID": {"id": ARTISTS_MUSICBRAINZ_ID_PROPERTY_ID},
+        }}
+        page = {"id": "page-1", "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": "Artist"}]},
+            "Artist ID": {"rich_text": [{"plain_text": f" {MBID}"}]},
+        }}
+        with mock.patch.object(sync.notion, "get_database", return_value=schema), \
+                mock.patch.object(sync.notion, "query_database", return_value=[]), \
+                mock.patch.object(sync.mb, "_get_json") as get_json, \
+                mock.patch.object(sync.mb, "search_artists", return_value=[]) as search_artists:
+            self.assertFalse(sync.sync_artist_page(page))
+        search_artists.assert_called_once_with("Artist", limit=5)
+        get_json.assert_not_called()
+
+
+class ReleaseCandidateTestCase(unittest.TestCase):
+    def test_candidates_are_yielded_in_order_with_one_lookahead(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        releases = [
+            {"id": f"r{i}", "status": "Official", "release-group": {"primary-type": "Album"}}
+            for i in range(4)
+        ]
+        with mock.patch.object(sync, "_score_release_for_song", side_effect=lambda r: (-int(r["id"][1]), "")), \
+                mock.patch.object(sync.mb, "get_release", side_effect=lambda mbid: {"id": mbid}) as get_release:
+            candidates = sync._iter_release_candidates(releases)
+            self.assertEqual(next(candidates)["id"], "r0")
+            self.assertEqual(next(candidates)["id"], "r1")
+            candidates.close()
+        self.assertLessEqual(get_release.call_count, 3)
+
+    def test_release_group_walk_fetches_only_eligible_groups(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        groups = [
+            {"id": "g0", "primary-type": "Single"},
+            {"id": "g1", "primary-type": "Album", "secondary-types": ["Live"]},
+            {"id": "g2", "primary-type": "Album"},
+            {"id": "g3", "primary-type": "Album"},
+        ]
+        group_data = {"releases": [{"id": "r"}]}
+        with mock.patch.object(sync.mb, "get_artist_release_groups", return_value=groups), \
+                mock.patch.object(sync.mb, "get_release_group", return_value=group_data) as get_group, \
+                mock.patch.object(sync, "_iter_release_candidates", return_value=iter([{"id": "r"}])), \
+                mock.patch.object(sync, "_match_track_in_release", return_value={"recording": {}}):
+            match = sync._find_release_via_release_groups("Song", MBID)
+        self.assertIs(match["release_group"], group_data)
+        fetched = [call.args[0] for call in get_group.call_args_list]
+        self.assertEqual(fetched[0], "g2")
+        self.assertTrue(set(fetched) <= {"g2", "g3"})
+
+    def test_release_contains_recordings_by_normalized_title(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        release = {"media": [{"tracks": [
+            {"recording": {"id": "a", "title": "Don't Stop (Remastered)"}},
+            {"recording": {"id": "b", "title": "Intro"}},
+        ]}]}
+        self.assertTrue(sync._release_contains_recordings(release, ["a"], ["don t stop remastered"]))
+        self.assertFalse(sync._release_contains_recordings(release, [], ["Outro"]))
+        self.assertFalse(sync._release_contains_recordings(release, ["c"]))
+
+    def test_recording_artist_is_checked_against_search_credits(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        credited = {"id": "r1", "artist-credit": [{"name": " & "}, {"artist": {"id": MBID}}]}
+        other = {"id": "r2", "artist-credit": [{"artist": {"id": "someone-else"}}]}
+        with mock.patch.object(sync.mb, "get_recording") as get_recording:
+            self.assertTrue(sync._recording_is_by_artist(credited, MBID))
+            self.assertFalse(sync._recording_is_by_artist(other, MBID))
+        get_recording.assert_not_called()
+
+    def test_recording_without_credits_is_fetched(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        full = {"id": "r1", "artist-credit": [{"artist": {"id": MBID}}]}
+        with mock.patch.object(sync.mb, "get_recording", return_value=full) as get_recording:
+            self.assertTrue(sync._recording_is_by_artist({"id": "r1"}, MBID))
+        get_recording.assert_called_once_with("r1")
+
+    def test_release_track_index_is_reused_per_payload(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        stub = {"id": MBID}
+        full = {"id": MBID, "media": [{"tracks": [{"recording": {"id": "a", "title": "Song"}}]}]}
+        self.assertFalse(sync._release_contains_recordings(stub, ["a"]))
+        self.assertTrue(sync._release_contains_recordings(full, ["a"]))
+        with mock.patch.object(sync, "_normalize_title_for_matching", wraps=sync._normalize_title_for_matching) as normalize:
+            self.assertTrue(sync._release_contains_recordings(full, ["a"], ["song"]))
+        self.assertEqual(normalize.call_count, 1)  # only the required title
+
+
+class ArtistReleaseDatesTestCase(unittest.TestCase):
+    def test_release_dates_are_fetched_once_per_artist(self):
+        sync = NotionMusicBrainzSync("token", "test-agent/1.0")
+        releases = {"releases": [{"date": "1999"}, {"date": "2004-05-06"}, {}]}
+        with mock.patch.object(sync.mb, "_get_json", return_value=releases) as get_json:
+            first = sync._get_artist_release_dates(MBID)
+            second = sync._get_artist_release_dates(MBID)
+        self.assertEqual(first, ("1999-01-01", "2004-05-06"))
+        self.assertIs(first, second)
+        self.assertEqual(get_json.call_count, 1)
+
+
+class ArtistLinkTestCase(unittest.TestCase):
+    def test_links_are_classified_by_relation_type_and_host(self):
+        cases = [
+            ("official homepage", "https://example.com", "website"),
+            ("social network", "https://www.instagram.com/artist", "ig"),
+            ("social network", "https://twitter.com/artist", None),
+            ("youtube", "https://www.youtube.com/@artist", "youtube"),
+            ("streaming", "https://music.youtube.com/channel/x", None),
+            ("bandcamp", "https://artist.bandcamp.com/", "bandcamp"),
+            ("free streaming", "https://open.spotify.com/artist/x", "spotify"),
+        ]
+        for relation_type, url, expected in cases:
+            with self.subTest(url=url):
+                self.assertEqual(_classify_artist_link(relation_type, url), expected)
+
+
+class DecodeJsonTestCase(unittest.TestCase):
+    def test_falls_back_to_stdlib_without_orjson(self):
+        with mock.patch("syncs.music.sync.orjson", None):
+            self.assertEqual(_decode_json(_json_response({"ok": True})), {"ok": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
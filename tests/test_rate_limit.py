@@ -0,0 +1,25 @@
+import unittest
+
+from shared.rate_limit import TokenBucket
+
+
+class TokenBucketTestCase(unittest.TestCase):
+    def test_burst_up_to_capacity_then_empty(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertGreater(bucket.acquire(), 0.0)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 import os
 import unittest
+from unittest import mock
 
 import router
-from main import _resolve_target_name
+from main import _build_progress_logger, _resolve_target_name
 
 
 class RouterTests(unittest.TestCase):
@@ -109,6 +110,14 @@ class MainHelpersTests(unittest.TestCase):
         resolved = _resolve_target_name(None, None, targets)
         self.assertEqual(resolved, "music")
 
+    def test_progress_logger_logs_each_decile_once(self):
+        logger = mock.Mock()
+        log_progress = _build_progress_logger(logger)
+        log_progress({"completed": 1, "total": None})
+        for completed in range(1, 21):
+            log_progress({"completed": completed, "total": 20})
+        self.assertEqual(logger.info.call_count, 10)
+
 
 if __name__ == "__main__":
     unittest.main()